@@ -6,18 +6,24 @@ from pathlib import Path
 import pytask
 from pytask_latex import compilation_steps as cs
 
-from econ_spec_jel.config import BLD, DOCUMENTS, ROOT
+from econ_spec_jel.config import BLD, DOCUMENTS, FIGURE_FORMATS, ROOT
 
 figures = [
-    "fig_counts_dp_jel_codes.png",
-    "fig_author_trends.png",
-    "fig_dp_counts.png",
-    "fig_top5overall_jel.png",
-    "fig_top3yearly_jel.png",
-    "fig_topic_trends.png",
+    "fig_counts_dp_jel_codes",
+    "fig_author_trends",
+    "fig_dp_counts",
+    "fig_top5overall_jel",
+    "fig_top3yearly_jel",
+    "fig_topic_trends",
 ]
 DOCUMENTS_KWARGS = {
-    "paper": {"depends_on": [BLD / "figures" / figure for figure in figures]},
+    "paper": {
+        "depends_on": [
+            BLD / "figures" / f"{figure}.{format_}"
+            for figure in figures
+            for format_ in FIGURE_FORMATS
+        ]
+    },
     "presentation": {"depends_on": None},
 }
 
@@ -0,0 +1,88 @@
+"""Helper functions for associating LDA topics with JEL codes."""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from econ_spec_jel.analysis.incidence_helper import row_group_indicator
+
+
+def topic_association(
+    documents_topics: np.ndarray,
+    incidence: sparse.csr_array,
+    categories: pd.Index,
+    groups: pd.Series | None = None,
+) -> pd.DataFrame:
+    """Associate the topics with the categories (e.g. JEL codes) of the documents.
+
+    For each category and topic, ``mass`` is the summed topic probability over the
+    papers with the category and ``share`` the expected topic probability of such
+    a paper. ``lift`` relates ``share`` to the topic's share among all papers, and
+    ``pmi`` is the pointwise mutual information, i.e. the log of ``lift``.
+
+    All groups (e.g. periods) are computed with a single product of the documents x
+    topics matrix with an incidence matrix whose columns are (group, category)
+    pairs.
+
+    Args:
+        documents_topics (np.ndarray): Documents x topics matrix of probabilities.
+        incidence (sparse.csr_array): Binary documents x categories matrix.
+        categories (pd.Index): Labels of the incidence columns.
+        groups (pd.Series | None): Group of each document. Measures are computed
+            within each group, relative to the papers of the group.
+
+    Returns
+    -------
+        pd.DataFrame: One row per category and topic (and period, if ``groups`` is
+        given) with papers of the category, mass, share, lift and pmi. Categories
+        without papers in a period are dropped.
+    """
+    pooled = groups is None
+    document_group = (
+        pd.Series(np.zeros(incidence.shape[0], dtype=np.int64))
+        if groups is None
+        else groups.reset_index(drop=True)
+    )
+    group_indicator, group_labels = row_group_indicator(document_group)
+    document_groups = group_labels.get_indexer(document_group)
+    n_groups, n_categories = len(group_labels), incidence.shape[1]
+
+    coo = incidence.tocoo()
+    grouped_incidence = sparse.csr_array(
+        (coo.data, (coo.row, document_groups[coo.row] * n_categories + coo.col)),
+        shape=(incidence.shape[0], n_groups * n_categories),
+    )
+    documents_topics = np.asarray(documents_topics, dtype=np.float64)
+    mass = (grouped_incidence.T @ documents_topics).reshape(n_groups, n_categories, -1)
+    papers = grouped_incidence.sum(axis=0).reshape(n_groups, n_categories)
+    group_topic_share = (group_indicator @ documents_topics) / group_indicator.sum(
+        axis=1
+    )[:, None]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = mass / papers[:, :, None]
+        lift = share / group_topic_share[:, None, :]
+        pmi = np.log(lift)
+
+    n_topics = documents_topics.shape[1]
+    group_index, category_index = np.nonzero(papers)
+    out = pd.DataFrame(
+        {
+            "period": np.repeat(group_labels[group_index], n_topics),
+            "jel_code": pd.Categorical.from_codes(
+                np.repeat(category_index, n_topics), categories
+            ),
+            "topic_number": np.tile(np.arange(n_topics), len(group_index)),
+            "papers": np.repeat(
+                papers[group_index, category_index].astype(np.int64), n_topics
+            ),
+        }
+    )
+    for name, values in {
+        "mass": mass,
+        "share": share,
+        "lift": lift,
+        "pmi": pmi,
+    }.items():
+        out[name] = values[group_index, category_index].ravel().astype(np.float32)
+    return out.drop(columns="period") if pooled else out
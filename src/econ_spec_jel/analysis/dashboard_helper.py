@@ -0,0 +1,104 @@
+"""Helper functions for building a self-contained interactive HTML dashboard."""
+
+import html
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script type="text/javascript">{plotlyjs}</script>
+<style>
+body {{ font-family: sans-serif; margin: 2em auto; max-width: 1300px; }}
+section {{ margin-bottom: 3em; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{sections}
+</body>
+</html>
+"""
+
+
+def downsample_figure(fig: go.Figure, max_points: int) -> go.Figure:
+    """Limit the number of points of each trace of a figure.
+
+    Traces with more than ``max_points`` points are thinned: bar traces keep their
+    first ``max_points`` bars (the plotted counts are sorted in descending order),
+    all other traces keep evenly spaced points including the first and the last.
+
+    Args:
+        fig (go.Figure): The figure.
+        max_points (int): Maximum number of points per trace.
+
+    Returns
+    -------
+        go.Figure: A copy of the figure with thinned traces.
+    """
+    out = go.Figure(fig)
+    for trace in out.data:
+        if trace.x is None or len(trace.x) <= max_points:
+            continue
+        if trace.type == "bar":
+            keep = np.arange(max_points)
+        else:
+            keep = np.unique(np.linspace(0, len(trace.x) - 1, max_points).round())
+            keep = keep.astype(np.int64)
+        trace.x = np.asarray(trace.x)[keep]
+        if trace.y is not None:
+            trace.y = np.asarray(trace.y)[keep]
+    return out
+
+
+def build_dashboard(
+    figures: dict[str, go.Figure],
+    title: str,
+    max_points: int,
+    max_bytes: int,
+) -> str:
+    """Combine figures into one self-contained HTML page.
+
+    plotly.js is embedded once in the page head and shared by all figures, so the
+    page works offline. ``max_bytes`` limits the figures, not plotly.js itself.
+
+    Args:
+        figures (dict[str, go.Figure]): Figures by section heading.
+        title (str): Title of the page.
+        max_points (int): Maximum number of points per trace.
+        max_bytes (int): Maximum size of the figures in the page.
+
+    Returns
+    -------
+        str: The HTML page.
+
+    Raises
+    ------
+        ValueError: If the figures exceed ``max_bytes``.
+    """
+    sections, sizes = [], {}
+    for heading, fig in figures.items():
+        div = downsample_figure(fig, max_points).to_html(
+            full_html=False, include_plotlyjs=False, config={"responsive": True}
+        )
+        sizes[heading] = len(div.encode())
+        sections.append(
+            f"<section>\n<h2>{html.escape(heading)}</h2>\n{div}\n</section>"
+        )
+
+    if sum(sizes.values()) > max_bytes:
+        sizes_text = ", ".join(
+            f"{heading}: {size:,}" for heading, size in sizes.items()
+        )
+        msg = (
+            f"Expected the dashboard figures to have at most {max_bytes:,} bytes, "
+            f"got {sum(sizes.values()):,} bytes ({sizes_text})."
+        )
+        raise ValueError(msg)
+    return DASHBOARD_TEMPLATE.format(
+        title=html.escape(title), plotlyjs=get_plotlyjs(), sections="\n".join(sections)
+    )
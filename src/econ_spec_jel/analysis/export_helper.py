@@ -0,0 +1,40 @@
+"""Helper functions for exporting plotly figures with a single Kaleido renderer."""
+
+from pathlib import Path
+
+import plotly
+import plotly.graph_objects as go
+from kaleido.scopes.plotly import PlotlyScope
+
+PLOTLYJS = Path(plotly.__file__).parent / "package_data" / "plotly.min.js"
+
+# Kaleido starts its renderer on the first export and shuts it down when the scope
+# is garbage collected, so all exports of a process share one renderer.
+SCOPE = PlotlyScope(plotlyjs=str(PLOTLYJS), mathjax=False)
+
+
+def export_figures(
+    figures: dict[str, go.Figure], produces: dict[str, dict[str, Path]]
+) -> None:
+    """Write all figures in all formats with the shared Kaleido renderer.
+
+    The module-level scope uses the plotly.js bundled with plotly (and no MathJax)
+    and is reused for every figure and format, and by every task of the process.
+
+    Args:
+        figures (dict[str, go.Figure]): Figures by name.
+        produces (dict[str, dict[str, Path]]): Path of each figure per image format
+            (e.g. png, svg or pdf).
+    """
+    for name, fig in figures.items():
+        fig_dict = fig.to_dict()
+        for format_, path in produces[name].items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(
+                SCOPE.transform(
+                    fig_dict,
+                    format=format_,
+                    width=fig.layout.width,
+                    height=fig.layout.height,
+                )
+            )
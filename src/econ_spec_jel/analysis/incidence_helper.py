@@ -0,0 +1,81 @@
+"""Helper functions for building sparse incidence matrices from list columns."""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def build_incidence_matrix(
+    sr: pd.Series, categories: pd.Index | None = None, *, binary: bool = False
+) -> tuple[sparse.csr_array, pd.Index]:
+    """Build a sparse row x category incidence matrix from a list-valued series.
+
+    Args:
+        sr (pd.Series): Series with a list of categories (e.g. JEL codes) per row.
+        categories (pd.Index | None): Column labels of the matrix. Entries not
+            contained in ``categories`` are dropped. Defaults to all sorted entries.
+        binary (bool): Whether repeated entries within a row count only once.
+
+    Returns
+    -------
+        tuple[sparse.csr_array, pd.Index]: Incidence matrix with one row per entry of
+        ``sr`` (in order) and the column labels.
+    """
+    exploded = sr.reset_index(drop=True).explode().dropna()
+    rows = exploded.index.to_numpy(dtype=np.int64)
+    if categories is None:
+        columns, categories = pd.factorize(exploded.to_numpy(), sort=True)
+        categories = pd.Index(categories)
+    else:
+        columns = categories.get_indexer(exploded.to_numpy())
+        rows, columns = rows[columns >= 0], columns[columns >= 0]
+
+    incidence = sparse.csr_array(
+        (np.ones(len(rows), dtype=np.float64), (rows, columns)),
+        shape=(len(sr), len(categories)),
+    )
+    incidence.sum_duplicates()
+    if binary:
+        incidence.data[:] = 1
+    return incidence, categories
+
+
+def aggregate_columns(
+    incidence: sparse.csr_array, labels: pd.Index, mapper: pd.Series | pd.Index
+) -> tuple[sparse.csr_array, pd.Index]:
+    """Sum the columns of an incidence matrix into coarser groups.
+
+    Args:
+        incidence (sparse.csr_array): Row x category incidence matrix.
+        labels (pd.Index): Column labels of ``incidence``.
+        mapper (pd.Series | pd.Index): Group label of each column, aligned with
+            ``labels``.
+
+    Returns
+    -------
+        tuple[sparse.csr_array, pd.Index]: Row x group matrix and the group labels.
+    """
+    groups, group_labels = pd.factorize(np.asarray(mapper), sort=True)
+    indicator = sparse.csr_array(
+        (np.ones(len(labels)), (np.arange(len(labels)), groups)),
+        shape=(len(labels), len(group_labels)),
+    )
+    return sparse.csr_array(incidence @ indicator), pd.Index(group_labels)
+
+
+def row_group_indicator(groups: pd.Series) -> tuple[sparse.csr_array, pd.Index]:
+    """Build a group x row indicator matrix for aggregating rows by group.
+
+    Args:
+        groups (pd.Series): Group label per row (e.g. publication year).
+
+    Returns
+    -------
+        tuple[sparse.csr_array, pd.Index]: Indicator matrix and sorted group labels.
+    """
+    codes, group_labels = pd.factorize(groups.to_numpy(), sort=True)
+    indicator = sparse.csr_array(
+        (np.ones(len(codes)), (codes, np.arange(len(codes)))),
+        shape=(len(group_labels), len(codes)),
+    )
+    return indicator, pd.Index(group_labels)
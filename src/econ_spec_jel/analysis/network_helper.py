@@ -0,0 +1,256 @@
+"""Helper functions for building co-authorship and JEL co-occurrence networks."""
+
+from collections.abc import Iterator
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
+
+# Columns of the rolling window statistics, also for data shorter than one window.
+WINDOW_STATISTICS_DTYPES = {
+    "window_start": "M8[ns]",
+    "window_end": "M8[ns]",
+    "papers": "int64",
+    "nodes": "int64",
+    "edges": "int64",
+    "total_weight": "float64",
+    "density": "float64",
+    "mean_degree": "float64",
+    "components": "int64",
+    "largest_component_share": "float64",
+}
+
+
+def cooccurrence_matrix(incidence: sparse.csr_array) -> sparse.csr_array:
+    """Compute the weighted co-occurrence adjacency matrix of the incidence columns.
+
+    The weight of an edge is the number of rows (discussion papers) both columns
+    (authors or JEL codes) occur in, obtained from one sparse product instead of
+    enumerating pairs.
+
+    Args:
+        incidence (sparse.csr_array): Binary paper x node incidence matrix.
+
+    Returns
+    -------
+        sparse.csr_array: Symmetric node x node adjacency matrix without self-loops.
+    """
+    adjacency = sparse.csr_array(incidence.T @ incidence)
+    adjacency.setdiag(0)
+    adjacency.eliminate_zeros()
+    return adjacency
+
+
+def window_adjacencies(
+    incidence: sparse.csr_array, windows: pd.Series
+) -> Iterator[tuple[object, np.ndarray, sparse.csr_array]]:
+    """Build the co-occurrence network of each time window one window at a time.
+
+    Args:
+        incidence (sparse.csr_array): Binary paper x node incidence matrix.
+        windows (pd.Series): Window label of each paper.
+
+    Yields
+    ------
+        tuple[object, np.ndarray, sparse.csr_array]: Window label, indices of the
+        nodes active in the window and the adjacency matrix among these nodes.
+    """
+    window_codes, window_labels = pd.factorize(windows.to_numpy(), sort=True)
+    order = np.argsort(window_codes, kind="stable")
+    bounds = np.searchsorted(window_codes[order], np.arange(len(window_labels) + 1))
+    for i, label in enumerate(window_labels):
+        window_incidence = incidence[order[bounds[i] : bounds[i + 1]]]
+        active_nodes = np.flatnonzero(window_incidence.sum(axis=0))
+        adjacency = cooccurrence_matrix(window_incidence[:, active_nodes])
+        yield label, active_nodes, adjacency
+
+
+def detect_communities(
+    adjacency: sparse.csr_array, seed: int = 1234
+) -> tuple[np.ndarray, float]:
+    """Detect communities in a weighted network with the Louvain method.
+
+    Args:
+        adjacency (sparse.csr_array): Symmetric weighted adjacency matrix.
+        seed (int): Random seed of the Louvain method.
+
+    Returns
+    -------
+        tuple[np.ndarray, float]: Community of each node, numbered by decreasing
+        community size, and the modularity of the partition (NaN without edges).
+    """
+    graph = nx.from_scipy_sparse_array(adjacency, edge_attribute="weight")
+    if graph.number_of_edges() == 0:
+        return np.arange(adjacency.shape[0]), np.nan
+
+    communities = sorted(
+        nx.community.louvain_communities(graph, weight="weight", seed=seed),
+        key=len,
+        reverse=True,
+    )
+    membership = np.empty(adjacency.shape[0], dtype=np.int64)
+    for number, community in enumerate(communities):
+        membership[list(community)] = number
+    return membership, nx.community.modularity(graph, communities, weight="weight")
+
+
+def network_communities(
+    incidence: sparse.csr_array,
+    nodes: pd.Index,
+    windows: pd.Series,
+    seed: int = 1234,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Detect the communities of the co-occurrence network of each time window.
+
+    Args:
+        incidence (sparse.csr_array): Binary paper x node incidence matrix.
+        nodes (pd.Index): Node labels of the incidence columns.
+        windows (pd.Series): Window label of each paper.
+        seed (int): Random seed of the Louvain method.
+
+    Returns
+    -------
+        tuple[pd.DataFrame, pd.DataFrame]: Community of each active node per window
+        and the network size and modularity per window.
+    """
+    communities = []
+    modularity = []
+    for window, active_nodes, adjacency in window_adjacencies(incidence, windows):
+        membership, window_modularity = detect_communities(adjacency, seed=seed)
+        communities.append(
+            pd.DataFrame(
+                {
+                    "window": window,
+                    "node": nodes[active_nodes],
+                    "community": membership,
+                }
+            )
+        )
+        modularity.append(
+            {
+                "window": window,
+                "nodes": len(active_nodes),
+                "edges": adjacency.nnz // 2,
+                "total_weight": adjacency.sum() / 2,
+                "communities": len(np.unique(membership)),
+                "modularity": window_modularity,
+            }
+        )
+    return pd.concat(communities, ignore_index=True), pd.DataFrame(modularity)
+
+
+def network_statistics(
+    adjacency: sparse.csr_array, activity: np.ndarray
+) -> dict[str, float]:
+    """Compute summary statistics of a network directly from its adjacency matrix.
+
+    Args:
+        adjacency (sparse.csr_array): Symmetric weighted adjacency matrix.
+        activity (np.ndarray): Number of papers of each node, nodes without papers
+            are not part of the network.
+
+    Returns
+    -------
+        dict[str, float]: Number of nodes and edges, total edge weight, density,
+        mean degree, number of connected components and the share of nodes in the
+        largest connected component.
+    """
+    active = activity > 0
+    nodes = int(active.sum())
+    edges = adjacency.nnz // 2
+    _, components = csgraph.connected_components(adjacency, directed=False)
+    component_sizes = np.bincount(components[active]) if nodes else np.zeros(1)
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "total_weight": adjacency.sum() / 2,
+        "density": 2 * edges / (nodes * (nodes - 1)) if nodes > 1 else np.nan,
+        "mean_degree": 2 * edges / nodes if nodes else np.nan,
+        "components": int((component_sizes > 0).sum()),
+        "largest_component_share": component_sizes.max() / nodes if nodes else np.nan,
+    }
+
+
+def rolling_window_statistics(
+    incidence: sparse.csr_array,
+    months: pd.Series,
+    window_months: int = 36,
+    step_months: int = 1,
+) -> pd.DataFrame:
+    """Compute network statistics for sliding windows of publication months.
+
+    Instead of rebuilding every window from scratch, the adjacency matrix of the
+    current window is updated by adding the edges of the entering month and
+    subtracting the edges of the leaving month. Only the monthly edge blocks inside
+    the current window are kept in memory.
+
+    Args:
+        incidence (sparse.csr_array): Binary paper x node incidence matrix.
+        months (pd.Series): Publication month of each paper.
+        window_months (int): Length of each window in months.
+        step_months (int): Number of months between the starts of two windows.
+
+    Returns
+    -------
+        pd.DataFrame: Network statistics per window, see
+        :func:`network_statistics`, with the first and last month of each window
+        and its number of papers. Empty if the data span less than one window.
+    """
+    month_number = months.to_numpy().astype("M8[M]").astype(np.int64)
+    first_month, last_month = month_number.min(), month_number.max()
+    order = np.argsort(month_number, kind="stable")
+    bounds = np.searchsorted(
+        month_number[order], np.arange(first_month, last_month + 2)
+    )
+
+    n_nodes = incidence.shape[1]
+    adjacency = sparse.csr_array((n_nodes, n_nodes))
+    activity = np.zeros(n_nodes)
+    papers = 0
+    blocks = {}
+    statistics = []
+    for month in range(first_month, last_month + 1):
+        rows = order[bounds[month - first_month] : bounds[month - first_month + 1]]
+        month_incidence = incidence[rows]
+        blocks[month] = (
+            cooccurrence_matrix(month_incidence),
+            month_incidence.sum(axis=0),
+            len(rows),
+        )
+        adjacency, activity, papers = _update_window(
+            (adjacency, activity, papers), blocks[month], sign=1
+        )
+        if month - window_months in blocks:
+            adjacency, activity, papers = _update_window(
+                (adjacency, activity, papers),
+                blocks.pop(month - window_months),
+                sign=-1,
+            )
+
+        window_start = month - window_months + 1
+        is_full_window = window_start >= first_month
+        if is_full_window and not (window_start - first_month) % step_months:
+            statistics.append(
+                {
+                    "window_start": np.datetime64(window_start, "M"),
+                    "window_end": np.datetime64(month, "M"),
+                    "papers": papers,
+                }
+                | network_statistics(adjacency, activity)
+            )
+
+    return pd.DataFrame(statistics, columns=list(WINDOW_STATISTICS_DTYPES)).astype(
+        WINDOW_STATISTICS_DTYPES
+    )
+
+
+def _update_window(
+    window: tuple[sparse.csr_array, np.ndarray, int],
+    block: tuple[sparse.csr_array, np.ndarray, int],
+    sign: int,
+) -> tuple[sparse.csr_array, np.ndarray, int]:
+    adjacency = sparse.csr_array(window[0] + sign * block[0])
+    adjacency.eliminate_zeros()
+    return adjacency, window[1] + sign * block[1], window[2] + sign * block[2]
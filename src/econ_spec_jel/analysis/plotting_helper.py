@@ -1,47 +1,56 @@
 """Helper functions for plotting the analysis results."""
 
-from pathlib import Path
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import plotly.io as pio
+import seaborn as sns
 from plotly.subplots import make_subplots
 
+from econ_spec_jel.analysis.incidence_helper import (
+    build_incidence_matrix,
+    row_group_indicator,
+)
 
-def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
-    """Plot the trends of the average number of authors per discussion paper.
+
+def monthly_statistics(data: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate the analysis data per publication month for the monthly plots.
 
     Args:
         data (pd.DataFrame): The analysis data.
-        produces (Path): The path to save the plot.
+
+    Returns
+    -------
+        pd.DataFrame: One row per month with the number of discussion papers
+        (pub_count), the mean of each numeric metric and the 6-month rolling means
+        of all of these (suffix ``_smooth``).
     """
-    author_avg = _create_avg_and_smoothed_data(
-        data=data,
-        grouping="publication_year_month",
-        relevant_metric="authors_count",
-        avg_name="avg_authors_per_pub",
-    )
+    metrics = data.select_dtypes("number").columns.drop("dp_number", errors="ignore")
+    grouped = data.groupby("publication_year_month")
+    out = grouped[list(metrics)].mean()
+    out.insert(0, "pub_count", grouped.size())
+    smooth = out.rolling(6, center=False).mean().add_suffix("_smooth")
+    return pd.concat([out, smooth], axis=1).reset_index()
 
-    new_authors = _create_avg_and_smoothed_data(
-        data=data,
-        grouping="publication_year_month",
-        relevant_metric="authors_new",
-        avg_name="new_authors",
-    )
-    returning_authors = _create_avg_and_smoothed_data(
-        data=data,
-        grouping="publication_year_month",
-        relevant_metric="authors_returning",
-        avg_name="returning_authors",
-    )
 
-    smooth_indices = author_avg.index[::6]
+def plot_author_trends(monthly_statistics: pd.DataFrame) -> go.Figure:
+    """Plot the trends of the average number of authors per discussion paper.
+
+    Args:
+        monthly_statistics (pd.DataFrame): The monthly statistics of the analysis
+            data.
+
+    Returns
+    -------
+        go.Figure: The plot.
+    """
+    smooth_indices = monthly_statistics.index[::6]
 
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=author_avg["publication_year_month"],
-            y=author_avg["avg_authors_per_pub"],
+            x=monthly_statistics["publication_year_month"],
+            y=monthly_statistics["authors_count"],
             mode="lines",
             name="Avg. Authors per Discussion Paper (monthly)",
             line={"color": "green", "width": 1, "dash": "dot"},
@@ -50,8 +59,8 @@ def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
     )
     fig.add_trace(
         go.Scatter(
-            x=author_avg.loc[smooth_indices, "publication_year_month"],
-            y=author_avg.loc[smooth_indices, "avg_authors_per_pub_smooth"],
+            x=monthly_statistics.loc[smooth_indices, "publication_year_month"],
+            y=monthly_statistics.loc[smooth_indices, "authors_count_smooth"],
             mode="lines+markers",
             name="Avg. Authors per Discussion Paper (6-month avg.)",
             line={"color": "green", "width": 2},
@@ -59,8 +68,8 @@ def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
     )
     fig.add_trace(
         go.Scatter(
-            x=new_authors["publication_year_month"],
-            y=new_authors["new_authors"],
+            x=monthly_statistics["publication_year_month"],
+            y=monthly_statistics["authors_new"],
             mode="lines",
             name="Avg. New Authors per Discussion Paper (monthly)",
             line={"color": "red", "width": 1, "dash": "dot"},
@@ -69,8 +78,8 @@ def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
     )
     fig.add_trace(
         go.Scatter(
-            x=new_authors.loc[smooth_indices, "publication_year_month"],
-            y=new_authors.loc[smooth_indices, "new_authors_smooth"],
+            x=monthly_statistics.loc[smooth_indices, "publication_year_month"],
+            y=monthly_statistics.loc[smooth_indices, "authors_new_smooth"],
             mode="lines+markers",
             name="Avg. New Authors per Discussion Paper (6-month avg.)",
             line={"color": "red", "width": 2},
@@ -78,8 +87,8 @@ def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
     )
     fig.add_trace(
         go.Scatter(
-            x=returning_authors["publication_year_month"],
-            y=returning_authors["returning_authors"],
+            x=monthly_statistics["publication_year_month"],
+            y=monthly_statistics["authors_returning"],
             mode="lines",
             name="Avg. Returning Authors per Discussion Paper (monthly)",
             line={"color": "blue", "width": 1, "dash": "dot"},
@@ -88,8 +97,8 @@ def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
     )
     fig.add_trace(
         go.Scatter(
-            x=returning_authors.loc[smooth_indices, "publication_year_month"],
-            y=returning_authors.loc[smooth_indices, "returning_authors_smooth"],
+            x=monthly_statistics.loc[smooth_indices, "publication_year_month"],
+            y=monthly_statistics.loc[smooth_indices, "authors_returning_smooth"],
             mode="lines+markers",
             name="Avg. Returning Authors per Discussion Paper (6-month avg.)",
             line={"color": "blue", "width": 2},
@@ -101,7 +110,7 @@ def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
         xaxis={
             "title": "Year-Month",
             "tickmode": "array",
-            "tickvals": author_avg["publication_year_month"][::12],
+            "tickvals": monthly_statistics["publication_year_month"][::12],
             "tickformat": "%Y",
         },
         yaxis={"title": "Number of Authors"},
@@ -110,40 +119,28 @@ def plot_author_trends(data: pd.DataFrame, produces: Path) -> None:
         width=3 * 300,
         height=2 * 300,
     )
-    pio.write_image(fig, file=produces)
+    return fig
 
 
-def plot_monthly_trends(data: pd.DataFrame, produces: Path) -> None:
+def plot_monthly_trends(monthly_statistics: pd.DataFrame) -> go.Figure:
     """Plot the monthly trends of discussion papers and the average JEL codes per paper.
 
     Args:
-        data (pd.DataFrame): The analysis data.
-        produces (Path): The path to save the plot.
-    """
-    jel_avg = _create_avg_and_smoothed_data(
-        data=data,
-        grouping="publication_year_month",
-        relevant_metric="jel_codes_count",
-        avg_name="avg_jel_per_pub",
-    )
-
-    pub_counts = (
-        data.groupby("publication_year_month").size().reset_index(name="pub_count")
-    )
-    pub_counts["pub_count_smooth"] = (
-        pub_counts["pub_count"].rolling(6, center=False).mean()
-    )
-
-    plot_data = pub_counts.merge(jel_avg, on="publication_year_month")
+        monthly_statistics (pd.DataFrame): The monthly statistics of the analysis
+            data.
 
-    smooth_indices = plot_data.index[::6]
+    Returns
+    -------
+        go.Figure: The plot.
+    """
+    smooth_indices = monthly_statistics.index[::6]
 
     fig = go.Figure()
     # Monthly publication count line
     fig.add_trace(
         go.Scatter(
-            x=plot_data["publication_year_month"],
-            y=plot_data["pub_count"],
+            x=monthly_statistics["publication_year_month"],
+            y=monthly_statistics["pub_count"],
             mode="lines",
             name="Number of Discussion Papers (monthly)",
             line={"color": "blue", "width": 1, "dash": "dot"},
@@ -153,8 +150,8 @@ def plot_monthly_trends(data: pd.DataFrame, produces: Path) -> None:
     # Smoothed publication count line
     fig.add_trace(
         go.Scatter(
-            x=plot_data.loc[smooth_indices, "publication_year_month"],
-            y=plot_data.loc[smooth_indices, "pub_count_smooth"],
+            x=monthly_statistics.loc[smooth_indices, "publication_year_month"],
+            y=monthly_statistics.loc[smooth_indices, "pub_count_smooth"],
             mode="lines+markers",
             name="Number of Discussion Papers (6-month avg.)",
             line={"color": "blue", "width": 2},
@@ -164,8 +161,8 @@ def plot_monthly_trends(data: pd.DataFrame, produces: Path) -> None:
     # Monthly avg. JEL codes line
     fig.add_trace(
         go.Scatter(
-            x=plot_data["publication_year_month"],
-            y=plot_data["avg_jel_per_pub"],
+            x=monthly_statistics["publication_year_month"],
+            y=monthly_statistics["jel_codes_count"],
             mode="lines",
             name="Avg. JEL Codes per Discussion Paper (monthly)",
             line={"color": "red", "width": 1, "dash": "dot"},
@@ -176,8 +173,8 @@ def plot_monthly_trends(data: pd.DataFrame, produces: Path) -> None:
     # Smoothed avg. JEL codes line
     fig.add_trace(
         go.Scatter(
-            x=plot_data.loc[smooth_indices, "publication_year_month"],
-            y=plot_data.loc[smooth_indices, "avg_jel_per_pub_smooth"],
+            x=monthly_statistics.loc[smooth_indices, "publication_year_month"],
+            y=monthly_statistics.loc[smooth_indices, "jel_codes_count_smooth"],
             mode="lines+markers",
             name="Avg. JEL Codes per Discussion Paper (6-month avg.)",
             line={"color": "red", "width": 2},
@@ -190,7 +187,7 @@ def plot_monthly_trends(data: pd.DataFrame, produces: Path) -> None:
         xaxis={
             "title": "Year-Month",
             "tickmode": "array",
-            "tickvals": plot_data["publication_year_month"][::12],
+            "tickvals": monthly_statistics["publication_year_month"][::12],
             "tickformat": "%Y",
         },
         yaxis={"title": "Number of Discussion Papers", "color": "blue"},
@@ -205,15 +202,18 @@ def plot_monthly_trends(data: pd.DataFrame, produces: Path) -> None:
         width=3 * 300,
         height=2 * 300,
     )
-    pio.write_image(fig, file=produces)
+    return fig
 
 
-def plot_dp_counts(data: pd.DataFrame, produces: Path) -> None:
+def plot_dp_counts(data: pd.DataFrame) -> go.Figure:
     """Plot the number of discussion papers per author and JEL code.
 
     Args:
         data (pd.DataFrame): The analysis data.
-        produces (Path): The path to save the plot.
+
+    Returns
+    -------
+        go.Figure: The plot.
     """
     author_counts = _calculate_author_counts(data)
     jel_counts = _calculate_jel_counts(data)
@@ -262,18 +262,19 @@ def plot_dp_counts(data: pd.DataFrame, produces: Path) -> None:
         height=2 * 300,
     )
 
-    pio.write_image(fig, file=produces)
+    return fig
 
 
-def plot_most_common_jel_codes(
-    data: pd.DataFrame, produces: Path, number_of_codes: int
-) -> None:
+def plot_most_common_jel_codes(data: pd.DataFrame, number_of_codes: int) -> go.Figure:
     """Plot the overall most common JEL codes.
 
     Args:
         data (pd.DataFrame): The analysis data.
-        produces (Path): The path to save the plot.
         number_of_codes (int): The number of most common JEL codes to plot.
+
+    Returns
+    -------
+        go.Figure: The plot.
     """
     most_common_codes = _get_most_common_codes(data=data, number=number_of_codes)
 
@@ -294,14 +295,11 @@ def plot_most_common_jel_codes(
         .reset_index(name="total_publications")
     )
 
-    for code in most_common_codes:
-        data_with_code = data[data.jel_codes.apply(lambda x, code=code: code in x)]
-        data_with_code[f"{code}_count"] = data_with_code.jel_codes.apply(
-            lambda x, code=code: x.count(code)
-        )
+    monthly_counts = _get_monthly_code_counts(data=data, jel_codes=most_common_codes)
 
+    for code in most_common_codes:
         jel_counts = _get_normalized_counts(
-            data=data_with_code, total_counts=total_counts, jel_code=code
+            monthly_counts=monthly_counts, total_counts=total_counts, jel_code=code
         )
 
         smooth_indices = jel_counts.index[::6]
@@ -345,18 +343,21 @@ def plot_most_common_jel_codes(
         width=3 * 300,
         height=2 * 300,
     )
-    pio.write_image(fig, file=produces)
+    return fig
 
 
 def plot_yearly_most_common_jel_codes(
-    data: pd.DataFrame, produces: Path, number_of_codes: int
-) -> None:
+    data: pd.DataFrame, number_of_codes: int
+) -> go.Figure:
     """Plot the per year most common JEL codes.
 
     Args:
         data (pd.DataFrame): The analysis data.
-        produces (Path): The path to save the plot.
         number_of_codes (int): The number of most common JEL codes to plot.
+
+    Returns
+    -------
+        go.Figure: The plot.
     """
     yearly_most_common_codes = _get_yearly_most_common_codes(
         data=data, number_of_codes=number_of_codes
@@ -375,38 +376,24 @@ def plot_yearly_most_common_jel_codes(
     }
 
     fig = go.Figure()
-    for code in jel_codes:
-        # Filter Data for the JEL Code
-        code_data = merged[merged["jel_codes"] == code]
-
-        # Add Invisible Marker for Full Opacity Legend Entry
-        fig.add_trace(
-            go.Scatter(
-                x=[None],
-                y=[None],
-                mode="lines+markers",
-                name=code,
-                marker={"color": _hex_to_rgba(color_map[code], alpha=1.0)},
-                showlegend=True,
+    common_codes_data = merged[merged["jel_codes"].isin(jel_codes)]
+    for code, code_data in common_codes_data.groupby("jel_codes", sort=True):
+        # A segment is opaque if the code is among the most common at its start;
+        # all segments of one opacity form a single trace split by None.
+        is_common = code_data["is_common"].to_numpy()[:-1] == 1
+        for alpha, segments in ((1.0, is_common), (0.1, ~is_common)):
+            x, y = _get_line_segments(
+                code_data["year"], code_data["normalized_count"], segments
             )
-        )
-
-        # Split the line into segments to simulate dynamic opacity
-        for i in range(len(code_data) - 1):
-            base_color = color_map[code]
-            if code_data["is_common"].iloc[i] == 1:
-                color = _hex_to_rgba(base_color, alpha=1.0)
-            else:
-                color = _hex_to_rgba(base_color, alpha=0.1)
-
-            # Plot Segment
             fig.add_trace(
                 go.Scatter(
-                    x=code_data["year"].iloc[i : i + 2],
-                    y=code_data["normalized_count"].iloc[i : i + 2],
+                    x=x,
+                    y=y,
                     mode="lines+markers",
-                    line={"width": 2, "color": color},
-                    showlegend=False,
+                    name=code,
+                    legendgroup=code,
+                    line={"width": 2, "color": _hex_to_rgba(color_map[code], alpha)},
+                    showlegend=alpha == 1.0,
                 )
             )
 
@@ -430,17 +417,138 @@ def plot_yearly_most_common_jel_codes(
         width=3 * 300,
         height=2 * 300,
     )
-    pio.write_image(fig, file=produces)
+    return fig
+
+
+def plot_topic_trends(
+    plotting_data: pd.DataFrame,
+    slopes: pd.DataFrame,
+    topic_prevalence: pd.DataFrame,
+) -> go.Figure:
+    """Plot the monthly prevalence of the topics with the steepest trends.
+
+    Args:
+        plotting_data (pd.DataFrame): The documents of the plotted topics.
+        slopes (pd.DataFrame): The topic slopes, sorted in descending order.
+        topic_prevalence (pd.DataFrame): The monthly prevalence of each topic.
+
+    Returns
+    -------
+        go.Figure: The plot.
+    """
+    top_up = slopes.head(5)["topic_number"].tolist()
+    top_down = slopes.tail(5)["topic_number"].tolist()
+
+    top_topics = top_up + top_down
+
+    palette = sns.color_palette("husl", 5)
+    colors = [
+        f"rgba({int(r*255)}, {int(g*255)}, {int(b*255)}, 1)" for r, g, b in palette
+    ]
+
+    fig = make_subplots(
+        rows=5,
+        cols=2,
+        subplot_titles=[
+            str(
+                plotting_data.loc[
+                    plotting_data["topic_number"] == topic, "topic_words_8"
+                ].iloc[0]
+            )
+            for topic in top_topics
+        ],
+        shared_xaxes="columns",
+        shared_yaxes="all",
+        vertical_spacing=0.05,
+        horizontal_spacing=0.05,
+    )
+
+    for _i, (trend, topic_numbers) in enumerate(
+        zip(["Upward", "Downward"], [top_up, top_down], strict=False)
+    ):
+        col = 1 if trend == "Upward" else 2
+        for j, topic_number in enumerate(topic_numbers):
+            row = j + 1
+            monthly = topic_prevalence[
+                topic_prevalence["topic_number"] == topic_number
+            ].reset_index(drop=True)
+            smooth_indices = monthly.index[::6]
+
+            fig.add_trace(
+                go.Scatter(
+                    x=monthly["publication_year_month"],
+                    y=monthly["topic_present_sum"],
+                    mode="lines",
+                    line={"color": colors[j], "width": 1, "dash": "dot"},
+                    opacity=0.3,
+                    name=f"Topic {topic_number} (Monthly)",
+                ),
+                row=row,
+                col=col,
+            )
+
+            fig.add_trace(
+                go.Scatter(
+                    x=monthly.loc[smooth_indices, "publication_year_month"],
+                    y=monthly.loc[smooth_indices, "topic_present_sum"],
+                    mode="lines+markers",
+                    line={"color": colors[j], "width": 2},
+                    name=f"Topic {topic_number} (6-month avg.)",
+                ),
+                row=row,
+                col=col,
+            )
+            fig.update_yaxes(
+                title_text="Topic Presence", showticklabels=True, row=row, col=1
+            )
+            fig.update_yaxes(showticklabels=False, row=row, col=2)
+
+    fig.update_layout(
+        template="plotly_white",
+        width=1200,
+        height=900,
+        showlegend=False,
+    )
+    fig.update_xaxes(tickformat="%Y")
+
+    return fig
+
+
+def _get_line_segments(
+    x: pd.Series, y: pd.Series, segments: np.ndarray
+) -> tuple[list, list]:
+    starts = np.flatnonzero(segments)
+    if not len(starts):
+        return [None], [None]
+    x_segments = np.full((len(starts), 3), None, dtype=object)
+    y_segments = np.full((len(starts), 3), None, dtype=object)
+    x_segments[:, 0], x_segments[:, 1] = x.to_numpy()[starts], x.to_numpy()[starts + 1]
+    y_segments[:, 0], y_segments[:, 1] = y.to_numpy()[starts], y.to_numpy()[starts + 1]
+    return x_segments.ravel().tolist(), y_segments.ravel().tolist()
+
+
+def _get_monthly_code_counts(data: pd.DataFrame, jel_codes: list) -> pd.DataFrame:
+    incidence, jel_codes = build_incidence_matrix(
+        data["jel_codes"], pd.Index(jel_codes), binary=True
+    )
+    indicator, months = row_group_indicator(
+        data["publication_year_month"].reset_index(drop=True)
+    )
+    return pd.DataFrame(
+        (indicator @ incidence).toarray().astype(int),
+        index=months.rename("publication_year_month"),
+        columns=jel_codes,
+    )
 
 
 def _get_normalized_counts(
-    data: pd.DataFrame, total_counts: pd.DataFrame, jel_code: str
+    monthly_counts: pd.DataFrame, total_counts: pd.DataFrame, jel_code: str
 ) -> pd.DataFrame:
-    jel_counts = _create_count_and_smoothed_data(
-        data=data,
-        grouping="publication_year_month",
-        relevant_metric=f"{jel_code}_count",
-        count_name=f"{jel_code}_count",
+    # Only months with at least one paper with the code, like a groupby would give
+    counts = monthly_counts[jel_code]
+    jel_counts = counts[counts > 0].reset_index(name=f"{jel_code}_count")
+    jel_counts[f"{jel_code}_count_smooth"] = (
+        jel_counts[f"{jel_code}_count"].rolling(6, center=False).mean()
     )
 
     jel_counts = jel_counts.merge(total_counts, on="publication_year_month", how="left")
@@ -456,26 +564,24 @@ def _get_normalized_counts(
 def _get_yearly_most_common_codes(
     data: pd.DataFrame, number_of_codes: int
 ) -> pd.DataFrame:
-    mapping = {}
-    for year in data.publication_year_month.dt.year.unique():
-        data_year = data[data.publication_year_month.dt.year == year]
-        mapping[year] = _get_most_common_codes(data=data_year, number=number_of_codes)
-    unique_jel_codes = {item for sublist in mapping.values() for item in sublist}
+    # Ties are broken alphabetically, like in _get_most_common_codes
+    years = data["publication_year_month"].dt.year.reset_index(drop=True)
+    incidence, jel_codes = build_incidence_matrix(data["jel_codes"])
+    indicator, year_labels = row_group_indicator(years)
+    counts = (indicator @ incidence).toarray()
 
-    yearly_most_common_codes = pd.DataFrame(
-        index=mapping.keys(),
-        columns=sorted(unique_jel_codes),
-    )
+    top_codes = np.argsort(-counts, axis=1, kind="stable")[:, :number_of_codes]
+    is_common = np.zeros(counts.shape, dtype=bool)
+    np.put_along_axis(is_common, top_codes, values=True, axis=1)
+    is_common &= counts > 0
+    is_ever_common = is_common.any(axis=0)
 
-    yearly_most_common_codes = yearly_most_common_codes.apply(
-        lambda col: col.index.to_series().apply(
-            lambda year: int(col.name in mapping[year])
-        )
+    return pd.DataFrame(
+        is_common[:, is_ever_common].astype(int),
+        index=year_labels.astype(int),
+        columns=jel_codes[is_ever_common],
     )
 
-    yearly_most_common_codes.index = yearly_most_common_codes.index.astype(int)
-    return yearly_most_common_codes
-
 
 def _hex_to_rgba(hex_color: str, alpha: float = 1.0) -> str:
     hex_color = hex_color.lstrip("#")
@@ -483,27 +589,6 @@ def _hex_to_rgba(hex_color: str, alpha: float = 1.0) -> str:
     return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
 
 
-def _create_avg_and_smoothed_data(
-    data: pd.DataFrame,
-    grouping: str,
-    relevant_metric: str,
-    avg_name: str,
-) -> pd.DataFrame:
-    avg = data.groupby(grouping)[relevant_metric].mean().reset_index(name=avg_name)
-
-    avg[f"{avg_name}_smooth"] = avg[avg_name].rolling(6, center=False).mean()
-    return avg
-
-
-def _create_count_and_smoothed_data(
-    data: pd.DataFrame, grouping: str, relevant_metric: str, count_name: str
-) -> pd.DataFrame:
-    avg = data.groupby(grouping)[relevant_metric].count().reset_index(name=count_name)
-
-    avg[f"{count_name}_smooth"] = avg[count_name].rolling(6, center=False).mean()
-    return avg
-
-
 def _calculate_jel_counts(data: pd.DataFrame) -> pd.Series:
     jel_counts = data["jel_codes"].explode().value_counts().sort_values(ascending=False)
     return jel_counts[jel_counts > 10]
@@ -517,11 +602,10 @@ def _calculate_author_counts(data: pd.DataFrame) -> pd.Series:
 
 
 def _get_most_common_codes(data: pd.DataFrame, number: int) -> list:
-    jel_codes_count = data.jel_codes.explode().value_counts()
-    jel_codes_sorted = jel_codes_count.reset_index().sort_values(
-        by="count", ascending=False
-    )
-    return jel_codes_sorted.loc[: number - 1, "jel_codes"].to_list()
+    # Ties are broken alphabetically
+    jel_codes_count = data.jel_codes.explode().value_counts().sort_index()
+    jel_codes_sorted = jel_codes_count.sort_values(ascending=False, kind="stable")
+    return jel_codes_sorted.index[:number].to_list()
 
 
 def _get_yearly_counts(data: pd.DataFrame) -> pd.DataFrame:
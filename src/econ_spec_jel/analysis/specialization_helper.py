@@ -0,0 +1,196 @@
+"""Helper functions for measuring the JEL specialization of papers and authors.
+
+All measures operate on sparse count matrices (rows are papers, authors or periods,
+columns are JEL codes), so the whole corpus is handled by a handful of array
+operations instead of per-row ``apply`` calls.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from econ_spec_jel.analysis.incidence_helper import (
+    aggregate_columns,
+    build_incidence_matrix,
+    row_group_indicator,
+)
+
+# Length of the JEL code prefix defining each level of the JEL classification tree,
+# e.g. "J" (category), "J3" (subcategory) and "J31" (code).
+JEL_LEVELS = {"category": 1, "subcategory": 2, "code": 3}
+
+
+def herfindahl_index(counts: sparse.csr_array) -> np.ndarray:
+    """Compute the Herfindahl-Hirschman index of each row of a count matrix.
+
+    Args:
+        counts (sparse.csr_array): Row x category counts.
+
+    Returns
+    -------
+        np.ndarray: Sum of squared category shares per row (NaN for empty rows).
+    """
+    totals = counts.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return counts.multiply(counts).sum(axis=1) / totals**2
+
+
+def shannon_entropy(counts: sparse.csr_array) -> np.ndarray:
+    """Compute the Shannon entropy (in nats) of each row of a count matrix.
+
+    Args:
+        counts (sparse.csr_array): Row x category counts.
+
+    Returns
+    -------
+        np.ndarray: Entropy of the category shares per row (NaN for empty rows).
+    """
+    totals = counts.sum(axis=1)
+    shares = sparse.csr_array(counts, copy=True)
+    shares.data /= np.repeat(totals, np.diff(shares.indptr))
+    shares.data = -shares.data * np.log(shares.data)
+    entropy = shares.sum(axis=1)
+    entropy[totals == 0] = np.nan
+    return entropy
+
+
+def mean_jel_tree_distance(counts: sparse.csr_array, codes: pd.Index) -> np.ndarray:
+    """Compute the mean pairwise distance of the JEL codes of each row.
+
+    The distance between two codes is the number of levels of the JEL tree on which
+    they differ, i.e. 0 for identical codes, 1 for codes within the same
+    subcategory, 2 for codes within the same category and 3 otherwise. The sum over
+    all pairs follows from the number of pairs sharing each level, which avoids
+    enumerating the pairs.
+
+    Args:
+        counts (sparse.csr_array): Row x JEL code counts.
+        codes (pd.Index): JEL codes labelling the columns of ``counts``.
+
+    Returns
+    -------
+        np.ndarray: Mean pairwise distance per row (NaN for rows with < 2 codes).
+    """
+    totals = counts.sum(axis=1)
+    pairs = totals * (totals - 1) / 2
+    distance = np.zeros_like(pairs)
+    for prefix_length in JEL_LEVELS.values():
+        level_counts, _ = aggregate_columns(counts, codes, codes.str[:prefix_length])
+        same_level_pairs = (
+            level_counts.multiply(level_counts).sum(axis=1) - totals
+        ) / 2
+        distance += pairs - same_level_pairs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(pairs > 0, distance / pairs, np.nan)
+
+
+def specialization_measures(counts: sparse.csr_array, codes: pd.Index) -> pd.DataFrame:
+    """Compute all specialization measures for each row of a JEL count matrix.
+
+    Args:
+        counts (sparse.csr_array): Row x JEL code counts.
+        codes (pd.Index): JEL codes labelling the columns of ``counts``.
+
+    Returns
+    -------
+        pd.DataFrame: Herfindahl index and entropy on each level of the JEL tree and
+        the mean JEL tree distance, one row per row of ``counts``.
+    """
+    measures = {}
+    for level, prefix_length in JEL_LEVELS.items():
+        level_counts, _ = aggregate_columns(counts, codes, codes.str[:prefix_length])
+        measures[f"hhi_{level}"] = herfindahl_index(level_counts)
+        measures[f"entropy_{level}"] = shannon_entropy(level_counts)
+    measures["jel_tree_distance"] = mean_jel_tree_distance(counts, codes)
+    return pd.DataFrame(measures)
+
+
+def paper_specialization(data: pd.DataFrame) -> pd.DataFrame:
+    """Compute the specialization measures of each discussion paper.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+
+    Returns
+    -------
+        pd.DataFrame: Specialization measures per discussion paper.
+    """
+    counts, codes = build_incidence_matrix(data["jel_codes"])
+    out = data[["dp_number", "publication_year_month", "jel_codes_count"]]
+    out = out.reset_index(drop=True)
+    return pd.concat([out, specialization_measures(counts, codes)], axis=1)
+
+
+def author_specialization(data: pd.DataFrame) -> pd.DataFrame:
+    """Compute the specialization measures of each author's career.
+
+    The JEL codes of all discussion papers of an author are pooled before computing
+    the measures.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+
+    Returns
+    -------
+        pd.DataFrame: Specialization measures per author.
+    """
+    counts, codes = build_incidence_matrix(data["jel_codes"])
+    authorship, authors = build_incidence_matrix(data["author_names"], binary=True)
+    author_counts = sparse.csr_array(authorship.T @ counts)
+
+    publication_month = data["publication_year_month"].to_numpy().astype("M8[M]")
+    month_number = publication_month.astype(np.int64)
+    rows, columns = authorship.nonzero()
+    career_start = np.full(len(authors), np.iinfo(np.int64).max)
+    career_end = np.full(len(authors), np.iinfo(np.int64).min)
+    np.minimum.at(career_start, columns, month_number[rows])
+    np.maximum.at(career_end, columns, month_number[rows])
+
+    out = pd.DataFrame(
+        {
+            "author_name": authors,
+            "dp_count": authorship.sum(axis=0).astype(int),
+            "career_start": career_start.astype("M8[M]").astype("M8[ns]"),
+            "career_end": career_end.astype("M8[M]").astype("M8[ns]"),
+        }
+    )
+    return pd.concat([out, specialization_measures(author_counts, codes)], axis=1)
+
+
+def period_specialization(
+    data: pd.DataFrame, paper_measures: pd.DataFrame
+) -> pd.DataFrame:
+    """Compute the specialization measures per publication year.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+        paper_measures (pd.DataFrame): Specialization measures per discussion paper.
+
+    Returns
+    -------
+        pd.DataFrame: Average paper specialization per year (``mean_`` prefix) and
+        the specialization of the pooled JEL code distribution of each year.
+    """
+    counts, codes = build_incidence_matrix(data["jel_codes"])
+    years = data["publication_year_month"].dt.year.reset_index(drop=True)
+    indicator, labels = row_group_indicator(years)
+    year_counts = sparse.csr_array(indicator @ counts)
+
+    paper_means = (
+        paper_measures.drop(columns=["dp_number", "publication_year_month"])
+        .groupby(years.to_numpy())
+        .mean()
+        .add_prefix("mean_")
+        .reindex(labels)
+    )
+    out = pd.DataFrame(
+        {"year": labels, "dp_count": indicator.sum(axis=1).astype(int)},
+    )
+    return pd.concat(
+        [
+            out,
+            paper_means.reset_index(drop=True),
+            specialization_measures(year_counts, codes),
+        ],
+        axis=1,
+    )
@@ -0,0 +1,203 @@
+"""Tasks for creating and exporting the figures."""
+
+import pandas as pd
+import plotly.graph_objects as go
+from pathlib import Path
+from typing import Annotated
+import pytask
+from pytask import task
+
+from econ_spec_jel.config import (
+    BLD,
+    DASHBOARD_MAX_BYTES,
+    DASHBOARD_MAX_POINTS_PER_TRACE,
+    DATACATALOGS,
+    FIGURE_FORMATS,
+    FIGURES,
+)
+from econ_spec_jel.analysis import plotting_helper
+from econ_spec_jel.analysis.dashboard_helper import build_dashboard
+from econ_spec_jel.analysis.export_helper import export_figures
+
+
+def _fail_if_wrong_instance(input_, instance_type) -> None:  # ANN001
+    if not isinstance(input_, instance_type):
+        msg = (
+            f"Expected {input_.__name__} to be of "
+            f"type {instance_type}, got {type(input_)} instead."
+        )
+        raise TypeError(msg)
+
+
+def _fail_if_invalid_id(id_: str) -> None:
+    if id_ not in dir(plotting_helper):
+        msg = (
+            f"Expected {id_} to be a valid function in "
+            f"econ_spec_jel.analysis.plotting_helper."
+        )
+        raise ValueError(msg)
+
+
+def _error_handling(data: pd.DataFrame, number_of_codes: int, id_: str) -> None:
+    for input_, type_ in zip(
+        [data, number_of_codes, id_],
+        [pd.core.frame.DataFrame, int, str],
+        strict=False,
+    ):
+        _fail_if_wrong_instance(input_, type_)
+    _fail_if_invalid_id(id_)
+
+
+ID_KWARGS = {
+    "plot_author_trends": {
+        "name": "fig_author_trends",
+        "title": "Authors per Discussion Paper",
+        "input": "monthly_statistics",
+    },
+    "plot_dp_counts": {
+        "name": "fig_counts_dp_jel_codes",
+        "title": "Discussion Papers per Author and JEL Code",
+        "input": "data",
+    },
+    "plot_monthly_trends": {
+        "name": "fig_dp_counts",
+        "title": "Discussion Papers and JEL Codes per Month",
+        "input": "monthly_statistics",
+    },
+    "plot_most_common_jel_codes": {
+        "name": "fig_top5overall_jel",
+        "title": "Most Common JEL Codes",
+        "input": "data",
+        "number_of_codes": 5,
+    },
+    "plot_yearly_most_common_jel_codes": {
+        "name": "fig_top3yearly_jel",
+        "title": "Most Common JEL Codes per Year",
+        "input": "data",
+        "number_of_codes": 3,
+    },
+}
+DESCRIPTIVE_FIGURE_TITLES = {
+    kwargs["name"]: kwargs["title"] for kwargs in ID_KWARGS.values()
+}
+TOPIC_FIGURE_TITLES = {"fig_topic_trends": "Topics with the Steepest Trends"}
+FIGURE_TITLES = DESCRIPTIVE_FIGURE_TITLES | TOPIC_FIGURE_TITLES
+
+
+def _figure_paths(names: list[str]) -> dict[str, dict[str, Path]]:
+    return {
+        name: {format_: FIGURES / f"{name}.{format_}" for format_ in FIGURE_FORMATS}
+        for name in names
+    }
+
+
+def task_monthly_statistics(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+) -> Annotated[Path, DATACATALOGS["data"]["monthly_statistics"]]:
+    """Aggregate the analysis data per month once for all monthly plots.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+
+    Returns
+    -------
+        pd.DataFrame: Paper counts, metric means and their 6-month rolling means.
+    """
+    return plotting_helper.monthly_statistics(data)
+
+
+@task(kwargs={"produces": _figure_paths(list(DESCRIPTIVE_FIGURE_TITLES))})
+def task_export_descriptive_figures(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+    monthly_statistics: Annotated[Path, DATACATALOGS["data"]["monthly_statistics"]],
+    produces: dict[str, dict[str, Path]],
+) -> None:
+    """Create the descriptive plots and export them with the shared renderer.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+        monthly_statistics (pd.DataFrame): The monthly statistics of the data.
+        produces (dict[str, dict[str, Path]]): Path of each figure per format.
+    """
+    export_figures(_create_descriptive_figures(data, monthly_statistics), produces)
+
+
+@task(kwargs={"produces": _figure_paths(list(TOPIC_FIGURE_TITLES))})
+def task_export_topic_figures(
+    plotting_data: Annotated[Path, DATACATALOGS["data"]["topics_plotting_data"]],
+    slopes: Annotated[Path, DATACATALOGS["data"]["slopes"]],
+    topic_prevalence: Annotated[Path, DATACATALOGS["data"]["topic_prevalence"]],
+    produces: dict[str, dict[str, Path]],
+) -> None:
+    """Create the topic plots and export them with the shared renderer.
+
+    Args:
+        plotting_data (pd.DataFrame): The documents of the plotted topics.
+        slopes (pd.DataFrame): The topic slopes, sorted in descending order.
+        topic_prevalence (pd.DataFrame): The monthly prevalence of each topic.
+        produces (dict[str, dict[str, Path]]): Path of each figure per format.
+    """
+    export_figures(
+        _create_topic_figures(plotting_data, slopes, topic_prevalence), produces
+    )
+
+
+@pytask.mark.skip()
+def task_dashboard(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+    monthly_statistics: Annotated[Path, DATACATALOGS["data"]["monthly_statistics"]],
+    plotting_data: Annotated[Path, DATACATALOGS["data"]["topics_plotting_data"]],
+    slopes: Annotated[Path, DATACATALOGS["data"]["slopes"]],
+    topic_prevalence: Annotated[Path, DATACATALOGS["data"]["topic_prevalence"]],
+    produces: Path = BLD / "dashboard" / "dashboard.html",
+) -> None:
+    """Write all plots as interactive figures into one self-contained HTML page.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+        monthly_statistics (pd.DataFrame): The monthly statistics of the data.
+        plotting_data (pd.DataFrame): The documents of the plotted topics.
+        slopes (pd.DataFrame): The topic slopes, sorted in descending order.
+        topic_prevalence (pd.DataFrame): The monthly prevalence of each topic.
+        produces (Path): Path of the dashboard.
+    """
+    figures = _create_descriptive_figures(
+        data, monthly_statistics
+    ) | _create_topic_figures(plotting_data, slopes, topic_prevalence)
+    dashboard = build_dashboard(
+        {FIGURE_TITLES[name]: fig for name, fig in figures.items()},
+        title="Specialization Trends in Economics Research using JEL Codes",
+        max_points=DASHBOARD_MAX_POINTS_PER_TRACE,
+        max_bytes=DASHBOARD_MAX_BYTES,
+    )
+    produces.parent.mkdir(parents=True, exist_ok=True)
+    produces.write_text(dashboard, encoding="utf-8")
+
+
+def _create_descriptive_figures(
+    data: pd.DataFrame, monthly_statistics: pd.DataFrame
+) -> dict[str, go.Figure]:
+    inputs = {"data": data, "monthly_statistics": monthly_statistics}
+    return {
+        kwargs["name"]: _create_figure(
+            inputs[kwargs["input"]], kwargs.get("number_of_codes", 0), id_
+        )
+        for id_, kwargs in ID_KWARGS.items()
+    }
+
+
+def _create_topic_figures(
+    plotting_data: pd.DataFrame, slopes: pd.DataFrame, topic_prevalence: pd.DataFrame
+) -> dict[str, go.Figure]:
+    return {
+        "fig_topic_trends": plotting_helper.plot_topic_trends(
+            plotting_data, slopes, topic_prevalence
+        )
+    }
+
+
+def _create_figure(data: pd.DataFrame, number_of_codes: int, id_: str) -> go.Figure:
+    _error_handling(data, number_of_codes, id_)
+    if number_of_codes != 0:
+        return getattr(plotting_helper, id_)(data, number_of_codes)
+    return getattr(plotting_helper, id_)(data)
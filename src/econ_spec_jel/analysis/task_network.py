@@ -0,0 +1,81 @@
+"""Tasks for the co-authorship and JEL co-occurrence network analysis."""
+
+from pathlib import Path
+from typing import Annotated
+
+import pandas as pd
+from pytask import task
+
+from econ_spec_jel.config import (
+    DATACATALOGS,
+    NETWORK_ROLLING_STEP_MONTHS,
+    NETWORK_ROLLING_WINDOW_MONTHS,
+    NETWORK_WINDOW_YEARS,
+)
+from econ_spec_jel.analysis.incidence_helper import build_incidence_matrix
+from econ_spec_jel.analysis.network_helper import (
+    network_communities,
+    rolling_window_statistics,
+)
+
+NETWORK_KWARGS = {
+    "coauthorship": {"column": "author_names"},
+    "jel_cooccurrence": {"column": "jel_codes"},
+}
+
+for id_, kwargs_ in NETWORK_KWARGS.items():
+
+    @task(id=id_, kwargs=kwargs_)
+    def task_network_communities(
+        data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+        column: str,
+    ) -> Annotated[
+        tuple[pd.DataFrame, pd.DataFrame],
+        (
+            DATACATALOGS["data"][f"{id_}_communities"],
+            DATACATALOGS["data"][f"{id_}_modularity"],
+        ),
+    ]:
+        """Detect the communities of the network per time window.
+
+        Args:
+            data (pd.DataFrame): The analysis data.
+            column (str): List column defining the network nodes.
+
+        Returns
+        -------
+            tuple[pd.DataFrame, pd.DataFrame]: Communities and modularity per window.
+        """
+        return _get_network_communities(data, column, NETWORK_WINDOW_YEARS)
+
+    @task(id=id_, kwargs=kwargs_)
+    def task_rolling_network_statistics(
+        data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+        column: str,
+    ) -> Annotated[Path, DATACATALOGS["data"][f"{id_}_rolling_statistics"]]:
+        """Compute the network statistics for sliding windows of months.
+
+        Args:
+            data (pd.DataFrame): The analysis data.
+            column (str): List column defining the network nodes.
+
+        Returns
+        -------
+            pd.DataFrame: Network statistics per window.
+        """
+        incidence, _ = build_incidence_matrix(data[column], binary=True)
+        return rolling_window_statistics(
+            incidence,
+            data["publication_year_month"],
+            window_months=NETWORK_ROLLING_WINDOW_MONTHS,
+            step_months=NETWORK_ROLLING_STEP_MONTHS,
+        )
+
+
+def _get_network_communities(
+    data: pd.DataFrame, column: str, window_years: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    incidence, nodes = build_incidence_matrix(data[column], binary=True)
+    years = data["publication_year_month"].dt.year.reset_index(drop=True)
+    windows = years - (years - years.min()) % window_years
+    return network_communities(incidence, nodes, windows)
@@ -0,0 +1,60 @@
+"""Tasks for measuring the JEL specialization of papers, authors and periods."""
+
+from pathlib import Path
+from typing import Annotated
+
+from econ_spec_jel.config import DATACATALOGS
+from econ_spec_jel.analysis.specialization_helper import (
+    author_specialization,
+    paper_specialization,
+    period_specialization,
+)
+
+
+def task_specialization_papers(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+) -> Annotated[Path, DATACATALOGS["data"]["specialization_papers"]]:
+    """Compute the JEL specialization measures of each discussion paper.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+
+    Returns
+    -------
+        pd.DataFrame: Specialization measures per discussion paper.
+    """
+    return paper_specialization(data)
+
+
+def task_specialization_authors(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+) -> Annotated[Path, DATACATALOGS["data"]["specialization_authors"]]:
+    """Compute the JEL specialization measures of each author's career.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+
+    Returns
+    -------
+        pd.DataFrame: Specialization measures per author.
+    """
+    return author_specialization(data)
+
+
+def task_specialization_periods(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+    specialization_papers: Annotated[
+        Path, DATACATALOGS["data"]["specialization_papers"]
+    ],
+) -> Annotated[Path, DATACATALOGS["data"]["specialization_periods"]]:
+    """Compute the JEL specialization measures per publication year.
+
+    Args:
+        data (pd.DataFrame): The analysis data.
+        specialization_papers (pd.DataFrame): Specialization measures per paper.
+
+    Returns
+    -------
+        pd.DataFrame: Specialization measures per year.
+    """
+    return period_specialization(data, specialization_papers)
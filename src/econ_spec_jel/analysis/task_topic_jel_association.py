@@ -0,0 +1,59 @@
+"""Tasks for associating the LDA topics with the JEL codes of the papers."""
+
+from pathlib import Path
+from typing import Annotated
+
+import numpy as np
+import pandas as pd
+
+from econ_spec_jel.analysis.association_helper import topic_association
+from econ_spec_jel.analysis.incidence_helper import build_incidence_matrix
+from econ_spec_jel.config import DATACATALOGS, TOPIC_JEL_WINDOW_YEARS
+
+
+def task_topic_jel_association(
+    documents_topics: Annotated[Path, DATACATALOGS["data"]["documents_topics"]],
+    documents_metadata: Annotated[Path, DATACATALOGS["data"]["documents_metadata"]],
+) -> Annotated[Path, DATACATALOGS["data"]["topic_jel_association"]]:
+    """Compute the association of each topic with each JEL code over all papers.
+
+    Args:
+        documents_topics (np.ndarray): Documents x topics matrix of probabilities.
+        documents_metadata (pd.DataFrame): Metadata aligned with the matrix rows.
+
+    Returns
+    -------
+        pd.DataFrame: Papers, topic mass, share, lift and PMI per JEL code and topic.
+    """
+    return _get_topic_jel_association(documents_topics, documents_metadata)
+
+
+def task_topic_jel_association_periods(
+    documents_topics: Annotated[Path, DATACATALOGS["data"]["documents_topics"]],
+    documents_metadata: Annotated[Path, DATACATALOGS["data"]["documents_metadata"]],
+) -> Annotated[Path, DATACATALOGS["data"]["topic_jel_association_periods"]]:
+    """Compute the association of each topic with each JEL code per period.
+
+    Args:
+        documents_topics (np.ndarray): Documents x topics matrix of probabilities.
+        documents_metadata (pd.DataFrame): Metadata aligned with the matrix rows.
+
+    Returns
+    -------
+        pd.DataFrame: Papers, topic mass, share, lift and PMI per period (first year
+        of the window), JEL code and topic.
+    """
+    years = documents_metadata["publication_year_month"].dt.year
+    periods = years - (years - years.min()) % TOPIC_JEL_WINDOW_YEARS
+    return _get_topic_jel_association(documents_topics, documents_metadata, periods)
+
+
+def _get_topic_jel_association(
+    documents_topics: np.ndarray,
+    documents_metadata: pd.DataFrame,
+    periods: pd.Series | None = None,
+) -> pd.DataFrame:
+    incidence, jel_codes = build_incidence_matrix(
+        documents_metadata["jel_codes"], binary=True
+    )
+    return topic_association(documents_topics, incidence, jel_codes, periods)
@@ -0,0 +1,137 @@
+"""Helper functions for estimating linear time trends of many series at once."""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from econ_spec_jel.analysis.incidence_helper import row_group_indicator
+
+
+def date_ordinals(dates: pd.Series) -> np.ndarray:
+    """Convert dates to proleptic Gregorian ordinals, like ``Timestamp.toordinal``.
+
+    Args:
+        dates (pd.Series): Dates.
+
+    Returns
+    -------
+        np.ndarray: Number of days since 0001-01-01, which has ordinal 1.
+    """
+    days = pd.to_datetime(dates).to_numpy().astype("M8[D]")
+    return (days - np.datetime64("0001-01-01", "D")).astype(np.int64) + 1
+
+
+def ols_slopes(y: np.ndarray, x: np.ndarray) -> pd.DataFrame:
+    """Regress each column of ``y`` on a constant and ``x`` by ordinary least squares.
+
+    All regressions share the regressor, so the slopes follow from a single
+    product of the centered regressor with the matrix of outcomes.
+
+    Args:
+        y (np.ndarray): Observations x series matrix of outcomes.
+        x (np.ndarray): Regressor of each observation.
+
+    Returns
+    -------
+        pd.DataFrame: Slope, standard error, t-value and two-sided p-value of each
+        series (column of ``y``), NaN for fewer than three observations.
+    """
+    n_observations = len(x)
+    x_centered = x.astype(np.float64) - x.mean()
+    sum_of_squares_x = x_centered @ x_centered
+    y_centered = y.astype(np.float64) - y.mean(axis=0, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = x_centered @ y_centered / sum_of_squares_x
+        residual_sum_of_squares = (
+            np.einsum("ij,ij->j", y_centered, y_centered) - slope**2 * sum_of_squares_x
+        )
+        degrees_of_freedom = n_observations - 2
+        std_error = np.sqrt(
+            np.maximum(residual_sum_of_squares, 0)
+            / degrees_of_freedom
+            / sum_of_squares_x
+        )
+        t_value = slope / std_error
+    p_value = 2 * stats.t.sf(np.abs(t_value), degrees_of_freedom)
+
+    out = pd.DataFrame(
+        {
+            "slope": slope,
+            "std_error": std_error,
+            "t_value": t_value,
+            "p_value": p_value,
+        }
+    )
+    if degrees_of_freedom < 1:
+        out[:] = np.nan
+    return out
+
+
+def weighted_ols_slopes(
+    y: np.ndarray, x: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """Weighted least squares slopes of each column of ``y`` on a constant and ``x``.
+
+    Args:
+        y (np.ndarray): Observations x series matrix of outcomes.
+        x (np.ndarray): Regressor of each observation.
+        weights (np.ndarray): Weight of each observation.
+
+    Returns
+    -------
+        np.ndarray: Slope of each series.
+    """
+    weights = weights / weights.sum()
+    x_centered = x - weights @ x
+    y_centered = y - weights @ y
+    return (weights * x_centered) @ y_centered / ((weights * x_centered) @ x_centered)
+
+
+def theil_sen_slopes(y: np.ndarray, x: np.ndarray, chunksize: int = 50) -> np.ndarray:
+    """Theil-Sen slopes (median of all pairwise slopes) of each column of ``y``.
+
+    The pairwise slopes are computed for blocks of ``chunksize`` series at a time,
+    which bounds memory to the number of pairs times ``chunksize``.
+
+    Args:
+        y (np.ndarray): Observations x series matrix of outcomes.
+        x (np.ndarray): Regressor of each observation.
+        chunksize (int): Number of series processed at once.
+
+    Returns
+    -------
+        np.ndarray: Slope of each series.
+    """
+    first, second = np.triu_indices(len(x), k=1)
+    is_distinct = x[first] != x[second]
+    first, second = first[is_distinct], second[is_distinct]
+    dx = (x[second] - x[first]).astype(np.float64)
+
+    slopes = np.empty(y.shape[1])
+    for start in range(0, y.shape[1], chunksize):
+        chunk = np.asarray(y[:, start : start + chunksize], dtype=np.float64)
+        pairwise = (chunk[second] - chunk[first]) / dx[:, None]
+        slopes[start : start + chunksize] = np.median(pairwise, axis=0)
+    return slopes
+
+
+def monthly_prevalence(
+    documents_topics: np.ndarray, dates: pd.Series
+) -> tuple[pd.Index, np.ndarray, np.ndarray]:
+    """Aggregate the topic probabilities of all documents per publication month.
+
+    Args:
+        documents_topics (np.ndarray): Documents x topics matrix of probabilities.
+        dates (pd.Series): Publication date of each document.
+
+    Returns
+    -------
+        tuple[pd.Index, np.ndarray, np.ndarray]: Sorted months, number of papers per
+        month and the months x topics matrix of summed topic probabilities.
+    """
+    months = pd.Series(pd.to_datetime(dates).to_numpy().astype("M8[M]"))
+    indicator, labels = row_group_indicator(months)
+    papers = indicator.sum(axis=1)
+    sums = indicator @ np.asarray(documents_topics, dtype=np.float64)
+    return pd.DatetimeIndex(labels.astype("M8[ns]")), papers, sums
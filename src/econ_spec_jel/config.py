@@ -1,9 +1,14 @@
 """Contains the general configuration of the project."""
 
+from dataclasses import dataclass
 from pathlib import Path
 import pandas as pd
+from gensim.corpora import Dictionary
+from gensim.models import LdaModel
 from pytask import DataCatalog
 
+from econ_spec_jel.nodes import GensimNode, MmCorpusNode, NumpyNode, SparseMatrixNode
+
 pd.set_option("mode.copy_on_write", True)
 pd.set_option("future.infer_string", True)
 pd.set_option("future.no_silent_downcasting", True)
@@ -23,19 +28,212 @@ DATACATALOGS = {
     },
     "data": DataCatalog(name="data"),
     "topic_model": DataCatalog(name="topic_model"),
+    "fulltext_model": DataCatalog(name="fulltext_model"),
 }
+DATACATALOGS["topic_model"].add(
+    "corpus",
+    MmCorpusNode(name="corpus", path=DATACATALOGS["topic_model"].path / "corpus.mm"),
+)
+DATACATALOGS["topic_model"].add(
+    "lda",
+    GensimNode(
+        name="lda", path=DATACATALOGS["topic_model"].path / "lda", loader=LdaModel
+    ),
+)
+DATACATALOGS["topic_model"].add(
+    "dictionary",
+    GensimNode(
+        name="dictionary",
+        path=DATACATALOGS["topic_model"].path / "dictionary",
+        loader=Dictionary,
+        mmap=None,
+    ),
+)
+DATACATALOGS["topic_model"].add(
+    "lda_previous",
+    GensimNode(
+        name="lda_previous",
+        path=DATACATALOGS["topic_model"].path / "lda_previous",
+        loader=LdaModel,
+        mmap=None,
+    ),
+)
+DATACATALOGS["data"].add(
+    "documents_topics",
+    NumpyNode(
+        name="documents_topics",
+        path=DATACATALOGS["data"].path / "documents_topics.npy",
+    ),
+)
+DATACATALOGS["data"].add("fulltext", DATACATALOGS["data"].path / "fulltext.parquet")
+DATACATALOGS["fulltext_model"].add(
+    "tokens", DATACATALOGS["fulltext_model"].path / "tokens.parquet"
+)
+DATACATALOGS["fulltext_model"].add(
+    "corpus",
+    MmCorpusNode(
+        name="fulltext_corpus", path=DATACATALOGS["fulltext_model"].path / "corpus.mm"
+    ),
+)
+DATACATALOGS["fulltext_model"].add(
+    "lda",
+    GensimNode(
+        name="fulltext_lda",
+        path=DATACATALOGS["fulltext_model"].path / "lda",
+        loader=LdaModel,
+    ),
+)
+DATACATALOGS["fulltext_model"].add(
+    "dictionary",
+    GensimNode(
+        name="fulltext_dictionary",
+        path=DATACATALOGS["fulltext_model"].path / "dictionary",
+        loader=Dictionary,
+        mmap=None,
+    ),
+)
+# Top-k view of documents_topics for consumers that need only the main topics of
+# each document. No task reads it yet; the analyses use the dense matrix.
+DATACATALOGS["data"].add(
+    "documents_topics_sparse",
+    SparseMatrixNode(
+        name="documents_topics_sparse",
+        path=DATACATALOGS["data"].path / "documents_topics_sparse.npz",
+    ),
+)
 
 MAX_DP_NUMBER = 17695
 NUM_TOPICS = 750
+NETWORK_WINDOW_YEARS = 3
+NETWORK_ROLLING_WINDOW_MONTHS = 36
+NETWORK_ROLLING_STEP_MONTHS = 1
+DOCUMENTS_TOPICS_TOP_K = 20
+DOCUMENTS_TOPICS_MIN_PROBABILITY = 0.001
+TOPIC_JEL_WINDOW_YEARS = 5
+# Trend estimate the topics are ranked by: "weighted_slope" (equal to the OLS slope
+# on the individual documents) or the robust "theil_sen_slope".
+TOPIC_TREND_ESTIMATOR = "weighted_slope"
+FIGURE_FORMATS = ("png",)
+DASHBOARD_MAX_POINTS_PER_TRACE = 2_000
+DASHBOARD_MAX_BYTES = 5 * 1024**2
+
+
+@dataclass(frozen=True)
+class LdaConfig:
+    """Hyperparameters and training backend of the LDA topic model.
+
+    The ``"single"`` backend trains a :class:`gensim.models.LdaModel` in one process
+    and is fully reproducible given ``random_state``. The ``"multicore"`` backend
+    trains a :class:`gensim.models.LdaMulticore` with ``workers`` processes; it is
+    seeded with ``random_state`` as well, but the order in which workers merge their
+    results is not deterministic. Since it does not support callbacks, its training
+    report has a single row with the wall time of all passes and the perplexity
+    after the last pass.
+
+    A model trained from scratch is kept as a snapshot. With ``warm_start``, the
+    snapshot is updated online with the documents it has not seen yet instead of
+    being retrained. The warm start fails once the share of out-of-vocabulary
+    tokens in the new documents exceeds that of the documents the snapshot was
+    trained on by more than ``drift_threshold``. The model then has to be retrained
+    from scratch with ``warm_start`` switched off, which also replaces the snapshot.
+    Delete the ``topic_model`` data catalog to force a complete rebuild.
+    """
+
+    num_topics: int = NUM_TOPICS
+    no_below: int = 20
+    no_above: float = 0.90
+    chunksize: int = 5000
+    passes: int = 20
+    iterations: int = 400
+    alpha: str = "symmetric"
+    eta: str = "symmetric"
+    random_state: int = 1234
+    backend: str = "single"
+    workers: int | None = None
+    perplexity_docs: int = 1000
+    warm_start: bool = False
+    drift_threshold: float = 0.05
+
+
+LDA_CONFIG = LdaConfig()
+
+
+@dataclass(frozen=True)
+class LdaSweepConfig:
+    """Grid and resource limits of the LDA hyperparameter sweep.
+
+    Every combination of ``num_topics``, ``alpha`` and ``eta`` is trained with the
+    remaining hyperparameters of :data:`LDA_CONFIG` on all but a random
+    ``holdout_share`` of the documents. ``processes`` models are trained at the same
+    time, each with at most ``blas_threads`` BLAS threads, so that ``processes *
+    blas_threads`` should not exceed the number of cores. ``processes`` defaults to
+    the number of cores divided by ``blas_threads``.
+    """
+
+    num_topics: tuple[int, ...] = (50, 100, 250, 500, NUM_TOPICS)
+    alpha: tuple[str, ...] = ("symmetric", "asymmetric")
+    eta: tuple[str, ...] = ("symmetric", "auto")
+    holdout_share: float = 0.1
+    coherence_topn: int = 10
+    processes: int | None = None
+    blas_threads: int = 1
+    random_state: int = 1234
+
+
+LDA_SWEEP_CONFIG = LdaSweepConfig()
+
+
+@dataclass(frozen=True)
+class FulltextConfig:
+    """Resource limits of the full-text extraction from the discussion paper PDFs.
+
+    ``processes`` worker processes (default: the number of cores) parse the PDFs.
+    Parsing one file is aborted after ``timeout`` seconds and each worker may use at
+    most ``memory_limit_mb`` megabytes of address space, so that a pathological PDF
+    is stored as failed instead of stalling the run; failed files are retried on the
+    next run. The texts are written to a parquet store in row groups of
+    ``batch_size`` documents.
+
+    The full-text topic model reads and writes the texts in the same batches and is
+    trained with the hyperparameters of :data:`LDA_CONFIG`, except that it is
+    updated every ``lda_chunksize`` documents, since a full text is much longer
+    than an abstract.
+    """
+
+    processes: int | None = None
+    timeout: int | None = 120
+    memory_limit_mb: int | None = 2048
+    batch_size: int = 256
+    compression: str = "zstd"
+    lda_chunksize: int = 500
+
+
+FULLTEXT_CONFIG = FulltextConfig()
 
 __all__ = [
     "BLD",
     "DATA",
+    "DASHBOARD_MAX_BYTES",
+    "DASHBOARD_MAX_POINTS_PER_TRACE",
     "DATACATALOGS",
     "DOCUMENTS",
+    "DOCUMENTS_TOPICS_MIN_PROBABILITY",
+    "DOCUMENTS_TOPICS_TOP_K",
     "FIGURES",
+    "FIGURE_FORMATS",
+    "FULLTEXT_CONFIG",
+    "LDA_CONFIG",
+    "LDA_SWEEP_CONFIG",
     "MAX_DP_NUMBER",
+    "NETWORK_ROLLING_STEP_MONTHS",
+    "NETWORK_ROLLING_WINDOW_MONTHS",
+    "NETWORK_WINDOW_YEARS",
     "NUM_TOPICS",
     "ROOT",
     "SRC",
+    "TOPIC_JEL_WINDOW_YEARS",
+    "TOPIC_TREND_ESTIMATOR",
+    "FulltextConfig",
+    "LdaConfig",
+    "LdaSweepConfig",
 ]
@@ -0,0 +1,234 @@
+"""Helper functions for extracting the full text of the discussion paper PDFs."""
+
+import contextlib
+import functools
+import hashlib
+import heapq
+import io
+import multiprocessing
+import operator
+import os
+import pickle
+import signal
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import ModuleType
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pypdf import PdfReader
+
+from econ_spec_jel.config import FulltextConfig
+
+resource: ModuleType | None
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FULLTEXT_SCHEMA = pa.schema(
+    [
+        ("dp_number", pa.int64()),
+        ("sha256", pa.string()),
+        ("status", pa.string()),
+        ("n_pages", pa.int32()),
+        ("text", pa.large_string()),
+    ]
+)
+
+
+class ExtractionTimeoutError(Exception):
+    """Raised in a worker when extracting the text of one file takes too long."""
+
+
+def file_checksum(path: Path, chunksize: int = 1024**2) -> str:
+    """Compute the SHA-256 checksum of a file without reading it at once.
+
+    Args:
+        path (Path): The file.
+        chunksize (int): Number of bytes read at a time.
+
+    Returns
+    -------
+        str: Hexadecimal checksum.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(functools.partial(f.read, chunksize), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stored_checksums(store: Path) -> dict[int, str]:
+    """Read the checksum of each successfully extracted file in a full-text store.
+
+    Args:
+        store (Path): The parquet store. It may not exist yet.
+
+    Returns
+    -------
+        dict[int, str]: Checksum by discussion paper number, for rows with status
+        "ok" only.
+    """
+    if not store.is_file():
+        return {}
+    table = pq.read_table(
+        store, columns=["dp_number", "sha256"], filters=[("status", "==", "ok")]
+    )
+    return dict(
+        zip(table["dp_number"].to_pylist(), table["sha256"].to_pylist(), strict=True)
+    )
+
+
+def extract_fulltexts(
+    files: dict[int, Path], store: Path, config: FulltextConfig
+) -> pd.DataFrame:
+    """Update a parquet store with the text of new or changed PDF files.
+
+    Files that were extracted successfully and whose checksum matches the store
+    are skipped, rows of files that no longer exist are dropped. The remaining
+    files are parsed in a process pool. Each file gets ``config.timeout`` seconds;
+    each worker process is limited to ``config.memory_limit_mb`` megabytes of
+    address space (not enforced on Windows). Files that fail are stored with an
+    empty text and their status and are retried on the next run. If a worker dies
+    (e.g. in a crash of the PDF parser), the files that the broken pool did not
+    finish are stored with status "crashed".
+
+    The store is rewritten in batches of ``config.batch_size`` rows, sorted by
+    discussion paper number, and replaces the old store only once complete.
+
+    Args:
+        files (dict[int, Path]): Pickled PDF content by discussion paper number.
+        store (Path): The parquet store.
+        config (FulltextConfig): Configuration of the extraction.
+
+    Returns
+    -------
+        pd.DataFrame: Number of files per status, with skipped files as
+        "unchanged".
+    """
+    checksums = {dp_number: file_checksum(path) for dp_number, path in files.items()}
+    previous = stored_checksums(store)
+    unchanged = {
+        dp_number
+        for dp_number, checksum in checksums.items()
+        if previous.get(dp_number) == checksum
+    }
+    pending = sorted(set(checksums) - unchanged)
+
+    processes = config.processes or os.cpu_count() or 1
+    counts = {"unchanged": len(unchanged)}
+    tmp_store = store.with_name(f"{store.name}.tmp")
+    store.parent.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(processes, len(pending))),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(config.memory_limit_mb,),
+    ) as executor:
+        extracted = _extract_texts(
+            executor, [files[dp_number] for dp_number in pending], config.timeout
+        )
+        new_rows = (
+            {"dp_number": dp_number, "sha256": checksums[dp_number]} | result
+            for dp_number, result in zip(pending, extracted, strict=True)
+        )
+        rows = heapq.merge(
+            _stored_rows(store, unchanged, config.batch_size),
+            new_rows,
+            key=operator.itemgetter("dp_number"),
+        )
+        with pq.ParquetWriter(
+            tmp_store, FULLTEXT_SCHEMA, compression=config.compression
+        ) as writer:
+            for batch in _batched(rows, config.batch_size):
+                for row in batch:
+                    if row["dp_number"] not in unchanged:
+                        status = str(row["status"])
+                        counts[status] = counts.get(status, 0) + 1
+                writer.write_table(pa.Table.from_pylist(batch, FULLTEXT_SCHEMA))
+    tmp_store.replace(store)
+    return pd.DataFrame({"status": list(counts), "files": list(counts.values())})
+
+
+def _stored_rows(
+    store: Path, dp_numbers: set[int], batch_size: int
+) -> Iterator[dict[str, object]]:
+    if not dp_numbers:
+        return
+    for batch in pq.ParquetFile(store).iter_batches(batch_size=batch_size):
+        for row in batch.to_pylist():
+            if row["dp_number"] in dp_numbers:
+                yield row
+
+
+def _batched(
+    rows: Iterable[dict[str, object]], n: int
+) -> Iterator[list[dict[str, object]]]:
+    batch: list[dict[str, object]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == n:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _extract_texts(
+    executor: ProcessPoolExecutor, paths: list[Path], timeout: int | None
+) -> Iterator[dict[str, object]]:
+    futures = [executor.submit(_extract_text, path, timeout) for path in paths]
+    return map(_future_result, futures)
+
+
+def _future_result(future: Future[dict[str, object]]) -> dict[str, object]:
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        return {"status": "crashed", "n_pages": None, "text": ""}
+
+
+def _init_worker(memory_limit_mb: int | None) -> None:
+    if resource is not None and memory_limit_mb is not None:
+        limit = memory_limit_mb * 1024**2
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+@contextlib.contextmanager
+def _time_limit(seconds: int | None) -> Iterator[None]:
+    """Raise an ExtractionTimeoutError in the block after ``seconds`` seconds."""
+    if seconds is None or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def _raise_timeout(_signum: int, _frame: object) -> None:
+        raise ExtractionTimeoutError
+
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _extract_text(path: Path, timeout: int | None) -> dict[str, object]:
+    try:
+        with _time_limit(timeout):
+            content = pickle.loads(path.read_bytes())  # S301
+            pages = PdfReader(io.BytesIO(content)).pages
+            text = "\n".join(page.extract_text() for page in pages)
+        # PDFs may decode to lone surrogates, which cannot be stored as UTF-8
+        text = text.encode("utf-8", errors="replace").decode("utf-8")
+    except ExtractionTimeoutError:
+        return {"status": "timeout", "n_pages": None, "text": ""}
+    except MemoryError:
+        return {"status": "memory", "n_pages": None, "text": ""}
+    except Exception:  # BLE001
+        return {"status": "error", "n_pages": None, "text": ""}
+    return {"status": "ok", "n_pages": len(pages), "text": text}
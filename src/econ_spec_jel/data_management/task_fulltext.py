@@ -0,0 +1,36 @@
+"""Task for extracting the full text of the downloaded discussion paper PDFs."""
+
+from pathlib import Path
+from typing import Annotated
+
+import pytask
+from pytask import Product
+
+from econ_spec_jel.config import DATACATALOGS, FULLTEXT_CONFIG, MAX_DP_NUMBER
+from econ_spec_jel.data_management.fulltext_helper import extract_fulltexts
+
+DOWNLOADED_FILES = {
+    dp_number: DATACATALOGS["raw"]["files"][f"{dp_number}"].path
+    for dp_number in range(1, MAX_DP_NUMBER + 1)
+    if DATACATALOGS["raw"]["files"][f"{dp_number}"].path.is_file()
+}
+
+
+@pytask.mark.skip()
+def task_extract_fulltext(
+    fulltext: Annotated[Path, DATACATALOGS["data"]["fulltext"], Product],
+    files: dict[int, Path] = DOWNLOADED_FILES,
+) -> Annotated[Path, DATACATALOGS["data"]["fulltext_report"]]:
+    """Extract the text of the downloaded PDFs into a parquet store.
+
+    Only files that are new or changed since the last run are parsed.
+
+    Args:
+        fulltext (Path): The parquet store with the text per discussion paper.
+        files (dict[int, Path]): Pickled PDF content by discussion paper number.
+
+    Returns
+    -------
+        pd.DataFrame: Number of files per extraction status.
+    """
+    return extract_fulltexts(files=files, store=fulltext, config=FULLTEXT_CONFIG)
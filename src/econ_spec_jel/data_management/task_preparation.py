@@ -1,17 +1,15 @@
 """Data preparation tasks."""
 
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
-
-
 from pathlib import Path
 from typing import Annotated
 
 import pandas as pd
 
 from econ_spec_jel.config import DATACATALOGS
+from econ_spec_jel.data_management.text_helper import (
+    download_nltk_resources,
+    tokenize_and_stem,
+)
 
 
 def task_prepare_data_for_analysis(
@@ -50,27 +48,8 @@ def _prepare_data_for_analysis(
 
 
 def _prepare_abstract(data: pd.DataFrame) -> pd.Series:
-    nltk.download("punkt")
-    nltk.download("stopwords")
-    tokens = _tokenize_abstract(data["abstract"])
-    return _stem_tokens(tokens)
-
-
-def _tokenize_abstract(sr: pd.Series) -> pd.Series:
-    stop_words = set(stopwords.words("english"))
-    cleaned_abstracts = sr.str.lower().str.replace(r"[^a-zA-Z]+", " ", regex=True)
-    # Tokenize and filter stop words
-    return pd.Series(
-        [
-            [word for word in word_tokenize(doc) if word not in stop_words]
-            for doc in cleaned_abstracts
-        ]
-    )
-
-
-def _stem_tokens(tokens: pd.Series) -> pd.Series:
-    stemmer = PorterStemmer()
-    return pd.Series([[stemmer.stem(token) for token in doc] for doc in tokens])
+    download_nltk_resources()
+    return tokenize_and_stem(data["abstract"])
 
 
 def _count_initial_and_returning_publication(data: pd.DataFrame) -> tuple[pd.Series]:
@@ -1,89 +1,121 @@
 """Module contains the task to prepare the topics data for the analysis."""
 
-from econ_spec_jel.config import DATACATALOGS
+from econ_spec_jel.config import DATACATALOGS, TOPIC_TREND_ESTIMATOR
+from econ_spec_jel.analysis.trend_helper import (
+    date_ordinals,
+    monthly_prevalence,
+    theil_sen_slopes,
+    weighted_ols_slopes,
+)
+from econ_spec_jel.text_model.topics_helper import documents_topics_long
 from typing import Annotated
 from pathlib import Path
 import pandas as pd
 import numpy as np
-import statsmodels.api as sm
 
 
-def task_documents_topics_melted(
+def task_topic_prevalence(
     documents_topics: Annotated[Path, DATACATALOGS["data"]["documents_topics"]],
-) -> Annotated[Path, DATACATALOGS["data"]["documents_topics_melted"]]:
-    """Prepare the documents_topics data for the analysis."""
-    return _get_documents_topics_melted(documents_topics)
-
-
-def _get_documents_topics_melted(documents_topics: pd.DataFrame) -> pd.DataFrame:
-    """Efficiently melt and transform the documents_topics DataFrame."""
-    melted = pd.melt(
-        documents_topics,
-        id_vars=["dp_number", "title", "publication_year_month"],
-        value_vars=[f"top_{i:03d}" for i in range(750)],
-        var_name="topic_number",
-        value_name="topic_present",
+    documents_metadata: Annotated[Path, DATACATALOGS["data"]["documents_metadata"]],
+) -> Annotated[Path, DATACATALOGS["data"]["topic_prevalence"]]:
+    """Aggregate the topic probabilities per publication month."""
+    return _get_topic_prevalence(documents_topics, documents_metadata)
+
+
+def _get_topic_prevalence(
+    documents_topics: np.ndarray, documents_metadata: pd.DataFrame
+) -> pd.DataFrame:
+    months, papers, sums = monthly_prevalence(
+        documents_topics, documents_metadata["publication_year_month"]
+    )
+    n_months, n_topics = sums.shape
+    return pd.DataFrame(
+        {
+            "publication_year_month": months.repeat(n_topics),
+            "topic_number": np.tile(np.arange(n_topics), n_months),
+            "papers": papers.repeat(n_topics),
+            "topic_present_sum": sums.ravel(),
+            "topic_present_mean": (sums / papers[:, None]).ravel(),
+        }
     )
-    melted["topic_number"] = melted["topic_number"].str[4:].astype(int)
-    return melted
 
 
-def task_slopes(
-    documents_topics_melted: Annotated[
-        Path, DATACATALOGS["data"]["documents_topics_melted"]
-    ],
-) -> Annotated[Path, DATACATALOGS["data"]["slopes"]]:
-    """Calculate the slopes of the topics."""
-    return _get_slopes(documents_topics_melted)
+def task_topic_trend_estimates(
+    topic_prevalence: Annotated[Path, DATACATALOGS["data"]["topic_prevalence"]],
+) -> Annotated[Path, DATACATALOGS["data"]["topic_trend_estimates"]]:
+    """Estimate robust trends of the monthly topic prevalence."""
+    return _get_topic_trend_estimates(topic_prevalence)
 
 
-def _get_slopes(data: pd.DataFrame) -> pd.DataFrame:
-    data["publication_ordinal"] = pd.to_datetime(data["publication_year_month"]).map(
-        pd.Timestamp.toordinal
+def _get_topic_trend_estimates(topic_prevalence: pd.DataFrame) -> pd.DataFrame:
+    prevalence = topic_prevalence.sort_values(
+        ["publication_year_month", "topic_number"]
     )
+    months = prevalence["publication_year_month"].unique()
+    topic_numbers = prevalence["topic_number"].unique()
+    means = prevalence["topic_present_mean"].to_numpy().reshape(len(months), -1)
+    papers = prevalence["papers"].to_numpy()[:: len(topic_numbers)]
+    ordinals = date_ordinals(pd.Series(months))
+    return pd.DataFrame(
+        {
+            "topic_number": topic_numbers,
+            "theil_sen_slope": theil_sen_slopes(means, ordinals),
+            # Equals the OLS slope on the individual documents.
+            "weighted_slope": weighted_ols_slopes(means, ordinals, papers),
+        }
+    )
+
 
-    slopes_df = (
-        data.groupby("topic_number").apply(_calculate_slope).reset_index(name="slope")
+def task_slopes(
+    topic_trend_estimates: Annotated[
+        Path, DATACATALOGS["data"]["topic_trend_estimates"]
+    ],
+) -> Annotated[Path, DATACATALOGS["data"]["slopes"]]:
+    """Rank the topics by the trend of their monthly prevalence."""
+    return _get_slopes(topic_trend_estimates, TOPIC_TREND_ESTIMATOR)
+
+
+def _get_slopes(topic_trend_estimates: pd.DataFrame, estimator: str) -> pd.DataFrame:
+    if estimator not in ("weighted_slope", "theil_sen_slope"):
+        msg = (
+            "Expected estimator to be 'weighted_slope' or 'theil_sen_slope', "
+            f"got {estimator}."
+        )
+        raise ValueError(msg)
+    slopes_df = topic_trend_estimates[["topic_number", estimator]].rename(
+        columns={estimator: "slope"}
     )
     slopes_df = slopes_df.dropna()  # Drop NaNs resulting from insufficient data points
     return slopes_df.sort_values(by="slope", ascending=False)
 
 
-def _calculate_slope(group: pd.DataFrame) -> float:
-    if group["topic_present"].notna().sum() > 1:
-        X = sm.add_constant(group["publication_ordinal"])
-        y = group["topic_present"].to_numpy()
-        model = sm.OLS(y, X).fit()
-        return model.params[1]
-    return np.nan
-
-
 def task_plotting_data(
-    documents_topics_melted: Annotated[
-        Path, DATACATALOGS["data"]["documents_topics_melted"]
-    ],
+    documents_topics: Annotated[Path, DATACATALOGS["data"]["documents_topics"]],
+    documents_metadata: Annotated[Path, DATACATALOGS["data"]["documents_metadata"]],
     slopes: Annotated[Path, DATACATALOGS["data"]["slopes"]],
     topics: Annotated[Path, DATACATALOGS["data"]["topics"]],
 ) -> Annotated[Path, DATACATALOGS["data"]["topics_plotting_data"]]:
     """Prepare the data for plotting."""
-    return _get_plotting_data(documents_topics_melted, topics, slopes)
+    return _get_plotting_data(documents_topics, documents_metadata, topics, slopes)
 
 
 def _get_plotting_data(
-    documents_topics_melted: pd.DataFrame, topics: pd.DataFrame, slopes: pd.DataFrame
+    documents_topics: np.ndarray,
+    documents_metadata: pd.DataFrame,
+    topics: pd.DataFrame,
+    slopes: pd.DataFrame,
 ) -> pd.DataFrame:
     top_up = slopes.head(5)["topic_number"]
     top_down = slopes.tail(5)["topic_number"]
 
-    relevant_topics = pd.concat([top_up, top_down])
-    out = documents_topics_melted[
-        documents_topics_melted["topic_number"].isin(relevant_topics)
-    ]
-    out = out.merge(topics, left_on="topic_number", right_index=True)
-    tokens = [f"token_{i}" for i in range(20)]
-    out["topic_words"] = out[tokens].agg(", ".join, axis=1)
-    out["trend"] = np.where(out["topic_number"].isin(top_up), "Upward", "Downward")
-    out["topic_words_8"] = out.topic_words.str.split(", ").apply(
-        lambda x: [i.split(" ")[0] for i in x][:8]
+    relevant_topics = np.sort(pd.concat([top_up, top_down]).unique())
+    out = documents_topics_long(documents_topics, documents_metadata, relevant_topics)
+    topic_terms = (
+        topics.sort_values(["topic_number", "rank"])
+        .groupby("topic_number")["term"]
+        .agg(list)
     )
+    out["topic_words"] = out["topic_number"].map(topic_terms.str.join(", "))
+    out["trend"] = np.where(out["topic_number"].isin(top_up), "Upward", "Downward")
+    out["topic_words_8"] = out["topic_number"].map(topic_terms.str[:8])
     return out
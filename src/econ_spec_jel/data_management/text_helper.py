@@ -0,0 +1,65 @@
+"""Helper functions for tokenizing and stemming abstracts and full texts."""
+
+import functools
+
+import nltk
+import pandas as pd
+from nltk.corpus import stopwords
+from nltk.stem import PorterStemmer
+from nltk.tokenize import word_tokenize
+
+NLTK_RESOURCES = ("punkt", "stopwords")
+
+
+def download_nltk_resources() -> None:
+    """Download the nltk tokenizer and stop words, unless they are up to date."""
+    for resource in NLTK_RESOURCES:
+        nltk.download(resource, quiet=True)
+
+
+def tokenize_texts(sr: pd.Series) -> pd.Series:
+    """Lowercase the texts, keep letters only and drop English stop words.
+
+    Args:
+        sr (pd.Series): Texts.
+
+    Returns
+    -------
+        pd.Series: List of tokens per text.
+    """
+    stop_words = set(stopwords.words("english"))
+    cleaned_texts = sr.str.lower().str.replace(r"[^a-zA-Z]+", " ", regex=True)
+    return pd.Series(
+        [
+            [word for word in word_tokenize(doc) if word not in stop_words]
+            for doc in cleaned_texts
+        ]
+    )
+
+
+def stem_tokens(tokens: pd.Series) -> pd.Series:
+    """Stem the tokens with the Porter stemmer.
+
+    Args:
+        tokens (pd.Series): List of tokens per text.
+
+    Returns
+    -------
+        pd.Series: List of stemmed tokens per text.
+    """
+    # Each distinct token is stemmed once, which matters for long full texts.
+    stem = functools.cache(PorterStemmer().stem)
+    return pd.Series([[stem(token) for token in doc] for doc in tokens])
+
+
+def tokenize_and_stem(sr: pd.Series) -> pd.Series:
+    """Tokenize and stem the texts like the abstracts of the training data.
+
+    Args:
+        sr (pd.Series): Texts.
+
+    Returns
+    -------
+        pd.Series: List of stemmed tokens per text.
+    """
+    return stem_tokens(tokenize_texts(sr))
@@ -0,0 +1,201 @@
+"""Contains custom pytask nodes for artifacts that should not be pickled."""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from gensim.corpora import MmCorpus
+from gensim.utils import SaveLoad
+from pytask import get_state_of_path
+from pytask import hash_value
+from scipy import sparse
+
+
+@dataclass
+class MmCorpusNode:
+    """A node for a bag-of-words corpus stored in the Matrix Market format.
+
+    The corpus is written document by document and loaded as a streamed
+    :class:`gensim.corpora.MmCorpus`, so neither saving nor loading holds the whole
+    corpus in memory. An index file next to ``path`` allows random access by
+    document position.
+
+    Attributes
+    ----------
+    name : str
+        Name of the node which makes it identifiable in the DAG.
+    path : Path
+        The path to the ``.mm`` file.
+    attributes : dict[Any, Any]
+        A dictionary to store additional information of the task.
+
+    """
+
+    name: str
+    path: Path
+    attributes: dict[Any, Any] = field(default_factory=dict)
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = str(hash_value(self.path))
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def state(self) -> str | None:
+        """Return the modification time of the corpus file."""
+        return get_state_of_path(self.path)
+
+    def load(self, is_product: bool = False) -> "MmCorpus | MmCorpusNode":  # FBT001
+        """Load the corpus as a stream of documents."""
+        if is_product:
+            return self
+        return MmCorpus(str(self.path))
+
+    def save(self, value: Iterable[list[tuple[int, float]]]) -> None:
+        """Serialize an iterable of bag-of-words documents."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        MmCorpus.serialize(str(self.path), value)
+
+
+@dataclass
+class NumpyNode:
+    """A node for a NumPy array stored in the ``.npy`` format.
+
+    The array is loaded memory-mapped and read-only, so tasks only read the parts of
+    the array they use into memory.
+
+    Attributes
+    ----------
+    name : str
+        Name of the node which makes it identifiable in the DAG.
+    path : Path
+        The path to the ``.npy`` file.
+    attributes : dict[Any, Any]
+        A dictionary to store additional information of the task.
+
+    """
+
+    name: str
+    path: Path
+    attributes: dict[Any, Any] = field(default_factory=dict)
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = str(hash_value(self.path))
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def state(self) -> str | None:
+        """Return the modification time of the array file."""
+        return get_state_of_path(self.path)
+
+    def load(self, is_product: bool = False) -> "np.ndarray | NumpyNode":  # FBT001
+        """Load the array memory-mapped."""
+        if is_product:
+            return self
+        return np.load(self.path, mmap_mode="r")
+
+    def save(self, value: np.ndarray) -> None:
+        """Save the array."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(self.path, value)
+
+
+@dataclass
+class SparseMatrixNode:
+    """A node for a SciPy sparse matrix stored in the compressed ``.npz`` format.
+
+    Attributes
+    ----------
+    name : str
+        Name of the node which makes it identifiable in the DAG.
+    path : Path
+        The path to the ``.npz`` file.
+    attributes : dict[Any, Any]
+        A dictionary to store additional information of the task.
+
+    """
+
+    name: str
+    path: Path
+    attributes: dict[Any, Any] = field(default_factory=dict)
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = str(hash_value(self.path))
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def state(self) -> str | None:
+        """Return the modification time of the matrix file."""
+        return get_state_of_path(self.path)
+
+    def load(
+        self,
+        is_product: bool = False,  # FBT001
+    ) -> "sparse.csr_array | SparseMatrixNode":
+        """Load the sparse matrix."""
+        if is_product:
+            return self
+        return sparse.csr_array(sparse.load_npz(self.path))
+
+    def save(self, value: sparse.sparray) -> None:
+        """Save the sparse matrix."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        sparse.save_npz(self.path, value)
+
+
+@dataclass
+class GensimNode:
+    """A node for a gensim object stored in gensim's native format.
+
+    Large numpy arrays of the object (e.g. the topic-term statistics of an LDA model)
+    are stored in separate ``.npy`` files next to ``path``. With ``mmap="r"`` they are
+    loaded memory-mapped and read-only, so loading is fast and tasks share the pages
+    of the arrays through the operating system's file cache. Objects which are
+    modified after loading need to be loaded with ``mmap=None``.
+
+    Attributes
+    ----------
+    name : str
+        Name of the node which makes it identifiable in the DAG.
+    path : Path
+        The path to the main file of the object.
+    loader : type[SaveLoad]
+        The gensim class whose ``load`` method restores the object.
+    mmap : str | None
+        Memory-map mode of the separately stored arrays.
+    attributes : dict[Any, Any]
+        A dictionary to store additional information of the task.
+
+    """
+
+    name: str
+    path: Path
+    loader: type[SaveLoad] = SaveLoad
+    mmap: str | None = "r"
+    attributes: dict[Any, Any] = field(default_factory=dict)
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = str(hash_value(self.path))
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def state(self) -> str | None:
+        """Return the modification time of the main file, which is written last."""
+        return get_state_of_path(self.path)
+
+    def load(self, is_product: bool = False) -> "SaveLoad | GensimNode":  # FBT001
+        """Load the object."""
+        if is_product:
+            return self
+        return self.loader.load(str(self.path), mmap=self.mmap)
+
+    def save(self, value: SaveLoad) -> None:
+        """Save the object, storing arrays larger than 1 MiB separately."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        value.save(str(self.path), sep_limit=1024**2)
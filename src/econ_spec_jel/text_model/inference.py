@@ -0,0 +1,155 @@
+"""Score new abstracts against the trained LDA topic model.
+
+The model and dictionary are loaded once and kept in memory, so abstracts can be
+scored without running the pipeline. From the command line, abstracts are either
+passed as arguments or read from stdin, one per line::
+
+    python -m econ_spec_jel.text_model.inference "An abstract." --top-k 5
+    cat abstracts.txt | python -m econ_spec_jel.text_model.inference
+
+Each abstract is answered with one JSON line of its most probable topics.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+from gensim.corpora import Dictionary
+from gensim.matutils import Sparse2Corpus
+from gensim.models import LdaModel
+
+from econ_spec_jel.config import DATACATALOGS
+from econ_spec_jel.data_management.text_helper import (
+    download_nltk_resources,
+    tokenize_and_stem,
+)
+from econ_spec_jel.text_model.vocabulary_helper import bag_of_words_matrix
+
+
+class TopicInference:
+    """Topic distributions of new abstracts with an LRU cache of the results.
+
+    Args:
+        topic_model (LdaModel): Trained LDA model.
+        gensim_dictionary (Dictionary): Dictionary the model was trained with.
+        cache_size (int): Maximum number of cached topic distributions.
+
+    """
+
+    def __init__(
+        self,
+        topic_model: LdaModel,
+        gensim_dictionary: Dictionary,
+        cache_size: int = 10_000,
+    ) -> None:
+        self.topic_model = topic_model
+        self.gensim_dictionary = gensim_dictionary
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    @classmethod
+    def from_catalog(cls, cache_size: int = 10_000) -> "TopicInference":
+        """Load the trained model and dictionary from the topic_model catalog."""
+        download_nltk_resources()
+        return cls(
+            topic_model=DATACATALOGS["topic_model"]["lda"].load(),
+            gensim_dictionary=DATACATALOGS["topic_model"]["dictionary"].load(),
+            cache_size=cache_size,
+        )
+
+    def topic_distributions(self, abstracts: Sequence[str]) -> np.ndarray:
+        """Infer the topic distribution of each abstract.
+
+        Abstracts that are not cached are tokenized like the training data and
+        inferred in one batch.
+
+        Args:
+            abstracts (Sequence[str]): Raw abstracts.
+
+        Returns
+        -------
+            np.ndarray: Abstracts x topics matrix of topic probabilities.
+        """
+        keys = [hashlib.sha256(abstract.encode()).hexdigest() for abstract in abstracts]
+        missing = {
+            key: abstract
+            for key, abstract in zip(keys, abstracts, strict=True)
+            if key not in self._cache
+        }
+        if missing:
+            inferred = self._infer(list(missing.values()))
+            for key, distribution in zip(missing, inferred, strict=True):
+                self._cache[key] = distribution
+        for key in keys:
+            self._cache.move_to_end(key)
+
+        out = (
+            np.stack([self._cache[key] for key in keys])
+            if keys
+            else np.empty((0, self.topic_model.num_topics), np.float32)
+        )
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return out
+
+    def top_topics(
+        self, abstracts: Sequence[str], top_k: int = 5
+    ) -> list[list[tuple[int, float]]]:
+        """List the most probable topics of each abstract.
+
+        Args:
+            abstracts (Sequence[str]): Raw abstracts.
+            top_k (int): Number of topics per abstract.
+
+        Returns
+        -------
+            list[list[tuple[int, float]]]: Topic number and probability, ordered by
+            decreasing probability.
+        """
+        distributions = self.topic_distributions(abstracts)
+        order = np.argsort(-distributions, axis=1, kind="stable")[:, :top_k]
+        return [
+            [(int(topic), float(distribution[topic])) for topic in topics]
+            for distribution, topics in zip(distributions, order, strict=True)
+        ]
+
+    def _infer(self, abstracts: list[str]) -> np.ndarray:
+        tokens = tokenize_and_stem(pd.Series(abstracts))
+        bag_of_words = bag_of_words_matrix(tokens, self.gensim_dictionary)
+        corpus = list(Sparse2Corpus(bag_of_words, documents_columns=False))
+        gamma, _ = self.topic_model.inference(corpus)
+        return (gamma / gamma.sum(axis=1, keepdims=True)).astype(np.float32)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Score abstracts given as arguments or read line by line from stdin."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("abstracts", nargs="*", help="Abstracts to score.")
+    parser.add_argument("--top-k", type=int, default=5, help="Topics per abstract.")
+    args = parser.parse_args(argv)
+
+    inference = TopicInference.from_catalog()
+    if args.abstracts:
+        _write_top_topics(inference, args.abstracts, args.top_k)
+    else:
+        for line in sys.stdin:
+            if line.strip():
+                _write_top_topics(inference, [line.strip()], args.top_k)
+
+
+def _write_top_topics(
+    inference: TopicInference, abstracts: list[str], top_k: int
+) -> None:
+    top_topics = inference.top_topics(abstracts, top_k=top_k)
+    for abstract, topics in zip(abstracts, top_topics, strict=True):
+        sys.stdout.write(json.dumps({"abstract": abstract, "topics": topics}) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
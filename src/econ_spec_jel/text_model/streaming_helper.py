@@ -0,0 +1,140 @@
+"""Helper functions for training the topic model on full texts in bounded chunks.
+
+Full texts do not fit into memory as a whole. Every step therefore reads its input
+from disk in batches of documents and writes its output batch by batch: the texts
+are tokenized into a parquet store, the vocabulary is counted and the bag-of-words
+corpus is streamed from that store, and the LDA model is trained on the corpus
+streamed from disk.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from gensim.corpora import Dictionary
+from gensim.matutils import Sparse2Corpus
+
+from econ_spec_jel.data_management.text_helper import (
+    download_nltk_resources,
+    tokenize_and_stem,
+)
+from econ_spec_jel.text_model.vocabulary_helper import bag_of_words_matrix
+
+TOKENS_SCHEMA = pa.schema(
+    [("dp_number", pa.int64()), ("tokens", pa.large_list(pa.string()))]
+)
+
+
+def tokenize_fulltexts(
+    fulltext: Path, tokens: Path, batch_size: int, compression: str
+) -> pd.Series:
+    """Tokenize and stem the extracted full texts batch by batch.
+
+    The texts are tokenized like the abstracts. Files whose extraction failed are
+    left out.
+
+    Args:
+        fulltext (Path): The parquet store with the text per discussion paper.
+        tokens (Path): The parquet store to write the tokens per discussion paper to.
+        batch_size (int): Number of documents held in memory at a time.
+        compression (str): Compression of the tokens store.
+
+    Returns
+    -------
+        pd.Series: Discussion paper numbers in the order of the tokens store.
+    """
+    download_nltk_resources()
+    dp_numbers = []
+    tokens.parent.mkdir(parents=True, exist_ok=True)
+    with pq.ParquetWriter(tokens, TOKENS_SCHEMA, compression=compression) as writer:
+        for batch in pq.ParquetFile(fulltext).iter_batches(
+            batch_size=batch_size, columns=["dp_number", "status", "text"]
+        ):
+            extracted = batch.filter(pc.equal(batch["status"], "ok"))
+            texts = pd.Series(extracted["text"].to_pylist(), dtype=object)
+            stemmed = tokenize_and_stem(texts)
+            writer.write_table(
+                pa.table(
+                    {"dp_number": extracted["dp_number"], "tokens": stemmed.tolist()},
+                    schema=TOKENS_SCHEMA,
+                )
+            )
+            dp_numbers.extend(extracted["dp_number"].to_pylist())
+    return pd.Series(dp_numbers, name="dp_number", dtype="int64")
+
+
+def iter_token_batches(tokens: Path, batch_size: int) -> Iterator[pd.Series]:
+    """Read the tokenized documents batch by batch.
+
+    Args:
+        tokens (Path): The parquet store with the tokens per discussion paper.
+        batch_size (int): Number of documents per batch.
+
+    Yields
+    ------
+        pd.Series: List of tokens per document.
+    """
+    for batch in pq.ParquetFile(tokens).iter_batches(
+        batch_size=batch_size, columns=["tokens"]
+    ):
+        # Unlike to_pylist, to_pandas creates each distinct string of a batch once.
+        yield pd.Series(
+            [doc.tolist() for doc in batch["tokens"].to_pandas()], dtype=object
+        )
+
+
+def build_streamed_vocabulary(
+    tokens: Path,
+    batch_size: int,
+    no_below: int = 5,
+    no_above: float = 0.5,
+    keep_n: int | None = 100_000,
+) -> Dictionary:
+    """Build the filtered vocabulary of the tokenized documents batch by batch.
+
+    Equals :func:`~econ_spec_jel.text_model.vocabulary_helper.build_vocabulary` as
+    long as there are fewer than two million distinct tokens. Beyond that, gensim
+    drops the rarest tokens while counting to bound the memory.
+
+    Args:
+        tokens (Path): The parquet store with the tokens per discussion paper.
+        batch_size (int): Number of documents held in memory at a time.
+        no_below (int): Minimum number of documents a token occurs in.
+        no_above (float): Maximum share of documents a token occurs in.
+        keep_n (int | None): Maximum number of tokens, keeping the ones with the
+            highest document frequency.
+
+    Returns
+    -------
+        Dictionary: Gensim dictionary.
+    """
+    gensim_dictionary = Dictionary()
+    for texts in iter_token_batches(tokens, batch_size):
+        gensim_dictionary.add_documents(texts)
+    gensim_dictionary.filter_extremes(
+        no_below=no_below, no_above=no_above, keep_n=keep_n
+    )
+    return gensim_dictionary
+
+
+def stream_corpus(
+    tokens: Path, gensim_dictionary: Dictionary, batch_size: int
+) -> Iterator[list[tuple[int, int]]]:
+    """Convert the tokenized documents to bag-of-words documents batch by batch.
+
+    Args:
+        tokens (Path): The parquet store with the tokens per discussion paper.
+        gensim_dictionary (Dictionary): Gensim dictionary with consecutive ids.
+        batch_size (int): Number of documents held in memory at a time.
+
+    Yields
+    ------
+        list[tuple[int, int]]: Token id and count per document, equal to
+        ``doc2bow`` of the document.
+    """
+    for texts in iter_token_batches(tokens, batch_size):
+        bag_of_words = bag_of_words_matrix(texts, gensim_dictionary)
+        yield from Sparse2Corpus(bag_of_words, documents_columns=False)
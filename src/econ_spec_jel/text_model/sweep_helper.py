@@ -0,0 +1,204 @@
+"""Helper functions for sweeping the hyperparameters of the LDA topic model."""
+
+import contextlib
+import dataclasses
+import functools
+import itertools
+import multiprocessing
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from gensim.corpora import Dictionary
+from gensim.models import CoherenceModel, LdaModel
+
+from econ_spec_jel.config import LdaConfig, LdaSweepConfig
+
+BLAS_THREAD_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+COHERENCE_MEASURES = ("c_v", "u_mass")
+
+_WORKER_DATA: dict[str, object] = {}
+
+
+def sweep_grid(sweep_config: LdaSweepConfig) -> list[dict[str, Any]]:
+    """List all combinations of topic counts and priors of the sweep.
+
+    Args:
+        sweep_config (LdaSweepConfig): Configuration of the sweep.
+
+    Returns
+    -------
+        list[dict[str, Any]]: Hyperparameters per model, as keyword arguments of
+        :class:`~econ_spec_jel.config.LdaConfig`.
+    """
+    return [
+        {"num_topics": num_topics, "alpha": alpha, "eta": eta}
+        for num_topics, alpha, eta in itertools.product(
+            sweep_config.num_topics, sweep_config.alpha, sweep_config.eta
+        )
+    ]
+
+
+def holdout_mask(n_documents: int, holdout_share: float, seed: int) -> np.ndarray:
+    """Draw a random subset of documents to hold out from training.
+
+    Args:
+        n_documents (int): Number of documents.
+        holdout_share (float): Share of documents to hold out.
+        seed (int): Random seed.
+
+    Returns
+    -------
+        np.ndarray: Boolean mask of the held-out documents.
+    """
+    rng = np.random.default_rng(seed)
+    is_holdout = np.zeros(n_documents, dtype=bool)
+    n_holdout = round(n_documents * holdout_share)
+    is_holdout[rng.choice(n_documents, size=n_holdout, replace=False)] = True
+    return is_holdout
+
+
+def run_sweep(
+    corpus: list[list[tuple[int, float]]],
+    texts: pd.Series,
+    gensim_dictionary: Dictionary,
+    lda_config: LdaConfig,
+    sweep_config: LdaSweepConfig,
+) -> pd.DataFrame:
+    """Train and evaluate one LDA model per grid point in parallel processes.
+
+    The training data is sent to each worker process once. Worker processes are
+    started with a limited number of BLAS threads and the coherence models are
+    computed within the worker, so the sweep does not use more than ``processes *
+    blas_threads`` cores.
+
+    Args:
+        corpus (list[list[tuple[int, float]]]): Bag-of-words documents.
+        texts (pd.Series): Tokenized documents, aligned with ``corpus``.
+        gensim_dictionary (Dictionary): Gensim dictionary of the corpus.
+        lda_config (LdaConfig): Hyperparameters not varied by the sweep.
+        sweep_config (LdaSweepConfig): Configuration of the sweep.
+
+    Returns
+    -------
+        pd.DataFrame: Hyperparameters, coherence (c_v and u_mass), held-out
+        perplexity and training time of each model.
+    """
+    is_holdout = holdout_mask(
+        len(corpus), sweep_config.holdout_share, sweep_config.random_state
+    )
+    train_corpus = [
+        doc for doc, holdout in zip(corpus, is_holdout, strict=True) if not holdout
+    ]
+    heldout_corpus = [
+        doc for doc, holdout in zip(corpus, is_holdout, strict=True) if holdout
+    ]
+    train_texts = [list(doc) for doc in texts[~is_holdout]]
+
+    grid = sweep_grid(sweep_config)
+    configs = [dataclasses.replace(lda_config, **params) for params in grid]
+    processes = sweep_config.processes or max(
+        1, (os.cpu_count() or 1) // sweep_config.blas_threads
+    )
+    with (
+        _limited_blas_threads(sweep_config.blas_threads),
+        ProcessPoolExecutor(
+            max_workers=min(processes, len(configs)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(train_corpus, heldout_corpus, train_texts, gensim_dictionary),
+        ) as executor,
+    ):
+        results = list(
+            executor.map(
+                functools.partial(_evaluate, topn=sweep_config.coherence_topn),
+                configs,
+            )
+        )
+    return pd.DataFrame(
+        [params | result for params, result in zip(grid, results, strict=True)]
+    )
+
+
+@contextlib.contextmanager
+def _limited_blas_threads(threads: int) -> Iterator[None]:
+    """Limit the BLAS threads of processes started within the context."""
+    previous = {
+        variable: os.environ.get(variable) for variable in BLAS_THREAD_VARIABLES
+    }
+    os.environ.update(dict.fromkeys(BLAS_THREAD_VARIABLES, str(threads)))
+    try:
+        yield
+    finally:
+        for variable, value in previous.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+
+
+def _init_worker(
+    train_corpus: list[list[tuple[int, float]]],
+    heldout_corpus: list[list[tuple[int, float]]],
+    train_texts: list[list[str]],
+    gensim_dictionary: Dictionary,
+) -> None:
+    _WORKER_DATA.update(
+        train_corpus=train_corpus,
+        heldout_corpus=heldout_corpus,
+        train_texts=train_texts,
+        gensim_dictionary=gensim_dictionary,
+    )
+
+
+def _evaluate(config: LdaConfig, topn: int) -> dict[str, float]:
+    train_corpus = _WORKER_DATA["train_corpus"]
+    heldout_corpus = _WORKER_DATA["heldout_corpus"]
+    gensim_dictionary = _WORKER_DATA["gensim_dictionary"]
+
+    started = time.perf_counter()
+    topic_model = LdaModel(
+        corpus=train_corpus,
+        id2word=gensim_dictionary,
+        chunksize=config.chunksize,
+        alpha=config.alpha,
+        eta=config.eta,
+        iterations=config.iterations,
+        num_topics=config.num_topics,
+        passes=config.passes,
+        eval_every=None,
+        random_state=config.random_state,
+    )
+    wall_time = time.perf_counter() - started
+
+    # Scaled to the size of the training corpus, the held-out documents are evaluated
+    # as a sample of it rather than as a corpus of their own.
+    per_word_bound = topic_model.log_perplexity(
+        heldout_corpus, total_docs=len(train_corpus)
+    )
+    coherence = {
+        measure: CoherenceModel(
+            model=topic_model,
+            texts=_WORKER_DATA["train_texts"],
+            corpus=train_corpus,
+            dictionary=gensim_dictionary,
+            coherence=measure,
+            topn=topn,
+            processes=1,
+        ).get_coherence()
+        for measure in COHERENCE_MEASURES
+    }
+    return coherence | {
+        "heldout_perplexity": np.exp2(-per_word_bound),
+        "wall_time": wall_time,
+    }
@@ -0,0 +1,101 @@
+"""Tasks for LDA topic modelling of the full texts in bounded chunks."""
+
+import dataclasses
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Annotated
+
+import pandas as pd
+from gensim.corpora import Dictionary
+from gensim.models import LdaModel
+from pytask import Product
+
+from econ_spec_jel.config import DATACATALOGS, FULLTEXT_CONFIG, LDA_CONFIG
+from econ_spec_jel.text_model.streaming_helper import (
+    build_streamed_vocabulary,
+    stream_corpus,
+    tokenize_fulltexts,
+)
+from econ_spec_jel.text_model.task_model import _train_lda
+
+
+def task_tokenize_fulltext(
+    fulltext: Annotated[Path, DATACATALOGS["data"]["fulltext"]],
+    tokens: Annotated[Path, DATACATALOGS["fulltext_model"]["tokens"], Product],
+) -> Annotated[Path, DATACATALOGS["fulltext_model"]["trained_dp_numbers"]]:
+    """Tokenize and stem the full texts like the abstracts.
+
+    Args:
+        fulltext (Path): The parquet store with the text per discussion paper.
+        tokens (Path): The parquet store with the tokens per discussion paper.
+
+    Returns
+    -------
+        pd.Series: The discussion papers the topic model is trained on.
+    """
+    return tokenize_fulltexts(
+        fulltext=fulltext,
+        tokens=tokens,
+        batch_size=FULLTEXT_CONFIG.batch_size,
+        compression=FULLTEXT_CONFIG.compression,
+    )
+
+
+def task_fulltext_vocabulary(
+    tokens: Annotated[Path, DATACATALOGS["fulltext_model"]["tokens"]],
+) -> Annotated[
+    tuple[Dictionary, Iterator[list[tuple[int, int]]]],
+    (
+        DATACATALOGS["fulltext_model"]["dictionary"],
+        DATACATALOGS["fulltext_model"]["corpus"],
+    ),
+]:
+    """Create the gensim dictionary and the corpus from the tokenized full texts.
+
+    Args:
+        tokens (Path): The parquet store with the tokens per discussion paper.
+
+    Returns
+    -------
+        tuple[Dictionary, Iterator]: Gensim dictionary and bag-of-words documents,
+        streamed to disk as a Matrix Market corpus.
+
+    """
+    gensim_dictionary = build_streamed_vocabulary(
+        tokens,
+        batch_size=FULLTEXT_CONFIG.batch_size,
+        no_below=LDA_CONFIG.no_below,
+        no_above=LDA_CONFIG.no_above,
+    )
+    corpus = stream_corpus(
+        tokens, gensim_dictionary, batch_size=FULLTEXT_CONFIG.batch_size
+    )
+    return gensim_dictionary, corpus
+
+
+def task_train_fulltext_topic_model(
+    gensim_dictionary: Annotated[Path, DATACATALOGS["fulltext_model"]["dictionary"]],
+    corpus: Annotated[Path, DATACATALOGS["fulltext_model"]["corpus"]],
+) -> Annotated[
+    tuple[LdaModel, pd.DataFrame],
+    (
+        DATACATALOGS["fulltext_model"]["lda"],
+        DATACATALOGS["fulltext_model"]["training_report"],
+    ),
+]:
+    """Full-text analysis via Latent Dirichlet Allocation (LDA) topic modelling.
+
+    Args:
+        gensim_dictionary (Dictionary): Gensim dictionary of the full texts.
+        corpus (MmCorpus): Streamed corpus of tokenized full texts.
+
+    Returns
+    -------
+        tuple[LdaModel, pd.DataFrame]: Trained LDA model and the wall time and
+        perplexity per pass.
+    """
+    return _train_lda(
+        corpus=corpus,
+        gensim_dictionary=gensim_dictionary,
+        config=dataclasses.replace(LDA_CONFIG, chunksize=FULLTEXT_CONFIG.lda_chunksize),
+    )
@@ -1,94 +1,433 @@
 """Tasks for text analysis via LDA topic modelling."""
 
-from econ_spec_jel.config import DATACATALOGS, NUM_TOPICS
+from econ_spec_jel.config import DATACATALOGS, LDA_CONFIG, LdaConfig
+import copy
+import itertools
+from collections.abc import Iterable
+import os
+import time
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Annotated
+from pytask import PathNode
 from gensim.corpora import Dictionary
-from gensim.models import LdaModel
+from gensim.models import LdaModel, LdaMulticore
+from gensim.matutils import Sparse2Corpus
+from gensim.models.callbacks import Metric
 
+from econ_spec_jel.text_model.vocabulary_helper import (
+    bag_of_words_matrix,
+    build_vocabulary,
+)
 
-def task_gensim_dictionary(
-    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
-) -> Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]]:
-    """Create a gensim dictionary from the text data.
 
-    Args:
-        data (pd.DataFrame): Data with abstracts.
+# Files written per artifact next to its main file. gensim stores the topic-term
+# statistics of the LDA model separately only if they are larger than 1 MiB.
+ARTIFACT_FILE_SUFFIXES = {
+    "lda": ("", ".state", ".id2word", ".expElogbeta.npy", ".state.sstats.npy"),
+    "dictionary": ("",),
+    "corpus": ("", ".index"),
+}
 
-    Returns
-    -------
-        Dictionary: Gensim dictionary.
 
-    """
-    return _get_gensim_dictionary(data["abstract_tokenized"])
+def _artifact_path(name: str) -> Path:
+    return DATACATALOGS["topic_model"][name].path
 
 
-def task_corpus(
-    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
-    gensim_dictionary: Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]],
-) -> Annotated[Path, DATACATALOGS["topic_model"]["corpus"]]:
-    """Create a corpus from the text data.
+def _topic_model_snapshot_exists() -> bool:
+    return all(
+        DATACATALOGS["topic_model"][name].path.is_file()
+        for name in ["lda_previous", "trained_dp_numbers_previous"]
+    )
 
-    Args:
-        data (pd.DataFrame): Data with abstracts.
-        gensim_dictionary (Dictionary): Gensim dictionary.
 
-    Returns
-    -------
-        list: Corpus.
+if LDA_CONFIG.warm_start and _topic_model_snapshot_exists():
 
-    """
-    return [gensim_dictionary.doc2bow(doc) for doc in data["abstract_tokenized"]]
+    def task_extend_gensim_dictionary(
+        data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+        topic_model: Annotated[Path, DATACATALOGS["topic_model"]["lda_previous"]],
+        trained_dp_numbers: Annotated[
+            Path, DATACATALOGS["topic_model"]["trained_dp_numbers_previous"]
+        ],
+    ) -> Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]]:
+        """Extend the dictionary of the snapshot LDA model by the new documents.
+
+        Fails if the vocabulary of the new documents has drifted too far from the
+        snapshot, see :class:`~econ_spec_jel.config.LdaConfig`.
+
+        Args:
+            data (pd.DataFrame): Data with abstracts.
+            topic_model (LdaModel): Snapshot of the LDA model trained from scratch.
+            trained_dp_numbers (pd.Series): The discussion papers the snapshot has
+                been trained on.
+
+        Returns
+        -------
+            Dictionary: Gensim dictionary with stable ids for the known tokens.
+
+        """
+        is_new = ~data["dp_number"].isin(trained_dp_numbers).to_numpy()
+        _fail_if_vocabulary_drifted(
+            topic_model.id2word,
+            data["abstract_tokenized"],
+            is_new,
+            LDA_CONFIG.drift_threshold,
+        )
+        return _extend_gensim_dictionary(
+            topic_model.id2word,
+            data.loc[is_new, "abstract_tokenized"],
+            LDA_CONFIG.no_below,
+        )
+
+    def task_corpus(
+        data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+        gensim_dictionary: Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]],
+    ) -> Annotated[Path, DATACATALOGS["topic_model"]["corpus"]]:
+        """Create a corpus from the text data.
+
+        Args:
+            data (pd.DataFrame): Data with abstracts.
+            gensim_dictionary (Dictionary): Gensim dictionary.
+
+        Returns
+        -------
+            Sparse2Corpus: Bag-of-words documents, streamed to disk as a Matrix Market
+            corpus.
+
+        """
+        bag_of_words = bag_of_words_matrix(
+            data["abstract_tokenized"], gensim_dictionary
+        )
+        return Sparse2Corpus(bag_of_words, documents_columns=False)
+
+    def task_update_topic_model(
+        data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+        gensim_dictionary: Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]],
+        corpus: Annotated[Path, DATACATALOGS["topic_model"]["corpus"]],
+        topic_model: Annotated[Path, DATACATALOGS["topic_model"]["lda_previous"]],
+        trained_dp_numbers: Annotated[
+            Path, DATACATALOGS["topic_model"]["trained_dp_numbers_previous"]
+        ],
+    ) -> Annotated[
+        tuple[LdaModel, pd.DataFrame, pd.Series],
+        (
+            DATACATALOGS["topic_model"]["lda"],
+            DATACATALOGS["topic_model"]["training_report"],
+            DATACATALOGS["topic_model"]["trained_dp_numbers"],
+        ),
+    ]:
+        """Update the snapshot LDA model online with the documents it has not seen.
+
+        Args:
+            data (pd.DataFrame): Data with abstracts.
+            gensim_dictionary (Dictionary): Extended gensim dictionary.
+            corpus (MmCorpus): Streamed corpus of tokenized words.
+            topic_model (LdaModel): Snapshot of the LDA model trained from scratch.
+            trained_dp_numbers (pd.Series): The discussion papers the snapshot has
+                been trained on.
+
+        Returns
+        -------
+            tuple[LdaModel, pd.DataFrame, pd.Series]: Updated LDA model, the wall
+            time and perplexity of the update and the discussion papers the model
+            has been trained on.
+        """
+        is_new = ~data["dp_number"].isin(trained_dp_numbers).to_numpy()
+        topic_model, training_report = _update_lda(
+            topic_model=topic_model,
+            corpus=corpus,
+            new_corpus=[corpus[i] for i in np.flatnonzero(is_new)],
+            gensim_dictionary=gensim_dictionary,
+            config=LDA_CONFIG,
+        )
+        return topic_model, training_report, data["dp_number"]
+
+else:
+
+    def task_vocabulary(
+        data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+    ) -> Annotated[
+        tuple[Dictionary, Sparse2Corpus],
+        (
+            DATACATALOGS["topic_model"]["dictionary"],
+            DATACATALOGS["topic_model"]["corpus"],
+        ),
+    ]:
+        """Create the gensim dictionary and the corpus from the text data.
+
+        Args:
+            data (pd.DataFrame): Data with abstracts.
+
+        Returns
+        -------
+            tuple[Dictionary, Sparse2Corpus]: Gensim dictionary and bag-of-words
+            documents, streamed to disk as a Matrix Market corpus.
+
+        """
+        gensim_dictionary, bag_of_words = build_vocabulary(
+            data["abstract_tokenized"],
+            no_below=LDA_CONFIG.no_below,
+            no_above=LDA_CONFIG.no_above,
+        )
+        return gensim_dictionary, Sparse2Corpus(bag_of_words, documents_columns=False)
+
+    def task_train_topic_model(
+        data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+        gensim_dictionary: Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]],
+        corpus: Annotated[Path, DATACATALOGS["topic_model"]["corpus"]],
+    ) -> Annotated[
+        tuple[LdaModel, pd.DataFrame, pd.Series],
+        (
+            DATACATALOGS["topic_model"]["lda"],
+            DATACATALOGS["topic_model"]["training_report"],
+            DATACATALOGS["topic_model"]["trained_dp_numbers"],
+        ),
+    ]:
+        """Abstract text analysis via Latent Dirichlet Allocation (LDA) topic modelling.
+
+        Args:
+            data (pd.DataFrame): Data with abstracts.
+            gensim_dictionary(Dictionary): Dictionary of gensim containing tokens.
+            corpus (MmCorpus): Streamed corpus of tokenized words.
+
+        Returns
+        -------
+            tuple[LdaModel, pd.DataFrame, pd.Series]: Trained LDA model, the wall
+            time and perplexity per pass and the discussion papers the model has been
+            trained on.
+        """
+        topic_model, training_report = _train_lda(
+            corpus=corpus, gensim_dictionary=gensim_dictionary, config=LDA_CONFIG
+        )
+        return topic_model, training_report, data["dp_number"]
+
+    def task_snapshot_topic_model(
+        topic_model: Annotated[Path, DATACATALOGS["topic_model"]["lda"]],
+        trained_dp_numbers: Annotated[
+            Path, DATACATALOGS["topic_model"]["trained_dp_numbers"]
+        ],
+    ) -> Annotated[
+        tuple[LdaModel, pd.Series],
+        (
+            DATACATALOGS["topic_model"]["lda_previous"],
+            DATACATALOGS["topic_model"]["trained_dp_numbers_previous"],
+        ),
+    ]:
+        """Keep the LDA model trained from scratch as the base of warm starts.
 
+        Warm starts read the snapshot instead of the model they produce, so the
+        model and the discussion papers it has been trained on stay dependencies
+        that pytask tracks.
 
-def task_train_topic_model(
-    gensim_dictionary: Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]],
-    corpus: Annotated[Path, DATACATALOGS["topic_model"]["corpus"]],
-) -> Annotated[Path, DATACATALOGS["topic_model"]["lda"]]:
-    """Abstract text analysis via Latent Dirichlet Allocation (LDA) topic modelling.
+        Args:
+            topic_model (LdaModel): Trained LDA model.
+            trained_dp_numbers (pd.Series): The discussion papers the model has been
+                trained on.
+
+        Returns
+        -------
+            tuple[LdaModel, pd.Series]: Copies of the LDA model and the discussion
+            papers.
+        """
+        return topic_model, trained_dp_numbers
+
+
+def task_topic_model_size_report(
+    topic_model: Annotated[Path, PathNode.from_path(_artifact_path("lda"))],
+    gensim_dictionary: Annotated[
+        Path, PathNode.from_path(_artifact_path("dictionary"))
+    ],
+    corpus: Annotated[Path, PathNode.from_path(_artifact_path("corpus"))],
+) -> Annotated[Path, DATACATALOGS["topic_model"]["size_report"]]:
+    """Report the size on disk of the topic model artifacts.
+
+    The artifacts are dependencies by path, so they are not loaded.
 
     Args:
-        gensim_dictionary(Dictionary): Dictionary of gensim containing tokens.
-        corpus (list): Corpus of tokenized words.
+        topic_model (Path): Main file of the trained LDA model.
+        gensim_dictionary (Path): Main file of the gensim dictionary.
+        corpus (Path): Matrix Market file of the corpus.
 
     Returns
     -------
-        LdaModel: Trained LDA model.
+        pd.DataFrame: Number of files and size in bytes of each artifact.
+    """
+    return _get_size_report(
+        {"lda": topic_model, "dictionary": gensim_dictionary, "corpus": corpus}
+    )
+
+
+def _get_size_report(paths: dict[str, Path]) -> pd.DataFrame:
+    report = []
+    for name, path in paths.items():
+        files = [
+            path.with_name(f"{path.name}{suffix}")
+            for suffix in ARTIFACT_FILE_SUFFIXES[name]
+        ]
+        files = [file for file in files if file.is_file()]
+        report.append(
+            {
+                "artifact": name,
+                "files": len(files),
+                "bytes": sum(file.stat().st_size for file in files),
+            }
+        )
+    return pd.DataFrame(report)
+
+
+def _extend_gensim_dictionary(
+    gensim_dictionary: Dictionary, text_data: pd.Series, no_below: int
+) -> Dictionary:
+    """Add the tokens of new documents without changing the ids of known tokens.
+
+    New tokens are appended after the known ones and kept only if they occur in at
+    least ``no_below`` of the new documents. Document frequencies of known tokens are
+    updated, but known tokens are never dropped, so the existing LDA model remains
+    valid for the extended dictionary.
     """
-    return _train_lda(
-        corpus=corpus,
-        gensim_dictionary=gensim_dictionary,
-        num_topics=NUM_TOPICS,
-        chunksize=5000,
-        passes=20,
-        iterations=400,
-    )  # PLR0913
+    extended = copy.deepcopy(gensim_dictionary)
+    num_known_tokens = len(extended)
+    extended.add_documents(text_data, prune_at=None)
+    rare_new_ids = [
+        token_id
+        for token_id in range(num_known_tokens, len(extended))
+        if extended.dfs[token_id] < no_below
+    ]
+    extended.filter_tokens(bad_ids=rare_new_ids)
+    return extended
+
+
+def _fail_if_vocabulary_drifted(
+    gensim_dictionary: Dictionary,
+    text_data: pd.Series,
+    is_new: np.ndarray,
+    drift_threshold: float,
+) -> None:
+    drift = _vocabulary_drift(gensim_dictionary, text_data, is_new)
+    if drift > drift_threshold:
+        msg = (
+            "The out-of-vocabulary share of the new documents exceeds that of the "
+            f"snapshot by {drift:.3f} > drift_threshold={drift_threshold}. Retrain "
+            "the topic model from scratch by running with LdaConfig.warm_start "
+            "switched off, which also replaces the snapshot."
+        )
+        raise ValueError(msg)
 
 
-def _get_gensim_dictionary(text_data: pd.Series) -> Dictionary:
-    gensim_dictionary = Dictionary(text_data, prune_at=None)
-    gensim_dictionary.filter_extremes(no_below=20, no_above=0.90)
-    return gensim_dictionary
+def _vocabulary_drift(
+    gensim_dictionary: Dictionary, text_data: pd.Series, is_new: np.ndarray
+) -> float:
+    """Increase of the out-of-vocabulary token share of new over trained documents."""
+    in_vocabulary = np.array(
+        [sum(count for _, count in gensim_dictionary.doc2bow(doc)) for doc in text_data]
+    )
+    tokens = text_data.str.len().to_numpy()
+    if not is_new.any():
+        return 0.0
+    new_share = 1 - in_vocabulary[is_new].sum() / tokens[is_new].sum()
+    trained_share = 1 - in_vocabulary[~is_new].sum() / tokens[~is_new].sum()
+    return new_share - trained_share
+
+
+class _PassReport(Metric):
+    """Wall time and perplexity of a training pass, evaluated after each pass."""
+
+    def __init__(self, corpus: list[list[tuple[int, float]]]) -> None:
+        self.corpus = corpus
+        self.corpus_words = sum(count for doc in corpus for _, count in doc)
+        self.logger = "shell"
+        self.title = "pass_report"
+        self.started = time.perf_counter()
+
+    def get_value(self, model: LdaModel, **_: object) -> tuple[float, float]:
+        wall_time = time.perf_counter() - self.started
+        perplexity = np.exp2(-model.bound(self.corpus) / self.corpus_words)
+        self.started = time.perf_counter()
+        return wall_time, perplexity
 
 
 def _train_lda(
-    corpus: list,
+    corpus: Iterable[list[tuple[int, float]]],
+    gensim_dictionary: Dictionary,
+    config: LdaConfig,
+) -> tuple[LdaModel, pd.DataFrame]:
+    pass_report = _PassReport(list(itertools.islice(corpus, config.perplexity_docs)))
+    kwargs = {
+        "id2word": gensim_dictionary,
+        "chunksize": config.chunksize,
+        "alpha": config.alpha,
+        "eta": config.eta,
+        "iterations": config.iterations,
+        "num_topics": config.num_topics,
+        "eval_every": None,
+        "random_state": config.random_state,
+    }
+    if config.backend == "single":
+        topic_model = LdaModel(
+            corpus=corpus, passes=config.passes, callbacks=[pass_report], **kwargs
+        )
+        passes = topic_model.metrics[str(pass_report)]
+        pass_numbers = range(len(passes))
+        topic_model.callbacks = None
+    elif config.backend == "multicore":
+        # LdaMulticore does not support callbacks, so only the wall time of all
+        # passes and the perplexity after the last pass are reported.
+        workers = config.workers or max(1, (os.cpu_count() or 2) - 1)
+        topic_model = LdaMulticore(
+            corpus=corpus, workers=workers, passes=config.passes, **kwargs
+        )
+        passes = [pass_report.get_value(model=topic_model)]
+        pass_numbers = [config.passes - 1]
+    else:
+        msg = f"Expected backend to be 'single' or 'multicore', got {config.backend}."
+        raise ValueError(msg)
+
+    training_report = pd.DataFrame(
+        passes,
+        columns=["wall_time", "perplexity"],
+        index=pd.Index(pass_numbers, name="pass"),
+    )
+    return topic_model, training_report.reset_index()
+
+
+def _update_lda(
+    topic_model: LdaModel,
+    corpus: Iterable[list[tuple[int, float]]],
+    new_corpus: list[list[tuple[int, float]]],
     gensim_dictionary: Dictionary,
-    num_topics: int,
-    chunksize: int,
-    passes: int,
-    iterations: int,
-) -> LdaModel:
-    return LdaModel(
-        corpus=corpus,
-        id2word=gensim_dictionary,
-        chunksize=chunksize,
-        alpha="symmetric",
-        eta="symmetric",
-        iterations=iterations,
-        num_topics=num_topics,
-        passes=passes,
-        eval_every=None,
-        random_state=1234,
+    config: LdaConfig,
+) -> tuple[LdaModel, pd.DataFrame]:
+    if not new_corpus:
+        return topic_model, pd.DataFrame(columns=["pass", "wall_time", "perplexity"])
+    _extend_lda_vocabulary(topic_model, gensim_dictionary)
+    # Evaluated on the same documents as in training to keep the reports comparable.
+    pass_report = _PassReport(list(itertools.islice(corpus, config.perplexity_docs)))
+    topic_model.passes = config.passes
+    topic_model.update(new_corpus)
+    training_report = pd.DataFrame(
+        [pass_report.get_value(model=topic_model)], columns=["wall_time", "perplexity"]
     )
+    training_report.index.name = "pass"
+    return topic_model, training_report.reset_index()
+
+
+def _extend_lda_vocabulary(
+    topic_model: LdaModel, gensim_dictionary: Dictionary
+) -> None:
+    """Grow the topic-term statistics of the model to an extended dictionary.
+
+    The new terms start without any topic mass and receive the mean prior of the
+    known terms, so they are only picked up through the subsequent online update.
+    """
+    num_new_terms = len(gensim_dictionary) - topic_model.num_terms
+    if num_new_terms > 0:
+        state = topic_model.state
+        eta = np.concatenate([state.eta, np.full(num_new_terms, state.eta.mean())])
+        state.eta = topic_model.eta = eta.astype(state.eta.dtype)
+        state.sstats = np.hstack(
+            [state.sstats, np.zeros((topic_model.num_topics, num_new_terms))]
+        ).astype(state.sstats.dtype)
+        topic_model.num_terms = len(gensim_dictionary)
+        topic_model.sync_state()
+    topic_model.id2word = gensim_dictionary
@@ -0,0 +1,35 @@
+"""Task for sweeping the hyperparameters of the LDA topic model."""
+
+from pathlib import Path
+from typing import Annotated
+
+import pytask
+
+from econ_spec_jel.config import DATACATALOGS, LDA_CONFIG, LDA_SWEEP_CONFIG
+from econ_spec_jel.text_model.sweep_helper import run_sweep
+
+
+@pytask.mark.skip()
+def task_sweep_topic_model(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+    gensim_dictionary: Annotated[Path, DATACATALOGS["topic_model"]["dictionary"]],
+    corpus: Annotated[Path, DATACATALOGS["topic_model"]["corpus"]],
+) -> Annotated[Path, DATACATALOGS["topic_model"]["sweep"]]:
+    """Compare LDA models over a grid of topic counts and priors.
+
+    Args:
+        data (pd.DataFrame): Data with abstracts.
+        gensim_dictionary (Dictionary): Gensim dictionary.
+        corpus (MmCorpus): Streamed corpus of tokenized words.
+
+    Returns
+    -------
+        pd.DataFrame: Coherence and held-out perplexity per model.
+    """
+    return run_sweep(
+        corpus=list(corpus),
+        texts=data["abstract_tokenized"],
+        gensim_dictionary=gensim_dictionary,
+        lda_config=LDA_CONFIG,
+        sweep_config=LDA_SWEEP_CONFIG,
+    )
@@ -1,72 +1,123 @@
 """Tasks for extracting topics from the trained LDA model."""
 
-from econ_spec_jel.config import DATACATALOGS, NUM_TOPICS
+from econ_spec_jel.config import (
+    DATACATALOGS,
+    DOCUMENTS_TOPICS_MIN_PROBABILITY,
+    DOCUMENTS_TOPICS_TOP_K,
+    LDA_CONFIG,
+)
+from econ_spec_jel.text_model.topics_helper import sparsify_documents_topics
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Annotated
+from gensim.corpora import MmCorpus
 from gensim.models import LdaModel
+from gensim.utils import grouper
+
+TOPIC_TERMS = 20
 
 
 def task_extract_topics(
-    topic_model_data_catalog: Annotated[Path, DATACATALOGS["topic_model"]],
+    topic_model: Annotated[Path, DATACATALOGS["topic_model"]["lda"]],
 ) -> Annotated[Path, DATACATALOGS["data"]["topics"]]:
-    """Extract topics from the trained LDA model.
+    """Extract the most probable terms of each topic from the trained LDA model.
 
     Args:
-        topic_model_data_catalog (Path): Path to the topic_model DataCatalog.
+        topic_model (LdaModel): Trained LDA model.
 
     Returns
     -------
-        (pd.DataFrame): Dataframe with the topics.
+        (pd.DataFrame): Dataframe with one row per topic and term rank.
     """
-    return _extract_topics(topic_model_data_catalog["lda"].load(), NUM_TOPICS)
+    return _extract_topics(topic_model, TOPIC_TERMS)
 
 
 def task_extract_documents_topics_distribution(
-    topic_model_data_catalog: Annotated[Path, DATACATALOGS["topic_model"]],
-    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+    topic_model: Annotated[Path, DATACATALOGS["topic_model"]["lda"]],
+    corpus: Annotated[Path, DATACATALOGS["topic_model"]["corpus"]],
 ) -> Annotated[Path, DATACATALOGS["data"]["documents_topics"]]:
     """Extract distribution of documents to topics.
 
     Args:
-        topic_model_data_catalog (Path): Path to the topic_model DataCatalog.
-        data (pd.DataFrame): Dataframe with the abstracts.
+        topic_model (LdaModel): Trained LDA model.
+        corpus (MmCorpus): Streamed corpus of tokenized words.
 
     Returns
     -------
-        (pd.DataFrame): Dataframe with the topics.
+        (np.ndarray): Documents x topics matrix of topic probabilities.
     """
-    topic_model = topic_model_data_catalog["lda"].load()
-    corpus = topic_model_data_catalog["corpus"].load()
-    return _extract_documents_topics_distribution(data, topic_model, corpus)
+    return _extract_documents_topics_distribution(
+        topic_model, corpus, LDA_CONFIG.chunksize
+    )
 
 
-def _extract_topics(topic_model: LdaModel, num_topics: int) -> pd.DataFrame:
-    detected_topics = {}
-    for topic_num in range(num_topics):
-        detected_topics[topic_num] = [
-            f"{t} ({100 * p:.10f}%)" for t, p in topic_model.show_topic(topic_num, 20)
-        ]
+def task_sparse_documents_topics(
+    documents_topics: Annotated[Path, DATACATALOGS["data"]["documents_topics"]],
+) -> Annotated[Path, DATACATALOGS["data"]["documents_topics_sparse"]]:
+    """Keep only the most probable topics of each document in a sparse matrix.
 
-    detected_topics_df = pd.DataFrame(detected_topics).T
-    detected_topics_df.columns = [f"token_{e}" for e in range(20)]
-    return detected_topics_df
+    Args:
+        documents_topics (np.ndarray): Documents x topics matrix of probabilities.
 
+    Returns
+    -------
+        (sparse.csr_array): Sparse documents x topics matrix.
+    """
+    return sparsify_documents_topics(
+        documents_topics,
+        top_k=DOCUMENTS_TOPICS_TOP_K,
+        min_probability=DOCUMENTS_TOPICS_MIN_PROBABILITY,
+    )
 
-def _extract_documents_topics_distribution(
-    data: pd.DataFrame, topic_model: LdaModel, corpus: list
-) -> pd.DataFrame:
-    documents_topics = []
-    for idx, dp in enumerate(data.to_dict(orient="records")):
-        dp_topics = {
-            "dp_number": dp["dp_number"],
-            "title": dp["title"],
-            "publication_year_month": dp["publication_year_month"],
-            "jel_codes": dp["jel_codes"],
+
+def task_documents_metadata(
+    data: Annotated[Path, DATACATALOGS["data"]["analysis"]],
+) -> Annotated[Path, DATACATALOGS["data"]["documents_metadata"]]:
+    """Extract the metadata of the documents, aligned with the documents_topics rows.
+
+    Args:
+        data (pd.DataFrame): Dataframe with the abstracts.
+
+    Returns
+    -------
+        (pd.DataFrame): Dataframe with the metadata of the documents.
+    """
+    return data[
+        ["dp_number", "title", "publication_year_month", "jel_codes"]
+    ].reset_index(drop=True)
+
+
+def _extract_topics(topic_model: LdaModel, topn: int) -> pd.DataFrame:
+    topic_terms = topic_model.get_topics()
+    top_term_ids = np.argpartition(-topic_terms, topn - 1, axis=1)[:, :topn]
+    top_probabilities = np.take_along_axis(topic_terms, top_term_ids, axis=1)
+    order = np.argsort(-top_probabilities, axis=1, kind="stable")
+    top_term_ids = np.take_along_axis(top_term_ids, order, axis=1)
+    top_probabilities = np.take_along_axis(top_probabilities, order, axis=1)
+
+    num_topics = topic_terms.shape[0]
+    term_ids = top_term_ids.ravel()
+    return pd.DataFrame(
+        {
+            "topic_number": np.repeat(np.arange(num_topics), topn),
+            "rank": np.tile(np.arange(topn), num_topics),
+            "term_id": term_ids,
+            "term": [topic_model.id2word[term_id] for term_id in term_ids],
+            "probability": top_probabilities.ravel(),
         }
-        topics_tmp = topic_model.get_document_topics(corpus[idx], minimum_probability=0)
-        topics_tmp = {"top_" + f"{(e[0]):03d}": e[1] for e in topics_tmp}
-        dp_topics.update(topics_tmp)
-        documents_topics.append(dp_topics)
+    )
 
-    return pd.DataFrame(documents_topics).fillna(0)
+
+def _extract_documents_topics_distribution(
+    topic_model: LdaModel, corpus: MmCorpus, chunksize: int
+) -> np.ndarray:
+    documents_topics = np.empty((len(corpus), topic_model.num_topics), np.float32)
+    start = 0
+    for chunk in grouper(corpus, chunksize):
+        gamma, _ = topic_model.inference(chunk)
+        documents_topics[start : start + len(chunk)] = gamma / gamma.sum(
+            axis=1, keepdims=True
+        )
+        start += len(chunk)
+    return documents_topics
@@ -0,0 +1,118 @@
+"""Helper functions for sparse and long views of the document-topic matrix."""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def sparsify_documents_topics(
+    documents_topics: np.ndarray,
+    top_k: int | None = None,
+    min_probability: float | None = None,
+    chunksize: int = 10_000,
+) -> sparse.csr_array:
+    """Keep only the most probable topics of each document.
+
+    A topic is kept if it is among the ``top_k`` most probable topics of the document
+    and its probability is at least ``min_probability``. Ties at the ``top_k``-th
+    place are broken arbitrarily. The kept probabilities are not renormalized.
+
+    Args:
+        documents_topics (np.ndarray): Documents x topics matrix of probabilities.
+        top_k (int | None): Maximum number of topics per document. Defaults to all.
+        min_probability (float | None): Minimum probability of a kept topic.
+            Defaults to keeping all nonzero probabilities.
+        chunksize (int): Number of documents processed at once.
+
+    Returns
+    -------
+        sparse.csr_array: Sparse documents x topics matrix with sorted indices.
+    """
+    n_documents, n_topics = documents_topics.shape
+    top_k = n_topics if top_k is None else min(top_k, n_topics)
+    threshold = 0 if min_probability is None else min_probability
+
+    rows, columns, values = [], [], []
+    for start in range(0, n_documents, chunksize):
+        chunk = np.asarray(documents_topics[start : start + chunksize])
+        chunk_columns = np.argpartition(-chunk, top_k - 1, axis=1)[:, :top_k]
+        chunk_values = np.take_along_axis(chunk, chunk_columns, axis=1)
+        keep = (chunk_values > 0) & (chunk_values >= threshold)
+        rows.append(np.nonzero(keep)[0] + start)
+        columns.append(chunk_columns[keep])
+        values.append(chunk_values[keep])
+
+    out = sparse.csr_array(
+        (
+            np.concatenate(values) if values else np.empty(0, documents_topics.dtype),
+            (
+                np.concatenate(rows) if rows else np.empty(0, np.int64),
+                np.concatenate(columns) if columns else np.empty(0, np.int64),
+            ),
+        ),
+        shape=(n_documents, n_topics),
+    )
+    out.sort_indices()
+    return out
+
+
+def densify_documents_topics(
+    documents_topics: sparse.csr_array,
+    rows: np.ndarray | None = None,
+    *,
+    renormalize: bool = False,
+) -> np.ndarray:
+    """Convert (a subset of the documents of) a sparse document-topic matrix to dense.
+
+    Args:
+        documents_topics (sparse.csr_array): Sparse documents x topics matrix.
+        rows (np.ndarray | None): Documents to densify. Defaults to all.
+        renormalize (bool): Whether to rescale the kept probabilities of each
+            document to sum to one.
+
+    Returns
+    -------
+        np.ndarray: Dense documents x topics matrix.
+    """
+    subset = documents_topics if rows is None else documents_topics[rows]
+    dense = subset.toarray()
+    if renormalize:
+        totals = dense.sum(axis=1, keepdims=True)
+        np.divide(dense, totals, out=dense, where=totals > 0)
+    return dense
+
+
+def documents_topics_long(
+    documents_topics: np.ndarray,
+    documents_metadata: pd.DataFrame,
+    topic_numbers: np.ndarray | None = None,
+    columns: tuple[str, ...] = ("dp_number", "title", "publication_year_month"),
+) -> pd.DataFrame:
+    """Build a long view with one row per document and topic for selected topics.
+
+    Only the selected topics are read from the (memory-mapped) matrix, so the long
+    format is materialized just for the rows that are needed.
+
+    Args:
+        documents_topics (np.ndarray): Documents x topics matrix of probabilities.
+        documents_metadata (pd.DataFrame): Metadata aligned with the matrix rows.
+        topic_numbers (np.ndarray | None): Topics to include. Defaults to all.
+        columns (tuple[str, ...]): Metadata columns repeated for each topic.
+
+    Returns
+    -------
+        pd.DataFrame: Metadata columns, topic_number and topic_present, ordered by
+        topic and document.
+    """
+    n_documents, n_topics = documents_topics.shape
+    topic_numbers = (
+        np.arange(n_topics) if topic_numbers is None else np.asarray(topic_numbers)
+    )
+    out = documents_metadata.loc[
+        np.tile(np.arange(n_documents), len(topic_numbers)), list(columns)
+    ].reset_index(drop=True)
+    out["topic_number"] = np.repeat(topic_numbers, n_documents)
+    out["topic_present"] = np.asarray(documents_topics[:, topic_numbers]).ravel(
+        order="F"
+    )
+    return out
@@ -0,0 +1,114 @@
+"""Helper functions for building the vocabulary and bag-of-words corpus."""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+from gensim.corpora import Dictionary
+from scipy import sparse
+
+
+def build_vocabulary(
+    texts: pd.Series,
+    no_below: int = 5,
+    no_above: float = 0.5,
+    keep_n: int | None = 100_000,
+) -> tuple[Dictionary, sparse.csr_array]:
+    """Build the filtered vocabulary and bag-of-words matrix of tokenized documents.
+
+    The result equals building a :class:`gensim.corpora.Dictionary` from ``texts``,
+    calling ``filter_extremes(no_below, no_above, keep_n)`` and converting each
+    document with ``doc2bow``, including the token ids. Instead of updating Python
+    dicts token by token, all tokens are factorized at once and the document and
+    collection frequencies are counted on the resulting integer arrays.
+
+    Args:
+        texts (pd.Series): List of tokens per document.
+        no_below (int): Minimum number of documents a token occurs in.
+        no_above (float): Maximum share of documents a token occurs in.
+        keep_n (int | None): Maximum number of tokens, keeping the ones with the
+            highest document frequency.
+
+    Returns
+    -------
+        tuple[Dictionary, sparse.csr_array]: Gensim dictionary and documents x
+        tokens matrix of token counts.
+    """
+    documents, flat_tokens = _flatten_tokens(texts)
+    codes, tokens = pd.factorize(flat_tokens, sort=True)
+    tokens = np.asarray(tokens, dtype=object)
+    counts = sparse.csr_array(
+        (np.ones(len(codes), dtype=np.int64), (documents, codes)),
+        shape=(len(texts), len(tokens)),
+    )
+    counts.sum_duplicates()
+    dfs = np.bincount(counts.indices, minlength=len(tokens))
+    cfs = np.bincount(codes, minlength=len(tokens))
+
+    # Gensim numbers tokens by the document they first occur in, and alphabetically
+    # within that document.
+    _, first_position = np.unique(codes, return_index=True)
+    gensim_order = np.lexsort((np.arange(len(tokens)), documents[first_position]))
+
+    no_above_abs = int(no_above * len(texts))
+    is_good = (dfs >= no_below) & (dfs <= no_above_abs)
+    kept = gensim_order[is_good[gensim_order]]
+    kept = kept[np.argsort(-dfs[kept], kind="stable")][:keep_n]
+    gensim_rank = np.empty(len(tokens), dtype=np.int64)
+    gensim_rank[gensim_order] = np.arange(len(tokens))
+    kept = kept[np.argsort(gensim_rank[kept])]
+
+    gensim_dictionary = Dictionary()
+    gensim_dictionary.token2id = dict(
+        zip(tokens[kept].tolist(), range(len(kept)), strict=True)
+    )
+    gensim_dictionary.dfs = dict(enumerate(dfs[kept].tolist()))
+    gensim_dictionary.cfs = dict(enumerate(cfs[kept].tolist()))
+    gensim_dictionary.num_docs = len(texts)
+    gensim_dictionary.num_pos = len(codes)
+    gensim_dictionary.num_nnz = counts.nnz
+
+    bag_of_words = sparse.csr_array(counts[:, kept])
+    bag_of_words.sort_indices()
+    return gensim_dictionary, bag_of_words
+
+
+def bag_of_words_matrix(
+    texts: pd.Series, gensim_dictionary: Dictionary
+) -> sparse.csr_array:
+    """Count the tokens of a given vocabulary in tokenized documents.
+
+    Args:
+        texts (pd.Series): List of tokens per document.
+        gensim_dictionary (Dictionary): Gensim dictionary with consecutive ids.
+
+    Returns
+    -------
+        sparse.csr_array: Documents x tokens matrix of token counts, where each row
+        equals ``doc2bow`` of the document.
+    """
+    documents, flat_tokens = _flatten_tokens(texts)
+    vocabulary = pd.Index(
+        sorted(gensim_dictionary.token2id, key=gensim_dictionary.token2id.get)
+    )
+    ids = vocabulary.get_indexer(flat_tokens)
+    is_known = ids >= 0
+    bag_of_words = sparse.csr_array(
+        (
+            np.ones(is_known.sum(), dtype=np.int64),
+            (documents[is_known], ids[is_known]),
+        ),
+        shape=(len(texts), len(vocabulary)),
+    )
+    bag_of_words.sum_duplicates()
+    return bag_of_words
+
+
+def _flatten_tokens(texts: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Flatten the documents to the document number and the token of each position."""
+    lengths = texts.str.len().to_numpy()
+    documents = np.repeat(np.arange(len(texts)), lengths)
+    tokens = np.fromiter(
+        itertools.chain.from_iterable(texts), dtype=object, count=lengths.sum()
+    )
+    return documents, tokens
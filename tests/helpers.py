@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# Rare words that sort before the generated ones, including a non-ASCII word.
+EXTRA_WORDS = ["Zeta", "alpha", "ärger", "b"]
+
+
+def zipf_documents(n_documents, words, max_length, seed=0):
+    """Draw documents of random length from words with Zipf frequencies."""
+    rng = np.random.default_rng(seed)
+    words = np.array(words, dtype=object)
+    probabilities = 1 / np.arange(1, len(words) + 1)
+    probabilities /= probabilities.sum()
+    return pd.Series(
+        [
+            list(rng.choice(words, rng.integers(0, max_length), p=probabilities))
+            for _ in range(n_documents)
+        ]
+    )
+
+
+def zipf_texts(n_documents, n_words, max_length=60, seed=0):
+    """Draw tokenized texts from ``n_words`` generated words and a few rare ones."""
+    words = [f"w{i}" for i in range(n_words)] + EXTRA_WORDS
+    return zipf_documents(n_documents, words, max_length, seed)
+
+
+def csr_rows(matrix):
+    """Convert a CSR matrix to ``doc2bow``-like lists of (column, value) per row."""
+    return [
+        list(
+            zip(
+                matrix.indices[start:end].tolist(),
+                matrix.data[start:end].tolist(),
+                strict=True,
+            )
+        )
+        for start, end in zip(matrix.indptr[:-1], matrix.indptr[1:], strict=True)
+    ]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+from econ_spec_jel.analysis.association_helper import topic_association
+
+N_DOCUMENTS, N_CATEGORIES, N_TOPICS = 30, 5, 4
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    documents_topics = rng.dirichlet(np.ones(N_TOPICS), N_DOCUMENTS)
+    incidence = (rng.random((N_DOCUMENTS, N_CATEGORIES)) < 0.3).astype(np.int64)
+    categories = pd.Index([f"C{j}" for j in range(N_CATEGORIES)])
+    groups = pd.Series(rng.choice([2000, 2005, 2010], N_DOCUMENTS))
+    return documents_topics, incidence, categories, groups
+
+
+def _brute_force(documents_topics, incidence, categories, groups):
+    rows = []
+    for group in sorted(set(groups)):
+        in_group = [i for i in range(N_DOCUMENTS) if groups[i] == group]
+        for j, category in enumerate(categories):
+            papers = [i for i in in_group if incidence[i, j]]
+            if not papers:
+                continue
+            for topic in range(N_TOPICS):
+                mass = sum(documents_topics[i, topic] for i in papers)
+                share = mass / len(papers)
+                group_share = np.mean([documents_topics[i, topic] for i in in_group])
+                rows.append(
+                    {
+                        "period": group,
+                        "jel_code": category,
+                        "topic_number": topic,
+                        "papers": len(papers),
+                        "mass": mass,
+                        "share": share,
+                        "lift": share / group_share,
+                        "pmi": np.log(share / group_share),
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def _assert_equal_to_brute_force(result, expected):
+    assert result["jel_code"].astype(str).tolist() == expected["jel_code"].tolist()
+    for name in ["topic_number", "papers"]:
+        assert result[name].tolist() == expected[name].tolist()
+    for name in ["mass", "share", "lift", "pmi"]:
+        np.testing.assert_allclose(result[name], expected[name], rtol=1e-5)
+
+
+def test_topic_association_equals_brute_force(data):
+    documents_topics, incidence, categories, _ = data
+
+    result = topic_association(
+        documents_topics, sparse.csr_array(incidence), categories
+    )
+
+    expected = _brute_force(documents_topics, incidence, categories, [0] * N_DOCUMENTS)
+    assert "period" not in result
+    _assert_equal_to_brute_force(result, expected)
+
+
+def test_topic_association_per_period_equals_brute_force(data):
+    documents_topics, incidence, categories, groups = data
+    # The groups keep the index of the documents, which need not be a range.
+    groups.index = groups.index + 100
+
+    result = topic_association(
+        documents_topics, sparse.csr_array(incidence), categories, groups
+    )
+
+    expected = _brute_force(documents_topics, incidence, categories, groups.to_numpy())
+    assert result["period"].tolist() == expected["period"].tolist()
+    _assert_equal_to_brute_force(result, expected)
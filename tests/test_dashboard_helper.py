@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from plotly.offline import get_plotlyjs
+
+from econ_spec_jel.analysis.dashboard_helper import build_dashboard, downsample_figure
+
+MAX_POINTS = 10
+
+
+@pytest.fixture
+def figures():
+    x = np.arange(100)
+    return {
+        "Lines": go.Figure(go.Scatter(x=x, y=x**2)),
+        "Bars": go.Figure(go.Bar(x=[f"c{i}" for i in x], y=x[::-1])),
+    }
+
+
+def test_downsampled_traces_respect_the_point_cap(figures):
+    line = downsample_figure(figures["Lines"], MAX_POINTS).data[0]
+    bar = downsample_figure(figures["Bars"], MAX_POINTS).data[0]
+
+    assert len(line.x) == len(line.y) == MAX_POINTS
+    assert line.x[0] == 0
+    assert line.x[-1] == 99
+    np.testing.assert_array_equal(line.y, np.asarray(line.x) ** 2)
+    assert bar.x.tolist() == [f"c{i}" for i in range(MAX_POINTS)]
+    assert bar.y.tolist() == list(range(99, 99 - MAX_POINTS, -1))
+    # The input figure is left untouched.
+    assert len(figures["Lines"].data[0].x) == 100
+
+
+def test_short_traces_are_not_downsampled(figures):
+    line = downsample_figure(figures["Lines"], 100).data[0]
+    assert len(line.x) == 100
+
+
+def test_dashboard_embeds_plotlyjs_once(figures):
+    page = build_dashboard(figures, "Title", MAX_POINTS, max_bytes=10**6)
+
+    assert page.count(get_plotlyjs()) == 1
+    assert "<script src=" not in page
+    assert page.count("<section>") == 2
+    assert "<h2>Lines</h2>" in page
+    assert "<h2>Bars</h2>" in page
+
+
+def test_dashboard_above_max_bytes_raises(figures):
+    page = build_dashboard(figures, "Title", MAX_POINTS, max_bytes=10**6)
+    figures_bytes = len(page.encode()) - len(get_plotlyjs().encode())
+
+    with pytest.raises(ValueError, match="at most 1,000 bytes"):
+        build_dashboard(figures, "Title", MAX_POINTS, max_bytes=1_000)
+    assert figures_bytes > 1_000
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import io
+import os
+import pickle
+
+import pyarrow.parquet as pq
+import pytest
+from pypdf import PdfWriter
+
+from econ_spec_jel.config import FulltextConfig
+from econ_spec_jel.data_management.fulltext_helper import extract_fulltexts
+
+CONFIG = FulltextConfig(processes=1, memory_limit_mb=None, batch_size=2)
+
+
+def _write_pdf(path, n_pages):
+    writer = PdfWriter()
+    for _ in range(n_pages):
+        writer.add_blank_page(width=72, height=72)
+    content = io.BytesIO()
+    writer.write(content)
+    # The downloaded files hold the pickled PDF content.
+    path.write_bytes(pickle.dumps(content.getvalue()))
+    return path
+
+
+class _KillWorker:
+    # Unpickling the file ends the worker process, like a crash of the parser.
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def _counts(report):
+    return dict(zip(report["status"], report["files"], strict=True))
+
+
+def _stored(store):
+    table = pq.read_table(store, columns=["dp_number", "status", "n_pages"])
+    return table.to_pylist()
+
+
+@pytest.fixture
+def files(tmp_path):
+    return {
+        dp_number: _write_pdf(tmp_path / f"{dp_number}.pdf", dp_number)
+        for dp_number in [1, 2, 3]
+    }
+
+
+def test_extract_fulltexts(tmp_path, files):
+    store = tmp_path / "fulltext.parquet"
+
+    report = extract_fulltexts(files, store, CONFIG)
+
+    assert _counts(report) == {"unchanged": 0, "ok": 3}
+    assert _stored(store) == [
+        {"dp_number": dp_number, "status": "ok", "n_pages": dp_number}
+        for dp_number in [1, 2, 3]
+    ]
+
+
+def test_second_run_parses_nothing(tmp_path, files):
+    store = tmp_path / "fulltext.parquet"
+    extract_fulltexts(files, store, CONFIG)
+    expected = pq.read_table(store)
+
+    report = extract_fulltexts(files, store, CONFIG)
+
+    assert _counts(report) == {"unchanged": 3}
+    assert pq.read_table(store).equals(expected)
+
+
+def test_changed_file_is_parsed_again(tmp_path, files):
+    store = tmp_path / "fulltext.parquet"
+    extract_fulltexts(files, store, CONFIG)
+    _write_pdf(files[2], 5)
+
+    report = extract_fulltexts(files, store, CONFIG)
+
+    assert _counts(report) == {"unchanged": 2, "ok": 1}
+    assert [row["n_pages"] for row in _stored(store)] == [1, 5, 3]
+
+
+def test_row_of_removed_file_is_dropped(tmp_path, files):
+    store = tmp_path / "fulltext.parquet"
+    extract_fulltexts(files, store, CONFIG)
+    del files[1]
+
+    report = extract_fulltexts(files, store, CONFIG)
+
+    assert _counts(report) == {"unchanged": 2}
+    assert [row["dp_number"] for row in _stored(store)] == [2, 3]
+
+
+def test_failed_file_is_retried(tmp_path, files):
+    store = tmp_path / "fulltext.parquet"
+    files[2].write_bytes(pickle.dumps(b"not a pdf"))
+
+    first = extract_fulltexts(files, store, CONFIG)
+    second = extract_fulltexts(files, store, CONFIG)
+    _write_pdf(files[2], 2)
+    third = extract_fulltexts(files, store, CONFIG)
+
+    assert _counts(first) == {"unchanged": 0, "ok": 2, "error": 1}
+    assert _counts(second) == {"unchanged": 2, "error": 1}
+    assert _counts(third) == {"unchanged": 2, "ok": 1}
+    assert [row["status"] for row in _stored(store)] == ["ok", "ok", "ok"]
+
+
+def test_crashed_worker_does_not_abort_the_run(tmp_path, files):
+    store = tmp_path / "fulltext.parquet"
+    files[2].write_bytes(pickle.dumps(_KillWorker()))
+
+    first = extract_fulltexts(files, store, CONFIG)
+    statuses = [row["status"] for row in _stored(store)]
+    _write_pdf(files[2], 2)
+    second = extract_fulltexts(files, store, CONFIG)
+
+    # The pool breaks, so the files it did not finish are stored as crashed.
+    assert statuses[0] == "ok"
+    assert statuses[1:] == ["crashed", "crashed"]
+    assert _counts(first) == {"unchanged": 0, "ok": 1, "crashed": 2}
+    assert _counts(second) == {"unchanged": 1, "ok": 2}
+    assert [row["status"] for row in _stored(store)] == ["ok", "ok", "ok"]
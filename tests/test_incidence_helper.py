@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from econ_spec_jel.analysis.incidence_helper import (
+    aggregate_columns,
+    build_incidence_matrix,
+    row_group_indicator,
+)
+
+
+def _random_counts(n_rows, n_columns, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.poisson(0.3, size=(n_rows, n_columns)).astype(np.float64)
+
+
+def test_build_incidence_matrix():
+    sr = pd.Series([["B", "A", "B"], [], ["C"]], index=[10, 20, 30])
+
+    incidence, categories = build_incidence_matrix(sr)
+
+    assert categories.tolist() == ["A", "B", "C"]
+    np.testing.assert_array_equal(
+        incidence.toarray(), [[1, 2, 0], [0, 0, 0], [0, 0, 1]]
+    )
+
+
+def test_build_incidence_matrix_with_categories_and_binary():
+    sr = pd.Series([["B", "A", "B"], ["D"], ["C"]])
+
+    incidence, categories = build_incidence_matrix(
+        sr, pd.Index(["B", "C"]), binary=True
+    )
+
+    assert categories.tolist() == ["B", "C"]
+    np.testing.assert_array_equal(incidence.toarray(), [[1, 0], [0, 0], [0, 1]])
+
+
+def test_aggregate_columns_equals_groupby():
+    counts = _random_counts(50, 12)
+    labels = pd.Index([f"{chr(65 + i % 3)}{i}" for i in range(12)])
+    mapper = labels.str[:1]
+
+    result, groups = aggregate_columns(sparse.csr_array(counts), labels, mapper)
+
+    expected = pd.DataFrame(counts, columns=labels).T.groupby(mapper.to_numpy()).sum()
+    assert groups.tolist() == expected.index.tolist()
+    np.testing.assert_array_equal(result.toarray(), expected.T.to_numpy())
+
+
+def test_row_group_indicator_equals_groupby():
+    counts = _random_counts(40, 5, seed=1)
+    groups = pd.Series(np.random.default_rng(2).integers(2000, 2005, 40))
+
+    indicator, labels = row_group_indicator(groups)
+
+    expected = pd.DataFrame(counts).groupby(groups.to_numpy()).sum()
+    assert labels.tolist() == expected.index.tolist()
+    np.testing.assert_array_equal(indicator @ counts, expected.to_numpy())
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+import pytest
+from gensim.corpora import Dictionary
+from gensim.matutils import sparse2full
+from gensim.models import LdaModel
+
+from econ_spec_jel.data_management import text_helper
+from econ_spec_jel.data_management.text_helper import stem_tokens
+from econ_spec_jel.text_model.inference import TopicInference
+
+THEMES = [
+    ["labor", "wage", "worker", "employment", "union", "hours"],
+    ["price", "market", "inflation", "monetary", "bank", "interest"],
+    ["school", "education", "student", "teacher", "parents", "skills"],
+]
+
+
+def _split_abstract(sr):
+    return pd.Series([doc.lower().split() for doc in sr])
+
+
+def _abstracts(n_documents, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        " ".join(rng.choice(THEMES[rng.integers(len(THEMES))], 12))
+        for _ in range(n_documents)
+    ]
+
+
+@pytest.fixture
+def topic_inference(monkeypatch):
+    # The tests do not depend on the nltk tokenizer data.
+    monkeypatch.setattr(text_helper, "tokenize_texts", _split_abstract)
+    texts = stem_tokens(_split_abstract(pd.Series(_abstracts(200))))
+    gensim_dictionary = Dictionary(texts)
+    topic_model = LdaModel(
+        corpus=[gensim_dictionary.doc2bow(doc) for doc in texts],
+        id2word=gensim_dictionary,
+        num_topics=len(THEMES),
+        passes=5,
+        random_state=0,
+    )
+    # Infer to convergence so that the result does not depend on the random start.
+    topic_model.iterations = 1_000
+    topic_model.gamma_threshold = 1e-12
+    return TopicInference(topic_model, gensim_dictionary, cache_size=3)
+
+
+def test_topic_distributions_equal_get_document_topics(topic_inference):
+    abstracts = [*_abstracts(5, seed=1), "unknown words only", ""]
+    topic_model = topic_inference.topic_model
+    gensim_dictionary = topic_inference.gensim_dictionary
+    expected = np.stack(
+        [
+            sparse2full(
+                topic_model.get_document_topics(
+                    gensim_dictionary.doc2bow(doc), minimum_probability=0
+                ),
+                topic_model.num_topics,
+            )
+            for doc in stem_tokens(_split_abstract(pd.Series(abstracts)))
+        ]
+    )
+
+    result = TopicInference(topic_model, gensim_dictionary).topic_distributions(
+        abstracts
+    )
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+def test_topic_distributions_of_no_abstracts(topic_inference):
+    assert topic_inference.topic_distributions([]).shape == (0, len(THEMES))
+
+
+def test_top_topics_are_ordered_by_probability(topic_inference):
+    abstracts = _abstracts(4, seed=2)
+    distributions = topic_inference.topic_distributions(abstracts)
+    top_topics = topic_inference.top_topics(abstracts, top_k=2)
+    for distribution, topics in zip(distributions, top_topics, strict=True):
+        assert [topic for topic, _ in topics] == np.argsort(-distribution)[:2].tolist()
+        assert [probability for _, probability in topics] == pytest.approx(
+            np.sort(distribution)[::-1][:2].tolist()
+        )
+
+
+def test_cache_infers_each_abstract_once(topic_inference, monkeypatch):
+    inferred = []
+    infer = topic_inference._infer
+
+    def _counting_infer(abstracts):
+        inferred.extend(abstracts)
+        return infer(abstracts)
+
+    monkeypatch.setattr(topic_inference, "_infer", _counting_infer)
+    first = topic_inference.topic_distributions(["a wage", "a price", "a wage"])
+    second = topic_inference.topic_distributions(["a price", "a wage"])
+
+    assert inferred == ["a wage", "a price"]
+    np.testing.assert_array_equal(first[[1, 0]], second)
+    np.testing.assert_array_equal(first[0], first[2])
+
+
+def test_cache_is_keyed_by_sha256(topic_inference):
+    topic_inference.topic_distributions(["school wage"])
+    assert list(topic_inference._cache) == [hashlib.sha256(b"school wage").hexdigest()]
+
+
+def test_cache_evicts_least_recently_used(topic_inference):
+    topic_inference.topic_distributions(["wage", "price", "school"])
+    topic_inference.topic_distributions(["wage"])
+    topic_inference.topic_distributions(["bank"])
+
+    assert list(topic_inference._cache) == [
+        hashlib.sha256(abstract.encode()).hexdigest()
+        for abstract in ["school", "wage", "bank"]
+    ]
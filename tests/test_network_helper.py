@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+from econ_spec_jel.analysis.incidence_helper import build_incidence_matrix
+from econ_spec_jel.analysis.network_helper import (
+    WINDOW_STATISTICS_DTYPES,
+    cooccurrence_matrix,
+    network_communities,
+    network_statistics,
+    rolling_window_statistics,
+    window_adjacencies,
+)
+
+
+@pytest.fixture
+def papers():
+    # Two pairs of nodes that mostly publish together, linked by one paper, in
+    # 2000 and a single paper of a node without co-authors in 2001.
+    nodes = [["A", "B"]] * 5 + [["C", "D"]] * 5 + [["B", "C"], ["E"]]
+    windows = [2000] * 11 + [2001]
+    incidence, labels = build_incidence_matrix(pd.Series(nodes), binary=True)
+    return incidence, labels, pd.Series(windows)
+
+
+def test_cooccurrence_matrix():
+    incidence = sparse.csr_array(
+        np.array([[1, 1, 0, 0], [1, 1, 1, 0], [0, 0, 1, 1]], dtype=np.int64)
+    )
+
+    adjacency = cooccurrence_matrix(incidence)
+
+    assert adjacency.dtype == np.int64
+    np.testing.assert_array_equal(
+        adjacency.toarray(),
+        [[0, 2, 1, 0], [2, 0, 1, 0], [1, 1, 0, 1], [0, 0, 1, 0]],
+    )
+    assert adjacency.nnz == 8
+
+
+def test_cooccurrence_matrix_of_integer_incidence_does_not_warn():
+    incidence = sparse.csr_array(np.eye(3, dtype=np.int64))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert cooccurrence_matrix(incidence).nnz == 0
+
+
+def test_window_adjacencies(papers):
+    incidence, labels, windows = papers
+
+    result = list(window_adjacencies(incidence, windows))
+
+    assert [window for window, _, _ in result] == [2000, 2001]
+    _, active_nodes, adjacency = result[0]
+    assert labels[active_nodes].tolist() == ["A", "B", "C", "D"]
+    np.testing.assert_array_equal(
+        adjacency.toarray(),
+        [[0, 5, 0, 0], [5, 0, 1, 0], [0, 1, 0, 5], [0, 0, 5, 0]],
+    )
+    _, active_nodes, adjacency = result[1]
+    assert labels[active_nodes].tolist() == ["E"]
+    assert adjacency.nnz == 0
+
+
+def test_network_communities(papers):
+    communities, modularity = network_communities(*papers)
+
+    first = communities[communities["window"] == 2000]
+    membership = dict(zip(first["node"], first["community"], strict=True))
+    assert membership["A"] == membership["B"]
+    assert membership["C"] == membership["D"]
+    assert membership["A"] != membership["C"]
+    assert communities.loc[communities["window"] == 2001, "node"].tolist() == ["E"]
+
+    # Both communities hold 5 of the 11 edge weights and half of the degrees.
+    assert modularity["nodes"].tolist() == [4, 1]
+    assert modularity["edges"].tolist() == [3, 0]
+    assert modularity["total_weight"].tolist() == [11, 0]
+    assert modularity["communities"].tolist() == [2, 1]
+    assert modularity.loc[0, "modularity"] == pytest.approx(10 / 11 - 1 / 2)
+    assert np.isnan(modularity.loc[1, "modularity"])
+
+
+def _random_papers(n_papers, n_nodes, n_months, seed=0):
+    rng = np.random.default_rng(seed)
+    nodes = [f"n{i}" for i in range(n_nodes)]
+    papers = pd.Series(
+        [list(rng.choice(nodes, rng.integers(1, 4))) for _ in range(n_papers)]
+    )
+    months = pd.Series(
+        np.datetime64("2000-01", "M") + rng.integers(0, n_months, n_papers)
+    ).astype("M8[ns]")
+    incidence, _ = build_incidence_matrix(papers, binary=True)
+    return incidence, months
+
+
+@pytest.mark.parametrize(
+    ("window_months", "step_months"), [(1, 1), (6, 1), (12, 5), (24, 24)]
+)
+def test_rolling_window_statistics_equal_rebuilt_windows(window_months, step_months):
+    incidence, months = _random_papers(300, 40, 24)
+
+    result = rolling_window_statistics(
+        incidence, months, window_months=window_months, step_months=step_months
+    )
+
+    month_number = months.to_numpy().astype("M8[M]").astype(np.int64)
+    first_month = month_number.min()
+    expected_starts = range(
+        first_month, month_number.max() - window_months + 2, step_months
+    )
+    assert [np.datetime64(start, "M") for start in expected_starts] == result[
+        "window_start"
+    ].to_numpy().astype("M8[M]").tolist()
+    for window in result.itertuples(index=False):
+        start = np.datetime64(window.window_start, "M").astype(np.int64)
+        end = np.datetime64(window.window_end, "M").astype(np.int64)
+        assert end - start == window_months - 1
+        rows = np.flatnonzero((month_number >= start) & (month_number <= end))
+        window_incidence = incidence[rows]
+        expected = network_statistics(
+            cooccurrence_matrix(window_incidence), window_incidence.sum(axis=0)
+        )
+        assert window.papers == len(rows)
+        for name, value in expected.items():
+            assert getattr(window, name) == pytest.approx(value, nan_ok=True)
+
+
+def test_rolling_window_statistics_of_data_shorter_than_a_window():
+    incidence, months = _random_papers(5, 4, 1)
+
+    result = rolling_window_statistics(incidence, months, window_months=36)
+
+    assert result.empty
+    assert result.columns.tolist() == list(WINDOW_STATISTICS_DTYPES)
+    assert result.dtypes.astype(str).tolist() == [
+        str(np.dtype(dtype)) for dtype in WINDOW_STATISTICS_DTYPES.values()
+    ]
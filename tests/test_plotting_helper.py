@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ_spec_jel.analysis.plotting_helper import (
+    _get_most_common_codes,
+    _get_yearly_most_common_codes,
+)
+from tests.helpers import zipf_documents
+
+
+def _data(jel_codes, years):
+    return pd.DataFrame(
+        {
+            "jel_codes": jel_codes,
+            "publication_year_month": pd.to_datetime(
+                [f"{year}-06-01" for year in years]
+            ),
+        }
+    )
+
+
+def _random_data(n_papers, n_codes, seed=0):
+    codes = [f"{chr(65 + i % 20)}{i:02d}" for i in range(n_codes)]
+    years = np.random.default_rng(seed).integers(1995, 2025, n_papers)
+    return _data(zipf_documents(n_papers, codes, max_length=5, seed=seed), years)
+
+
+def _most_common_codes_reference(jel_codes, number_of_codes):
+    # The baseline counted with value_counts and sorted with an unstable sort, so
+    # ties are broken alphabetically here instead.
+    counts = Counter(code for codes in jel_codes for code in codes)
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [code for code, _ in ranked[:number_of_codes]]
+
+
+def _yearly_most_common_codes_loop(data, number_of_codes):
+    years = data["publication_year_month"].dt.year
+    mapping = {
+        year: _most_common_codes_reference(
+            data.loc[years == year, "jel_codes"], number_of_codes
+        )
+        for year in sorted(years.unique())
+    }
+    columns = sorted({code for codes in mapping.values() for code in codes})
+    return pd.DataFrame(
+        [[int(code in codes) for code in columns] for codes in mapping.values()],
+        index=pd.Index(mapping.keys()).astype(int),
+        columns=columns,
+    )
+
+
+@pytest.mark.parametrize(
+    ("n_papers", "n_codes", "number_of_codes"),
+    [(2_000, 60, 3), (2_000, 60, 10), (100, 200, 5), (50, 3, 10)],
+)
+def test_yearly_most_common_codes_equal_loop(n_papers, n_codes, number_of_codes):
+    data = _random_data(n_papers, n_codes)
+    expected = _yearly_most_common_codes_loop(data, number_of_codes)
+    result = _get_yearly_most_common_codes(data, number_of_codes)
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+def test_yearly_most_common_codes_break_ties_alphabetically():
+    data = _data(
+        [["C1", "B2"], ["A3", "C1"], ["B2", "A3"], ["D4", "D4"], ["E5"]],
+        [2000, 2000, 2000, 2001, 2001],
+    )
+    result = _get_yearly_most_common_codes(data, 2)
+    assert result.columns.tolist() == ["A3", "B2", "D4", "E5"]
+    assert result.loc[2000].tolist() == [1, 1, 0, 0]
+    assert result.loc[2001].tolist() == [0, 0, 1, 1]
+
+
+def test_yearly_most_common_codes_count_repeated_codes():
+    data = _data([["B2", "B2"], ["A1"]], [2000, 2000])
+    result = _get_yearly_most_common_codes(data, 1)
+    assert result.columns.tolist() == ["B2"]
+
+
+def test_most_common_codes_break_ties_alphabetically():
+    data = _data([["C1", "B2"], ["A3", "C1"], ["B2", "A3", "D4"]], [2000] * 3)
+    assert _get_most_common_codes(data, 2) == ["A3", "B2"]
+    assert _get_most_common_codes(data, 10) == ["A3", "B2", "C1", "D4"]
+
+
+@pytest.mark.parametrize("number_of_codes", [1, 5, 50])
+def test_most_common_codes_equal_reference(number_of_codes):
+    data = _random_data(500, 30)
+    assert _get_most_common_codes(data, number_of_codes) == (
+        _most_common_codes_reference(data["jel_codes"], number_of_codes)
+    )
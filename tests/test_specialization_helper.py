@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ_spec_jel.analysis.incidence_helper import build_incidence_matrix
+from econ_spec_jel.analysis.specialization_helper import (
+    author_specialization,
+    paper_specialization,
+    period_specialization,
+    specialization_measures,
+)
+
+
+def _measures(jel_codes):
+    counts, codes = build_incidence_matrix(pd.Series(jel_codes))
+    return specialization_measures(counts, codes)
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "dp_number": [1, 2, 3],
+            "publication_year_month": pd.to_datetime(
+                ["2000-01-01", "2000-06-01", "2001-03-01"]
+            ),
+            "jel_codes": [["J31"], ["D12"], ["J31", "J32"]],
+            "jel_codes_count": [1, 1, 2],
+            "author_names": [["Ann"], ["Ann", "Bob"], ["Bob"]],
+        }
+    )
+
+
+def test_single_code_paper_is_fully_specialized():
+    measures = _measures([["J31"]]).iloc[0]
+    for level in ["category", "subcategory", "code"]:
+        assert measures[f"hhi_{level}"] == 1
+        assert measures[f"entropy_{level}"] == 0
+    assert np.isnan(measures["jel_tree_distance"])
+
+
+def test_sibling_codes_differ_on_the_code_level_only():
+    measures = _measures([["J31", "J32"]]).iloc[0]
+    assert measures["hhi_category"] == 1
+    assert measures["hhi_subcategory"] == 1
+    assert measures["hhi_code"] == pytest.approx(0.5)
+    assert measures["entropy_subcategory"] == 0
+    assert measures["entropy_code"] == pytest.approx(np.log(2))
+    assert measures["jel_tree_distance"] == pytest.approx(1)
+
+
+@pytest.mark.parametrize(
+    ("jel_codes", "distance"),
+    [
+        (["J31", "J31"], 0),
+        (["J31", "J41"], 2),
+        (["J31", "D12"], 3),
+        # Pairs: (J31, J32) 1, (J31, D12) 3, (J32, D12) 3.
+        (["J31", "J32", "D12"], 7 / 3),
+    ],
+)
+def test_jel_tree_distance(jel_codes, distance):
+    assert _measures([jel_codes]).loc[0, "jel_tree_distance"] == pytest.approx(distance)
+
+
+def test_paper_without_codes_has_no_measures():
+    measures = _measures([["J31"], []]).iloc[1]
+    assert measures.isna().all()
+
+
+def test_paper_specialization(data):
+    result = paper_specialization(data)
+    assert result["dp_number"].tolist() == [1, 2, 3]
+    assert result["hhi_code"].tolist() == pytest.approx([1, 1, 0.5])
+
+
+def test_author_with_papers_in_different_fields(data):
+    result = author_specialization(data).set_index("author_name")
+
+    ann = result.loc["Ann"]
+    assert ann["dp_count"] == 2
+    assert ann["career_start"] == pd.Timestamp("2000-01-01")
+    assert ann["career_end"] == pd.Timestamp("2000-06-01")
+    assert ann["hhi_category"] == pytest.approx(0.5)
+    assert ann["entropy_category"] == pytest.approx(np.log(2))
+    assert ann["jel_tree_distance"] == pytest.approx(3)
+
+    # Bob pools D12, J31 and J32: shares 1/3 and 2/3 on the category level.
+    bob = result.loc["Bob"]
+    assert bob["hhi_category"] == pytest.approx(5 / 9)
+    assert bob["jel_tree_distance"] == pytest.approx(7 / 3)
+
+
+def test_period_specialization(data):
+    result = period_specialization(data, paper_specialization(data))
+    assert result["year"].tolist() == [2000, 2001]
+    assert result["dp_count"].tolist() == [2, 1]
+    assert result["mean_hhi_code"].tolist() == pytest.approx([1, 0.5])
+    assert result["hhi_category"].tolist() == pytest.approx([0.5, 1])
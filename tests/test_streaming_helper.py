@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from econ_spec_jel.text_model.streaming_helper import (
+    TOKENS_SCHEMA,
+    build_streamed_vocabulary,
+    iter_token_batches,
+    stream_corpus,
+)
+from econ_spec_jel.text_model.vocabulary_helper import build_vocabulary
+from tests.helpers import csr_rows, zipf_texts
+
+
+def _write_tokens(path, texts):
+    pq.write_table(
+        pa.table(
+            {"dp_number": np.arange(len(texts)), "tokens": texts.tolist()},
+            schema=TOKENS_SCHEMA,
+        ),
+        path,
+        row_group_size=7,
+    )
+    return path
+
+
+@pytest.mark.parametrize("batch_size", [1, 10, 1_000])
+def test_iter_token_batches_round_trip(tmp_path, batch_size):
+    texts = zipf_texts(50, 100, max_length=200)
+    tokens = _write_tokens(tmp_path / "tokens.parquet", texts)
+
+    batches = list(iter_token_batches(tokens, batch_size))
+
+    assert max(len(batch) for batch in batches) <= batch_size
+    assert pd.concat(batches, ignore_index=True).tolist() == texts.tolist()
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "no_below", "no_above", "keep_n"),
+    [(1, 2, 0.5, 100_000), (16, 5, 0.3, 50), (1_000, 1, 0.9, None)],
+)
+def test_streamed_vocabulary_and_corpus_equal_in_memory(
+    tmp_path, batch_size, no_below, no_above, keep_n
+):
+    texts = zipf_texts(200, 500, max_length=200)
+    tokens = _write_tokens(tmp_path / "tokens.parquet", texts)
+    expected_dictionary, expected_bag_of_words = build_vocabulary(
+        texts, no_below=no_below, no_above=no_above, keep_n=keep_n
+    )
+
+    gensim_dictionary = build_streamed_vocabulary(
+        tokens,
+        batch_size=batch_size,
+        no_below=no_below,
+        no_above=no_above,
+        keep_n=keep_n,
+    )
+    corpus = stream_corpus(tokens, gensim_dictionary, batch_size=batch_size)
+
+    assert gensim_dictionary.token2id == expected_dictionary.token2id
+    assert gensim_dictionary.dfs == expected_dictionary.dfs
+    assert gensim_dictionary.num_docs == expected_dictionary.num_docs
+    assert [
+        [(token_id, int(count)) for token_id, count in doc] for doc in corpus
+    ] == csr_rows(expected_bag_of_words)
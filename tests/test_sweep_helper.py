@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+import pandas as pd
+from gensim.corpora import Dictionary
+
+from econ_spec_jel.config import LdaConfig, LdaSweepConfig
+from econ_spec_jel.text_model.sweep_helper import (
+    holdout_mask,
+    run_sweep,
+    sweep_grid,
+)
+
+THEMES = [
+    ["labor", "wage", "worker", "employment", "union", "hours"],
+    ["price", "market", "inflation", "monetary", "bank", "interest"],
+]
+
+
+def test_sweep_grid():
+    sweep_config = LdaSweepConfig(
+        num_topics=(2, 5), alpha=("symmetric",), eta=("a", "b")
+    )
+    grid = sweep_grid(sweep_config)
+    assert grid == [
+        {"num_topics": 2, "alpha": "symmetric", "eta": "a"},
+        {"num_topics": 2, "alpha": "symmetric", "eta": "b"},
+        {"num_topics": 5, "alpha": "symmetric", "eta": "a"},
+        {"num_topics": 5, "alpha": "symmetric", "eta": "b"},
+    ]
+    assert [dataclasses.replace(LdaConfig(), **params).eta for params in grid] == [
+        "a",
+        "b",
+        "a",
+        "b",
+    ]
+
+
+def test_holdout_mask():
+    is_holdout = holdout_mask(100, 0.1, seed=0)
+    assert is_holdout.sum() == 10
+    np.testing.assert_array_equal(is_holdout, holdout_mask(100, 0.1, seed=0))
+
+
+def test_run_sweep_smoke():
+    rng = np.random.default_rng(0)
+    texts = pd.Series(
+        [list(rng.choice(THEMES[i % len(THEMES)], 10)) for i in range(60)]
+    )
+    gensim_dictionary = Dictionary(texts)
+    corpus = [gensim_dictionary.doc2bow(doc) for doc in texts]
+    lda_config = LdaConfig(chunksize=20, passes=2, iterations=20)
+    sweep_config = LdaSweepConfig(
+        num_topics=(2,),
+        alpha=("symmetric", "asymmetric"),
+        eta=("symmetric",),
+        coherence_topn=3,
+        processes=1,
+    )
+
+    result = run_sweep(corpus, texts, gensim_dictionary, lda_config, sweep_config)
+
+    assert result.columns.tolist() == [
+        "num_topics",
+        "alpha",
+        "eta",
+        "c_v",
+        "u_mass",
+        "heldout_perplexity",
+        "wall_time",
+    ]
+    assert result["alpha"].tolist() == ["symmetric", "asymmetric"]
+    assert np.isfinite(result[["c_v", "u_mass", "heldout_perplexity"]]).all(axis=None)
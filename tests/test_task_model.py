@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pytest
+from gensim.corpora import Dictionary
+from gensim.models import LdaModel
+
+from econ_spec_jel.config import LdaConfig
+from econ_spec_jel.nodes import GensimNode
+from econ_spec_jel.text_model.task_model import (
+    _extend_gensim_dictionary,
+    _fail_if_vocabulary_drifted,
+    _train_lda,
+    _update_lda,
+)
+
+THEMES = [
+    ["labor", "wage", "worker", "employment", "union", "hours"],
+    ["price", "market", "inflation", "monetary", "bank", "interest"],
+    ["school", "education", "student", "teacher", "parents", "skills"],
+]
+
+CONFIG = LdaConfig(
+    num_topics=len(THEMES),
+    no_below=1,
+    chunksize=50,
+    passes=3,
+    iterations=50,
+    workers=1,
+    perplexity_docs=100,
+)
+
+
+def _texts(n_documents, themes=THEMES, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        list(rng.choice(themes[rng.integers(len(themes))], 12))
+        for _ in range(n_documents)
+    ]
+
+
+@pytest.fixture
+def corpus_and_dictionary():
+    texts = _texts(200)
+    gensim_dictionary = Dictionary(texts)
+    return [gensim_dictionary.doc2bow(doc) for doc in texts], gensim_dictionary
+
+
+def test_single_backend_reports_every_pass(corpus_and_dictionary):
+    corpus, gensim_dictionary = corpus_and_dictionary
+
+    topic_model, report = _train_lda(corpus, gensim_dictionary, CONFIG)
+
+    assert topic_model.num_topics == len(THEMES)
+    assert report["pass"].tolist() == [0, 1, 2]
+    assert (report["wall_time"] > 0).all()
+    assert np.isfinite(report["perplexity"]).all()
+
+
+def test_multicore_backend_reports_the_last_pass(corpus_and_dictionary):
+    corpus, gensim_dictionary = corpus_and_dictionary
+    config = dataclasses.replace(CONFIG, backend="multicore")
+
+    topic_model, report = _train_lda(corpus, gensim_dictionary, config)
+
+    assert topic_model.passes == config.passes
+    assert report["pass"].tolist() == [config.passes - 1]
+    assert report.columns.tolist() == ["pass", "wall_time", "perplexity"]
+    assert np.isfinite(report["perplexity"]).all()
+
+
+def test_unknown_backend_raises(corpus_and_dictionary):
+    corpus, gensim_dictionary = corpus_and_dictionary
+    config = dataclasses.replace(CONFIG, backend="gpu")
+    with pytest.raises(ValueError, match="backend"):
+        _train_lda(corpus, gensim_dictionary, config)
+
+
+@pytest.fixture
+def snapshot(tmp_path, corpus_and_dictionary):
+    corpus, gensim_dictionary = corpus_and_dictionary
+    topic_model, _ = _train_lda(corpus, gensim_dictionary, CONFIG)
+    node = GensimNode(
+        name="lda_previous",
+        path=tmp_path / "lda_previous",
+        loader=LdaModel,
+        mmap=None,
+    )
+    node.save(topic_model)
+    return node.load()
+
+
+def test_warm_start_updates_the_snapshot(snapshot):
+    trained = pd.Series(_texts(200))
+    new = pd.Series(_texts(40, [[*theme, "tariff"] for theme in THEMES], seed=1))
+    text_data = pd.concat([trained, new], ignore_index=True)
+    is_new = np.arange(len(text_data)) >= len(trained)
+    known_tokens = dict(snapshot.id2word.token2id)
+
+    _fail_if_vocabulary_drifted(snapshot.id2word, text_data, is_new, 0.5)
+    gensim_dictionary = _extend_gensim_dictionary(
+        snapshot.id2word, text_data[is_new], CONFIG.no_below
+    )
+    corpus = [gensim_dictionary.doc2bow(doc) for doc in text_data]
+    topic_model, report = _update_lda(
+        topic_model=snapshot,
+        corpus=corpus,
+        new_corpus=[corpus[i] for i in np.flatnonzero(is_new)],
+        gensim_dictionary=gensim_dictionary,
+        config=CONFIG,
+    )
+
+    assert gensim_dictionary.token2id == known_tokens | {"tariff": len(known_tokens)}
+    assert topic_model.id2word is gensim_dictionary
+    assert topic_model.num_terms == len(gensim_dictionary)
+    assert topic_model.get_topics().shape == (len(THEMES), len(gensim_dictionary))
+    # The new term starts without topic mass and picks it up in the update.
+    assert topic_model.state.sstats[:, -1].sum() > 0
+    assert report["pass"].tolist() == [0]
+    assert np.isfinite(report["perplexity"]).all()
+
+
+def test_warm_start_without_new_documents_keeps_the_snapshot(snapshot):
+    topics = snapshot.get_topics()
+    corpus = [snapshot.id2word.doc2bow(doc) for doc in _texts(10)]
+
+    topic_model, report = _update_lda(snapshot, corpus, [], snapshot.id2word, CONFIG)
+
+    assert topic_model is snapshot
+    np.testing.assert_array_equal(topic_model.get_topics(), topics)
+    assert report.empty
+
+
+def test_warm_start_fails_after_vocabulary_drift(snapshot):
+    trained = pd.Series(_texts(200))
+    new = pd.Series(_texts(40, [["climate", "carbon", "emission"]], seed=1))
+    text_data = pd.concat([trained, new], ignore_index=True)
+    is_new = np.arange(len(text_data)) >= len(trained)
+
+    with pytest.raises(ValueError, match="warm_start"):
+        _fail_if_vocabulary_drifted(snapshot.id2word, text_data, is_new, 0.05)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ_spec_jel.analysis.trend_helper import date_ordinals, ols_slopes
+from econ_spec_jel.data_management.task_topics_preparation import (
+    _get_slopes,
+    _get_topic_prevalence,
+    _get_topic_trend_estimates,
+)
+
+
+@pytest.fixture
+def documents():
+    rng = np.random.default_rng(0)
+    months = rng.integers(0, 60, size=500)
+    documents_metadata = pd.DataFrame(
+        {
+            "publication_year_month": pd.Series(
+                np.datetime64("2000-01", "M") + months
+            ).astype("M8[ns]")
+        }
+    )
+    documents_topics = rng.dirichlet(np.full(8, 0.5), size=500).astype(np.float32)
+    documents_topics[:, 0] += months / 1_000
+    return documents_topics, documents_metadata
+
+
+def _trend_estimates(documents_topics, documents_metadata):
+    return _get_topic_trend_estimates(
+        _get_topic_prevalence(documents_topics, documents_metadata)
+    )
+
+
+def test_weighted_slopes_equal_document_level_ols(documents):
+    documents_topics, documents_metadata = documents
+
+    slopes = _get_slopes(
+        _trend_estimates(documents_topics, documents_metadata), "weighted_slope"
+    )
+
+    expected = ols_slopes(
+        documents_topics, date_ordinals(documents_metadata["publication_year_month"])
+    )["slope"]
+    assert slopes["topic_number"].tolist() == np.argsort(-expected).tolist()
+    np.testing.assert_allclose(
+        slopes["slope"], expected.sort_values(ascending=False), rtol=1e-5
+    )
+
+
+def test_slopes_rank_by_theil_sen(documents):
+    estimates = _trend_estimates(*documents)
+
+    slopes = _get_slopes(estimates, "theil_sen_slope")
+
+    assert slopes.columns.tolist() == ["topic_number", "slope"]
+    assert slopes["topic_number"].iloc[0] == 0
+    assert slopes["slope"].is_monotonic_decreasing
+    assert sorted(slopes["slope"]) == sorted(estimates["theil_sen_slope"])
+
+
+def test_slopes_with_unknown_estimator_raise(documents):
+    with pytest.raises(ValueError, match="estimator"):
+        _get_slopes(_trend_estimates(*documents), "ols_slope")
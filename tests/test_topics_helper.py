@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from econ_spec_jel.text_model.topics_helper import (
+    densify_documents_topics,
+    sparsify_documents_topics,
+)
+
+
+@pytest.fixture
+def documents_topics():
+    rng = np.random.default_rng(0)
+    out = rng.dirichlet(np.full(12, 0.3), size=50).astype(np.float32)
+    out[3] = 0
+    return out
+
+
+def _sparsify_reference(documents_topics, top_k, min_probability):
+    expected = np.zeros_like(documents_topics)
+    for row, probabilities in enumerate(documents_topics):
+        for column in np.argsort(-probabilities, kind="stable")[:top_k]:
+            if probabilities[column] > 0 and probabilities[column] >= min_probability:
+                expected[row, column] = probabilities[column]
+    return expected
+
+
+@pytest.mark.parametrize(
+    ("top_k", "min_probability", "chunksize"),
+    [(3, None, 7), (5, 0.05, 10_000), (None, 0.1, 1), (100, None, 16)],
+)
+def test_sparsify_documents_topics_equals_argsort(
+    documents_topics, top_k, min_probability, chunksize
+):
+    result = sparsify_documents_topics(
+        documents_topics,
+        top_k=top_k,
+        min_probability=min_probability,
+        chunksize=chunksize,
+    )
+
+    expected = _sparsify_reference(
+        documents_topics,
+        documents_topics.shape[1] if top_k is None else top_k,
+        0 if min_probability is None else min_probability,
+    )
+    assert result.dtype == documents_topics.dtype
+    assert result.has_sorted_indices
+    np.testing.assert_array_equal(result.toarray(), expected)
+
+
+def test_densify_round_trip(documents_topics):
+    sparse_topics = sparsify_documents_topics(documents_topics)
+    np.testing.assert_array_equal(
+        densify_documents_topics(sparse_topics), documents_topics
+    )
+    np.testing.assert_array_equal(
+        densify_documents_topics(sparse_topics, rows=np.array([5, 1])),
+        documents_topics[[5, 1]],
+    )
+
+
+def test_densify_renormalizes_kept_topics(documents_topics):
+    sparse_topics = sparsify_documents_topics(documents_topics, top_k=2)
+
+    dense = densify_documents_topics(sparse_topics, renormalize=True)
+
+    totals = dense.sum(axis=1)
+    np.testing.assert_allclose(np.delete(totals, 3), 1, rtol=1e-6)
+    assert totals[3] == 0
+    assert ((dense > 0).sum(axis=1) <= 2).all()
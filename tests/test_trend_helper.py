@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+from scipy import stats
+
+from econ_spec_jel.analysis.trend_helper import (
+    date_ordinals,
+    monthly_prevalence,
+    ols_slopes,
+    theil_sen_slopes,
+    weighted_ols_slopes,
+)
+
+
+@pytest.fixture
+def dates():
+    rng = np.random.default_rng(0)
+    months = rng.integers(0, 300, size=400)
+    return pd.Series(pd.to_datetime("2000-01-01") + pd.to_timedelta(months * 30, "D"))
+
+
+def test_date_ordinals_equal_timestamp_toordinal(dates):
+    expected = dates.map(pd.Timestamp.toordinal).to_numpy()
+    np.testing.assert_array_equal(date_ordinals(dates), expected)
+
+
+def test_ols_slopes_equal_statsmodels(dates):
+    rng = np.random.default_rng(1)
+    x = date_ordinals(dates)
+    y = rng.dirichlet(np.full(30, 0.1), size=len(x)).astype(np.float32)
+    y[:, 0] += 1e-5 * (x - x.mean())
+
+    result = ols_slopes(y, x)
+
+    for topic in range(y.shape[1]):
+        fit = sm.OLS(y[:, topic].astype(np.float64), sm.add_constant(x)).fit()
+        assert result.loc[topic, "slope"] == pytest.approx(fit.params[1], rel=1e-6)
+        assert result.loc[topic, "std_error"] == pytest.approx(fit.bse[1], rel=1e-6)
+        assert result.loc[topic, "t_value"] == pytest.approx(fit.tvalues[1], rel=1e-6)
+        assert result.loc[topic, "p_value"] == pytest.approx(
+            fit.pvalues[1], rel=1e-6, abs=1e-300
+        )
+
+
+def test_ols_slopes_are_nan_without_degrees_of_freedom():
+    result = ols_slopes(np.ones((2, 3)), np.array([1, 2]))
+    assert result.isna().all().all()
+
+
+def test_theil_sen_slopes_equal_scipy(dates):
+    rng = np.random.default_rng(2)
+    x = np.unique(date_ordinals(dates))
+    y = rng.normal(size=(len(x), 7)) + 1e-3 * x[:, None] * np.arange(7)
+
+    result = theil_sen_slopes(y, x, chunksize=3)
+
+    expected = [stats.theilslopes(y[:, i], x).slope for i in range(y.shape[1])]
+    np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+
+def test_weighted_ols_slopes_on_monthly_means_equal_ols_on_documents(dates):
+    rng = np.random.default_rng(3)
+    year_months = dates.dt.to_period("M").dt.to_timestamp()
+    y = rng.dirichlet(np.full(5, 0.3), size=len(year_months))
+    x = date_ordinals(year_months)
+
+    months, papers, sums = monthly_prevalence(y, year_months)
+    result = weighted_ols_slopes(
+        sums / papers[:, None], date_ordinals(months.to_series()), papers
+    )
+
+    np.testing.assert_allclose(result, ols_slopes(y, x)["slope"], rtol=1e-8)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from gensim.corpora import Dictionary
+
+from econ_spec_jel.text_model.vocabulary_helper import (
+    bag_of_words_matrix,
+    build_vocabulary,
+)
+from tests.helpers import csr_rows, zipf_texts
+
+
+def _gensim_vocabulary(texts, no_below, no_above, keep_n):
+    gensim_dictionary = Dictionary(texts, prune_at=None)
+    gensim_dictionary.filter_extremes(
+        no_below=no_below, no_above=no_above, keep_n=keep_n
+    )
+    return gensim_dictionary, [gensim_dictionary.doc2bow(doc) for doc in texts]
+
+
+@pytest.mark.parametrize(
+    ("n_documents", "n_words", "no_below", "no_above", "keep_n"),
+    [
+        (500, 300, 2, 0.5, 100_000),
+        (500, 300, 1, 0.9, 50),
+        (3_000, 5_000, 5, 0.3, 700),
+        (10, 20, 0, 1.0, None),
+    ],
+)
+def test_build_vocabulary_equals_gensim(
+    n_documents, n_words, no_below, no_above, keep_n
+):
+    texts = zipf_texts(n_documents, n_words)
+    expected_dictionary, expected_corpus = _gensim_vocabulary(
+        texts, no_below, no_above, keep_n
+    )
+
+    gensim_dictionary, bag_of_words = build_vocabulary(
+        texts, no_below=no_below, no_above=no_above, keep_n=keep_n
+    )
+
+    assert list(gensim_dictionary.token2id.items()) == list(
+        expected_dictionary.token2id.items()
+    )
+    assert gensim_dictionary.dfs == expected_dictionary.dfs
+    assert gensim_dictionary.cfs == expected_dictionary.cfs
+    assert gensim_dictionary.num_docs == expected_dictionary.num_docs
+    assert gensim_dictionary.num_pos == expected_dictionary.num_pos
+    assert gensim_dictionary.num_nnz == expected_dictionary.num_nnz
+    assert csr_rows(bag_of_words) == expected_corpus
+
+
+def test_bag_of_words_matrix_equals_doc2bow():
+    texts = zipf_texts(500, 300)
+    gensim_dictionary, expected_corpus = _gensim_vocabulary(texts, 5, 0.5, 100)
+    bag_of_words = bag_of_words_matrix(texts, gensim_dictionary)
+    assert csr_rows(bag_of_words) == expected_corpus
+
+
+@pytest.mark.benchmark
+def test_build_vocabulary_is_faster_than_gensim():
+    texts = zipf_texts(10_000, 10_000)
+
+    start = time.perf_counter()
+    _gensim_vocabulary(texts, 20, 0.9, 100_000)
+    gensim_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    build_vocabulary(texts, no_below=20, no_above=0.9)
+    vectorized_time = time.perf_counter() - start
+
+    assert vectorized_time < gensim_time